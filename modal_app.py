@@ -1,7 +1,9 @@
 import modal
 
+from src.modal_image import api_image
+
 app = modal.App("restaurant-intelligence")
 
-@app.function()
+@app.function(image=api_image)
 def hello():
     return "Modal is working!"
\ No newline at end of file
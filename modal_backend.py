@@ -14,6 +14,61 @@
 # INS-03   | Better name matching for summaries (strip, lower, title) | Lines ~380-410
 # INS-04   | Increased summary items (15→20 food, 10→15 drinks, 15→20 aspects) | Lines ~350-360
 # INS-05   | Append related_reviews during merge (not overwrite) | Lines ~300-320
+# PERF-01  | Content-hash analysis cache; first batch held on a head match | full_analysis_parallel(), StreamingBatchDispatcher, get_cached_head()
+# PERF-02  | Dispatch extraction batches while still scraping | StreamingBatchDispatcher, full_analysis_parallel()
+# PERF-03  | Multi-URL scraping fanned out with .map()       | scrape_restaurant_batch(), /scrape_batch
+# PERF-04  | Vectorized trend_data build (no iterrows)       | full_analysis_parallel()
+# PERF-05  | Downcast review DataFrame (float32 + category)  | shrink_review_dataframe(), full_analysis_parallel()
+# PERF-06  | Warm Chromium reused across scrapes (@app.cls)  | Scraper (replaces scrape_restaurant())
+# PERF-07  | Matplotlib font cache baked into image         | image
+# PERF-08  | Image moved to src/modal_image.py (uv_pip_install) | image import
+# PERF-09  | Single fused pass for trend_data + review texts | full_analysis_parallel()
+# PERF-10  | Precompiled platform-detection regex           | PLATFORM_RE, detect_platform() (src/review_signals.py)
+# PERF-11  | Spawned analysis jobs + /status, /events (SSE)  | report_progress(), /analyze/async, /status, /events
+# PERF-12  | In-flight dedup of identical /analyze requests  | fastapi_app() /analyze
+# PERF-13  | No DataFrame on the analysis path (records)     | full_analysis_parallel() (drops PERF-05 helper)
+# PERF-14  | Analyzer @app.cls: warm browsers + setup per container | Analyzer, BrowserPool, /analyze
+# PERF-15  | Import only the detected platform's scraper     | load_scraper(), scrape_platform()
+# PERF-16  | Precompiled keyword regexes for sentiment       | calculate_sentiment()
+# PERF-17  | Async endpoints await Modal calls via .aio      | /scrape_batch
+# PERF-18  | Whole-word keyword sets for sentiment (no substring hits) | calculate_sentiment()
+# PERF-19  | Response-size logging only with MODAL_DEBUG=1   | DEBUG, full_analysis_parallel()
+# PERF-20  | (url, max_reviews) cache with TTL, checked before scraping | get_recent_analysis(), full_analysis_parallel()
+# PERF-21  | Multi-URL analysis fanned out with .map()       | /analyze_batch
+# PERF-22  | Browser-free api_image for Claude workers + API | process_batch_*, generate_*, scrape_restaurant_batch, fastapi_app
+# PERF-23  | ORJSONResponse as FastAPI default response class | fastapi_app()
+# PERF-24  | Columnar trend_data (date/rating/sentiment lists) | build_trend_data()
+# PERF-25  | Cached regex restaurant-name parsing (full %xx decoding) | restaurant_name_from_url()
+# PERF-26  | Static prompts as cached system blocks (prompt caching) | *_SYSTEM_PROMPT(S), process_batch_*, generate_*
+# PERF-27  | Batch processors: one concurrent container per key | process_batch_odd(), process_batch_even()
+# PERF-28  | One-pass JSON extraction from Claude responses  | parse_json_object()
+# PERF-29  | Single merge helper with running weighted sums   | merge_batch_items()
+# PERF-30  | Near-duplicate dedup shared across batches      | StreamingBatchDispatcher._dispatch()
+# PERF-31  | orjson for SSE event payloads                    | fastapi_app() /events
+# PERF-32  | Per-item summary cache (name + sentiment bucket) | get_cached_summaries(), full_analysis_parallel()
+# PERF-33  | related_reviews deduped by review_index on merge | merge_batch_items()
+# PERF-34  | Item names normalized once in batch processors  | normalize_item_name(), merge_batch_items()
+# PERF-35  | max_tokens constants + truncation/usage logging | log_usage(), *_MAX_TOKENS
+# PERF-36  | Compact "i|text" review lines in extraction     | format_reviews_for_prompt(), EXTRACTION_SYSTEM_PROMPT
+# PERF-37  | One extract_batch() body for both key workers   | extract_batch(), process_batch_odd/even()
+# PERF-38  | Insights context built once, sent as a string   | build_insights_context(), generate_insights()
+# PERF-39  | Anthropic client cached per key per container   | anthropic_client()
+# PERF-40  | Retry-After / jittered exponential backoff       | retry_delay(), generate_insights()
+# PERF-41  | orjson fast path in parse_json_object           | parse_json_object()
+# PERF-42  | Workers return review indices, not texts        | extract_batch(), merge_batch_items()
+# PERF-43  | Batches capped by text length (BATCH_MAX_CHARS)  | StreamingBatchDispatcher.add()
+# PERF-44  | Extraction via forced tool call (structured out) | EXTRACTION_TOOL, tool_input_or_json()
+# PERF-45  | Skip short reviews with no sentiment words       | is_informative(), StreamingBatchDispatcher._dispatch()
+# PERF-46  | Cheaper related_reviews index validation        | extract_batch()
+# PERF-47  | Optional warm pool + longer scaledown for workers | process_batch_*, generate_*_insights, generate_all_summaries
+# PERF-49  | Exact text-label lookup before substring scan    | parse_rating() (src/data_processing/review_processor.py)
+# PERF-50  | Insights spawned before summaries (all 3 overlap) | full_analysis_parallel()
+# PERF-51  | Columns padded lazily (no padded list copies)   | _safe_get_column(), process_reviews() (src/data_processing/review_processor.py)
+# PERF-52  | Precompiled star-rating regex                   | _STAR_RATING_RE, _extract_rating() (src/scrapers/google_maps_scraper.py)
+# PERF-53  | Summary lookup table per category (no key scans) | summary_lookup(), find_summary()
+# PERF-54  | orjson in the pipeline image (Analyzer)         | image, full_analysis_parallel()
+# PERF-55  | force_refresh bypasses the analysis caches      | AnalyzeRequest, Analyzer.full_analysis(), full_analysis_parallel()
+# PERF-56  | Relative-date regexes compiled once             | parse_opentable_date() (src/ui/gradio_app.py)
 # ============================================================
 # MULTI-KEY VERSION: Uses 5 different API keys to avoid rate limits
 # - anthropic-batch1: Odd batch processing (1, 3, 5, ...)
@@ -42,14 +97,29 @@ FIXED:
 """
 
 import modal
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import os
 import json
 import re
+import hashlib
+import importlib
+from functools import lru_cache
+from urllib.parse import unquote_plus
+
+try:
+    import orjson  # [PERF-41] In api_image; fast path for parsing Claude JSON
+except ImportError:  # Optional - falls back to json.JSONDecoder.raw_decode
+    orjson = None
 
 # Create Modal app
 app = modal.App("restaurant-intelligence")
 
+# [PERF-01] Cross-replica cache of finished analyses, keyed by review content
+ANALYSIS_CACHE = modal.Dict.from_name("analysis-cache", create_if_missing=True)
+
+# [PERF-11] Latest pipeline stage per spawned call id (read by /status and /events)
+ANALYSIS_PROGRESS = modal.Dict.from_name("analysis-progress", create_if_missing=True)
+
 # ============================================================================
 # [INS-02] CENTRALIZED CONSTANTS
 # ============================================================================
@@ -61,105 +131,160 @@ SUMMARY_FOOD_COUNT = 20      # Was 15
 SUMMARY_DRINKS_COUNT = 15    # Was 10
 SUMMARY_ASPECTS_COUNT = 20   # Was 15
 
-# ============================================================================
-# Base image with all dependencies
-# ============================================================================
-image = (
-    modal.Image.debian_slim(python_version="3.12")
-    # Keep original - don't pin versions (causes availability issues)
-    .apt_install("chromium", "chromium-driver")
-    .run_commands("ln -sf /usr/bin/chromedriver /usr/local/bin/chromedriver")
-    .run_commands("ln -sf /usr/bin/chromium /usr/local/bin/chromium")
-    .pip_install(
-        "anthropic",
-        "selenium", 
-        "beautifulsoup4",
-        "pandas",
-        "python-dotenv",
-        "matplotlib",
-        "fastapi[standard]",
-        "httpx",
-        "fastmcp",
-    )
-    .add_local_python_source("src")
-)
+# Reviews per extraction batch
+BATCH_SIZE = 30
+
+# [PERF-43] Text budget per extraction batch (~6k input tokens): a run of very
+# long reviews is cut into a smaller batch instead of becoming the slow tail
+BATCH_MAX_CHARS = 24000
+
+# [PERF-35] Output-token budgets per call type. Anthropic counts max_tokens
+# against the output-tokens-per-minute limit when a request starts, so these
+# should sit just above real usage (MODAL_DEBUG=1 logs output tokens per call).
+EXTRACTION_MAX_TOKENS = 4000
+INSIGHTS_MAX_TOKENS = 2000
+SUMMARIES_MAX_TOKENS = 4000
+
+# [PERF-27] In-flight Claude requests per batch API key. Extraction is pure I/O
+# wait, so one container runs this many batches concurrently instead of one
+# container (and cold start) per batch.
+BATCH_MAX_CONCURRENT_REQUESTS = 16
+
+# [PERF-47] Idle containers kept per Claude worker (batch/insights/summaries). 0 = scale
+# to zero; set WORKER_MIN_CONTAINERS=1 at deploy time to skip cold starts (billed while idle)
+WORKER_MIN_CONTAINERS = max(int(os.environ.get("WORKER_MIN_CONTAINERS", "0")), 0)
 
+# Batch workers are capped at max_containers=1 ([PERF-27]); min may not exceed it
+BATCH_WORKER_MIN_CONTAINERS = min(WORKER_MIN_CONTAINERS, 1)
+
+# [PERF-47] Seconds a Claude worker stays warm after its last input
+WORKER_SCALEDOWN_WINDOW = 300
+
+# [PERF-03] Max scraper containers running at once (keeps OpenTable from rate-limiting us)
+SCRAPE_MAX_CONCURRENCY = 5
+
+# [PERF-21] Most URLs accepted by /analyze_batch (each is a full pipeline on the shared API keys)
+ANALYZE_BATCH_MAX_URLS = 10
+
+# [PERF-20] Seconds a finished analysis is reused for the same URL + max_reviews
+# without re-scraping (the content-hash cache still applies after that)
+ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", "3600"))
+
+# [PERF-19] Debug-only diagnostics (e.g. response size) - set MODAL_DEBUG=1 to enable
+DEBUG = os.getenv("MODAL_DEBUG") == "1"
 
 # ============================================================================
-# HELPER FUNCTIONS
+# [PERF-26] STATIC PROMPTS - byte-identical across calls so Anthropic's prompt
+# cache can reuse them; per-call data (restaurant, reviews, items) goes in the
+# user message
 # ============================================================================
 
-def calculate_sentiment(text: str) -> float:
+def cached_system(text: str) -> List[Dict[str, Any]]:
+    """System block marked for Anthropic prompt caching."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+@lru_cache(maxsize=8)
+def anthropic_client(api_key: str):
     """
-    Simple sentiment calculation from review text.
-    Returns value from -1 (very negative) to +1 (very positive).
+    [PERF-39] One Anthropic client per API key per container, so warm and
+    @modal.concurrent workers reuse its keep-alive connection pool instead
+    of opening a new TLS connection for every call.
     """
-    if not text:
-        return 0.0
-    text = str(text).lower()
-    
-    positive = ['amazing', 'excellent', 'fantastic', 'great', 'awesome', 'delicious', 
-                'perfect', 'outstanding', 'loved', 'beautiful', 'fresh', 'friendly', 
-                'best', 'wonderful', 'incredible', 'superb', 'exceptional', 'good',
-                'nice', 'tasty', 'recommend', 'enjoy', 'impressed', 'favorite']
-    negative = ['terrible', 'horrible', 'awful', 'bad', 'worst', 'disappointing', 
-                'poor', 'overpriced', 'slow', 'rude', 'cold', 'bland', 'mediocre',
-                'disgusting', 'inedible', 'undercooked', 'overcooked']
-    
-    pos = sum(1 for w in positive if w in text)
-    neg = sum(1 for w in negative if w in text)
+    from anthropic import Anthropic
+    return Anthropic(api_key=api_key)
+
+
+# [PERF-40] Upper bound for one retry wait (also caps a server-sent Retry-After)
+RETRY_MAX_DELAY = 30.0
+
+
+def retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """
+    [PERF-40] Seconds to wait before retrying a rate-limited (429) or
+    overloaded (529) Claude call, or None if the error is not retryable.
     
-    if pos + neg == 0:
-        return 0.0
-    return (pos - neg) / max(pos + neg, 1)
+    Honors the server's Retry-After header; otherwise exponential backoff
+    with jitter so parallel workers don't all retry in the same instant.
+    """
+    import random
+    
+    error_str = str(error)
+    status = getattr(error, "status_code", None)
+    if status not in (429, 529) and not (
+        '529' in error_str or '429' in error_str
+        or 'overloaded' in error_str.lower() or 'rate' in error_str.lower()
+    ):
+        return None
+    
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    return min(RETRY_MAX_DELAY, 2.0 ** (attempt + 1)) + random.uniform(0, 1)
 
 
-# ============================================================================
-# BATCH PROCESSOR - ODD BATCHES (uses anthropic-batch1 key)
-# ============================================================================
+_JSON_DECODER = json.JSONDecoder()
 
-@app.function(
-    image=image,
-    secrets=[modal.Secret.from_name("anthropic-batch1")],
-    timeout=210,
-    retries=3,
-    memory=512,  # [INIT-04] Added memory config
-)
-def process_batch_odd(batch_data: Dict[str, Any]) -> Dict[str, Any]:
+
+def log_usage(label: str, response: Any) -> None:
     """
-    Process ODD-numbered batches (1, 3, 5, ...) - uses anthropic-batch1 key.
-    Runs in PARALLEL across containers!
+    [PERF-35] Warn when a reply was cut off by max_tokens (its JSON will be
+    incomplete); with DEBUG, log output tokens for sizing the budgets.
     """
-    from anthropic import Anthropic
-    import os
-    
-    # [API-01] Check for API key
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        print("❌ ANTHROPIC_API_KEY not found in environment!")
-        return {"success": False, "batch_index": batch_data.get("batch_index", 0), 
-                "error": "API key not configured", "data": {"food_items": [], "drinks": [], "aspects": []}}
-    
-    reviews = batch_data["reviews"]
-    restaurant_name = batch_data["restaurant_name"]
-    batch_index = batch_data["batch_index"]
-    start_index = batch_data["start_index"]
-    
-    print(f"🔄 [BATCH1-KEY] Processing batch {batch_index} ({len(reviews)} reviews)...")
+    if getattr(response, "stop_reason", None) == "max_tokens":
+        print(f"⚠️ {label}: hit max_tokens - response truncated")
+    if DEBUG:
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            print(f"[MODAL] {label} output tokens: {usage.output_tokens}")
+
+
+def tool_input_or_json(response: Any) -> Dict[str, Any]:
+    """
+    [PERF-44] Input of the first tool_use block of a Claude response; falls
+    back to parse_json_object() on the text blocks if there is none.
+    """
+    for block in response.content:
+        if getattr(block, "type", None) == "tool_use" and isinstance(block.input, dict):
+            return block.input
+    text = "".join(getattr(block, "text", "") for block in response.content)
+    return parse_json_object(text)
+
+
+def parse_json_object(text: str) -> Dict[str, Any]:
+    """
+    [PERF-28] Decode the first JSON object in a Claude response in one pass.
     
-    client = Anthropic(api_key=api_key)
+    Skips ```json fences / leading prose by starting at the first '{' and
+    ignores anything after the object - no regex scan, no second parse.
     
-    # Build extraction prompt
-    numbered_reviews = []
-    for i, review in enumerate(reviews):
-        numbered_reviews.append(f"[Review {i}]: {review}")
-    reviews_text = "\n\n".join(numbered_reviews)
+    [PERF-41] With orjson available, the '{'...'}' slice is parsed by orjson
+    first (the usual reply: bare or fenced JSON); raw_decode only runs when
+    prose after the object makes that slice invalid.
     
-    # [INS-02] Use centralized threshold in prompt
-    prompt = f"""You are analyzing customer reviews for {restaurant_name}. Extract BOTH menu items AND aspects in ONE PASS.
+    Raises:
+        json.JSONDecodeError: if no valid object is found
+    """
+    start = text.find("{")
+    if start < 0:
+        raise json.JSONDecodeError("No JSON object found", text, 0)
+    if orjson is not None:
+        try:
+            obj = orjson.loads(text[start:text.rfind("}") + 1])
+            if isinstance(obj, dict):
+                return obj
+        except orjson.JSONDecodeError:
+            pass
+    obj, _ = _JSON_DECODER.raw_decode(text, start)
+    return obj
 
-REVIEWS:
-{reviews_text}
+
+# [INS-02] Use centralized threshold in prompt
+EXTRACTION_SYSTEM_PROMPT = f"""You are analyzing customer reviews for the restaurant named in the user message. Extract BOTH menu items AND aspects in ONE PASS.
 
 YOUR TASK - Extract THREE things simultaneously:
 1. **MENU ITEMS** (food & drinks mentioned)
@@ -175,7 +300,8 @@ RULES:
 - Specific items only: "salmon sushi", "miso soup", "sake"
 - Separate food from drinks
 - Lowercase names
-- For EACH item/aspect, list which review NUMBERS mention it
+- Reviews are one per line as "NUMBER|text"
+- For EACH item/aspect, list which review NUMBERS (the integer before "|") mention it
 
 OUTPUT (JSON):
 {{
@@ -191,201 +317,420 @@ OUTPUT (JSON):
 }}
 
 CRITICAL: Output ONLY valid JSON, no other text.
-Use sentiment scale: >= {SENTIMENT_THRESHOLD_POSITIVE} positive, {SENTIMENT_THRESHOLD_NEGATIVE}-{SENTIMENT_THRESHOLD_POSITIVE - 0.01} neutral, < {SENTIMENT_THRESHOLD_NEGATIVE} negative
+Use sentiment scale: >= {SENTIMENT_THRESHOLD_POSITIVE} positive, {SENTIMENT_THRESHOLD_NEGATIVE}-{SENTIMENT_THRESHOLD_POSITIVE - 0.01} neutral, < {SENTIMENT_THRESHOLD_NEGATIVE} negative"""
 
-Extract everything:"""
 
-    try:
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4000,
-            temperature=0.3,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        result_text = response.content[0].text
-        result_text = result_text.replace('```json', '').replace('```', '').strip()
-        
-        data = json.loads(result_text)
-        
-        # Map review indices back to full text
-        for item in data.get('food_items', []):
-            indices = item.get('related_reviews', [])
-            item['related_reviews'] = []
-            for idx in indices:
-                if isinstance(idx, int) and 0 <= idx < len(reviews):
-                    item['related_reviews'].append({
-                        'review_index': start_index + idx,
-                        'review_text': reviews[idx]
-                    })
-            if 'name' in item:
-                item['name'] = item['name'].lower().strip()  # [INS-03] Added strip()
-        
-        for item in data.get('drinks', []):
-            indices = item.get('related_reviews', [])
-            item['related_reviews'] = []
-            for idx in indices:
-                if isinstance(idx, int) and 0 <= idx < len(reviews):
-                    item['related_reviews'].append({
-                        'review_index': start_index + idx,
-                        'review_text': reviews[idx]
-                    })
-            if 'name' in item:
-                item['name'] = item['name'].lower().strip()  # [INS-03] Added strip()
-        
-        for aspect in data.get('aspects', []):
-            indices = aspect.get('related_reviews', [])
-            aspect['related_reviews'] = []
-            for idx in indices:
-                if isinstance(idx, int) and 0 <= idx < len(reviews):
-                    aspect['related_reviews'].append({
-                        'review_index': start_index + idx,
-                        'review_text': reviews[idx]
-                    })
-            if 'name' in aspect:
-                aspect['name'] = aspect['name'].lower().strip()  # [INS-03] Added strip()
-        
-        print(f"✅ Batch {batch_index} complete: {len(data.get('food_items', []))} food, {len(data.get('drinks', []))} drinks, {len(data.get('aspects', []))} aspects")
-        return {"success": True, "batch_index": batch_index, "data": data}
-        
-    except json.JSONDecodeError as e:
-        print(f"⚠️ Batch {batch_index} JSON error: {e}")
-        return {"success": False, "batch_index": batch_index, "data": {"food_items": [], "drinks": [], "aspects": []}}
-    except Exception as e:
-        print(f"❌ Batch {batch_index} error: {e}")
-        return {"success": False, "batch_index": batch_index, "data": {"food_items": [], "drinks": [], "aspects": []}}
+def format_reviews_for_prompt(reviews: List[str]) -> str:
+    """
+    [PERF-36] One "i|text" line per review for the extraction prompt.
+    
+    Cleaned reviews are single-line, so a newline is an unambiguous
+    separator; replaces "[Review i]: text" blocks joined by blank lines,
+    saving a few input tokens per review.
+    """
+    return "\n".join(f"{i}|{review}" for i, review in enumerate(reviews))
+
+
+def _extraction_item_schema(detail_field: str) -> Dict[str, Any]:
+    """JSON schema for one extracted item/aspect (detail_field = 'category' or 'description')."""
+    return {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "mention_count": {"type": "integer"},
+            "sentiment": {"type": "number"},
+            detail_field: {"type": "string"},
+            "related_reviews": {"type": "array", "items": {"type": "integer"}},
+        },
+        "required": ["name", "mention_count", "sentiment", "related_reviews"],
+    }
+
+
+# [PERF-44] Forced tool call: the extraction arrives as a parsed dict (no
+# fences, prose or malformed JSON to recover from)
+EXTRACTION_TOOL = {
+    "name": "record_extraction",
+    "description": "Record the menu items, drinks and aspects extracted from the reviews.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "food_items": {"type": "array", "items": _extraction_item_schema("category")},
+            "drinks": {"type": "array", "items": _extraction_item_schema("category")},
+            "aspects": {"type": "array", "items": _extraction_item_schema("description")},
+        },
+        "required": ["food_items", "drinks", "aspects"],
+    },
+}
 
 
+def _insights_system_prompt(audience: str, focus: str, topic_filter: str) -> str:
+    """Static insights rubric for one role (built once at import)."""
+    return f"""You are an expert restaurant consultant analyzing feedback for the restaurant named in the user message.
+
+SENTIMENT SCALE:
+- POSITIVE (>= {SENTIMENT_THRESHOLD_POSITIVE}): Highlight as STRENGTH
+- NEUTRAL ({SENTIMENT_THRESHOLD_NEGATIVE} to {SENTIMENT_THRESHOLD_POSITIVE - 0.01}): Room for improvement
+- NEGATIVE (< {SENTIMENT_THRESHOLD_NEGATIVE}): Flag as CONCERN
+
+YOUR TASK: Generate insights for the {audience}.
+{focus}
+
+RULES:
+1. Focus {topic_filter}
+2. STRENGTHS from items with sentiment >= {SENTIMENT_THRESHOLD_POSITIVE}
+3. CONCERNS from items with sentiment < {SENTIMENT_THRESHOLD_NEGATIVE}
+4. Output ONLY valid JSON
+
+OUTPUT:
+{{
+  "summary": "2-3 sentence executive summary",
+  "strengths": ["strength 1", "strength 2", "strength 3", "strength 4", "strength 5"],
+  "concerns": ["concern 1", "concern 2", "concern 3"],
+  "recommendations": [
+    {{"priority": "high", "action": "action", "reason": "why", "evidence": "data"}},
+    {{"priority": "medium", "action": "action", "reason": "why", "evidence": "data"}},
+    {{"priority": "low", "action": "action", "reason": "why", "evidence": "data"}}
+  ]
+}}"""
+
+
+INSIGHTS_SYSTEM_PROMPTS = {
+    "chef": _insights_system_prompt(
+        "HEAD CHEF",
+        "Focus on: Food quality, menu items, ingredients, presentation, portions, consistency",
+        "ONLY on food/kitchen topics"
+    ),
+    "manager": _insights_system_prompt(
+        "RESTAURANT MANAGER",
+        "Focus on: Service, staff, wait times, ambience, value, cleanliness",
+        "ONLY on operations/service topics"
+    ),
+}
+
+SUMMARIES_SYSTEM_PROMPT = f"""Generate brief 2-3 sentence summaries for each item listed in the user message.
+
+For each summary:
+1. Synthesizes what customers say
+2. Reflects the sentiment score (positive if >= {SENTIMENT_THRESHOLD_POSITIVE}, negative if < {SENTIMENT_THRESHOLD_NEGATIVE}, neutral otherwise)
+3. Gives actionable insight for restaurant staff
+
+OUTPUT FORMAT (JSON):
+{{
+  "food": {{
+    "item name": "2-3 sentence summary based on reviews...",
+    "another item": "summary..."
+  }},
+  "drinks": {{
+    "drink name": "summary..."
+  }},
+  "aspects": {{
+    "aspect name": "summary..."
+  }}
+}}
+
+CRITICAL: Output ONLY valid JSON. Generate summaries for ALL items listed."""
+
 # ============================================================================
-# BATCH PROCESSOR - EVEN BATCHES (uses anthropic-batch2 key)
+# Base image with all dependencies ([PERF-08] shared with modal_app.py)
 # ============================================================================
+from src.modal_image import image, api_image  # [PERF-22] api_image = no browser
 
-@app.function(
-    image=image,
-    secrets=[modal.Secret.from_name("anthropic-batch2")],
-    timeout=210,
-    retries=3,
-    memory=512,  # [INIT-04] Added memory config
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+# [PERF-16] [PERF-18] Whole-word sentiment keyword sets, [PERF-10] platform regex:
+# shared with the Gradio UI so the two never drift apart
+from src.review_signals import (
+    SENTIMENT_POSITIVE_WORDS,
+    SENTIMENT_NEGATIVE_WORDS,
+    WORD_RE,
+    detect_platform,
 )
-def process_batch_even(batch_data: Dict[str, Any]) -> Dict[str, Any]:
+
+
+def normalize_item_name(name: Any) -> str:
     """
-    Process EVEN-numbered batches (2, 4, 6, ...) - uses anthropic-batch2 key.
-    Runs in PARALLEL across containers!
+    [PERF-34] Canonical item/aspect name, computed once per item in the batch
+    processors: lowercase, trimmed, inner whitespace collapsed
+    ("Salmon  Sushi" -> "salmon sushi"). Merge and summary lookups use it as-is.
     """
-    from anthropic import Anthropic
-    import os
-    
-    # [API-01] Check for API key
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        print("❌ ANTHROPIC_API_KEY not found in environment!")
-        return {"success": False, "batch_index": batch_data.get("batch_index", 0), 
-                "error": "API key not configured", "data": {"food_items": [], "drinks": [], "aspects": []}}
-    
-    reviews = batch_data["reviews"]
-    restaurant_name = batch_data["restaurant_name"]
-    batch_index = batch_data["batch_index"]
-    start_index = batch_data["start_index"]
-    
-    print(f"🔄 [BATCH2-KEY] Processing batch {batch_index} ({len(reviews)} reviews)...")
+    return " ".join(str(name).lower().split())
+
+
+def calculate_sentiment(text: str) -> float:
+    """
+    Simple sentiment calculation from review text.
+    Returns value from -1 (very negative) to +1 (very positive).
+    """
+    if not text:
+        return 0.0
+    text = str(text).lower()
     
-    client = Anthropic(api_key=api_key)
+    words = set(WORD_RE.findall(text))
+    pos = len(words & SENTIMENT_POSITIVE_WORDS)
+    neg = len(words & SENTIMENT_NEGATIVE_WORDS)
     
-    # Build extraction prompt
-    numbered_reviews = []
-    for i, review in enumerate(reviews):
-        numbered_reviews.append(f"[Review {i}]: {review}")
-    reviews_text = "\n\n".join(numbered_reviews)
+    if pos + neg == 0:
+        return 0.0
+    return (pos - neg) / max(pos + neg, 1)
+
+
+# [PERF-45] Reviews shorter than this are only sent to Claude if they carry a sentiment word
+INFORMATIVE_MIN_CHARS = 40
+
+
+def is_informative(text: str) -> bool:
+    """
+    [PERF-45] Cheap pre-filter before extraction: long reviews always pass;
+    short ones ("Will be back!") pass only with a positive/negative word.
+    """
+    if len(text) >= INFORMATIVE_MIN_CHARS:
+        return True
+    words = set(WORD_RE.findall(text.lower()))
+    return not (words.isdisjoint(SENTIMENT_POSITIVE_WORDS) and words.isdisjoint(SENTIMENT_NEGATIVE_WORDS))
+
+
+# [PERF-25] Restaurant name = last OpenTable path segment / Google Maps /place/ segment
+_OPENTABLE_NAME_RE = re.compile(r"/([^/?#]+)/?(?:[?#]|$)")
+_GMAPS_PLACE_RE = re.compile(r"/place/([^/?#]+)")
+
+
+@lru_cache(maxsize=1024)
+def restaurant_name_from_url(url: str) -> str:
+    """[PERF-25] Display name parsed from a review URL (decodes %xx and '+'; cached)."""
+    platform = detect_platform(url)
+    if platform == "opentable":
+        m = _OPENTABLE_NAME_RE.search(url)
+        if m:
+            return unquote_plus(m.group(1)).replace("-", " ").title()
+    elif platform == "google_maps":
+        m = _GMAPS_PLACE_RE.search(url)
+        if m:
+            return unquote_plus(m.group(1))
+    return "Restaurant"
+
+
+def report_progress(stage: str, message: str) -> None:
+    """[PERF-11] Publish the current pipeline stage for the running function call."""
+    import time
+    try:
+        call_id = modal.current_function_call_id()
+    except Exception:
+        call_id = None
+    if not call_id:
+        return
+    try:
+        ANALYSIS_PROGRESS[call_id] = {"stage": stage, "message": message, "updated_at": time.time()}
+    except Exception as e:
+        print(f"⚠️ Could not publish progress: {e}")
+
+
+# [PERF-15] Scraper module + entry point per platform; only the detected one is imported
+_SCRAPERS = {
+    "opentable": ("src.scrapers.opentable_scraper", "scrape_opentable"),
+    "google_maps": ("src.scrapers.google_maps_scraper", "scrape_google_maps"),
+}
+
+
+def load_scraper(platform: str):
+    """Import and return the scraper module for a platform (cached by Python after first use)."""
+    return importlib.import_module(_SCRAPERS[platform][0])
+
+
+def scrape_platform(platform: str, url: str, max_reviews: int, **kwargs) -> Dict[str, Any]:
+    """Run the platform's scrape function (headless); kwargs go through (driver, reviews_callback)."""
+    scrape_fn = getattr(load_scraper(platform), _SCRAPERS[platform][1])
+    return scrape_fn(url=url, max_reviews=max_reviews, headless=True, **kwargs)
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase, drop query string and trailing slash (cache keys only)."""
+    return url.strip().lower().split("?")[0].rstrip("/")
+
+
+def content_cache_key(url: str, reviews: List[str]) -> str:
+    """[PERF-01] Exact-match cache key: normalized URL + scraped review content."""
+    payload = normalize_url(url) + "||" + "\n".join(reviews)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def head_cache_key(url: str) -> str:
+    """[PERF-01] Cache key for the first-batch fingerprint of the last cached analysis."""
+    return "head:" + hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+def batch_fingerprint(raw_chunk: List[str]) -> str:
+    """[PERF-01] Hash of one raw batch of review texts (compared across runs)."""
+    payload = "\n".join(text or "" for text in raw_chunk)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached_head(url: str) -> Optional[str]:
+    """[PERF-01] First-batch fingerprint stored with this URL's last cached analysis."""
+    try:
+        return ANALYSIS_CACHE.get(head_cache_key(url))
+    except Exception as e:
+        print(f"⚠️ Analysis cache unavailable: {e}")
+        return None
+
+
+def request_cache_key(url: str, max_reviews: int) -> str:
+    """[PERF-20] Cache key for a whole request: normalized URL + review cap."""
+    payload = f"{normalize_url(url)}|{max_reviews}"
+    return "request:" + hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def get_recent_analysis(url: str, max_reviews: int) -> Optional[Dict[str, Any]]:
+    """[PERF-20] Analysis for this exact request if it finished within ANALYSIS_CACHE_TTL."""
+    import time
+    try:
+        entry = ANALYSIS_CACHE.get(request_cache_key(url, max_reviews))
+    except Exception as e:
+        print(f"⚠️ Analysis cache unavailable: {e}")
+        return None
+    if entry and time.time() - entry["ts"] < ANALYSIS_CACHE_TTL:
+        return entry["data"]
+    return None
+
+
+def store_recent_analysis(url: str, max_reviews: int, analysis: Dict[str, Any]) -> None:
+    """[PERF-20] Remember a finished analysis for get_recent_analysis()."""
+    import time
+    try:
+        ANALYSIS_CACHE[request_cache_key(url, max_reviews)] = {"ts": time.time(), "data": analysis}
+    except Exception as e:
+        print(f"⚠️ Could not cache analysis: {e}")
+
+
+def summary_cache_key(url: str) -> str:
+    """[PERF-32] Cache key for a restaurant's item summaries: normalized URL."""
+    return "summaries:" + hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+def summary_signature(item: Dict[str, Any]) -> str:
+    """[PERF-32] What an item's summary depends on: its name and sentiment (0.1 bucket)."""
+    return f"{item.get('name', '')}|{item.get('sentiment', 0):.1f}"
+
+
+def get_cached_summaries(url: str) -> Dict[str, Dict[str, str]]:
+    """[PERF-32] {category: {summary_signature: summary}} from earlier runs on this URL."""
+    try:
+        return ANALYSIS_CACHE.get(summary_cache_key(url)) or {}
+    except Exception as e:
+        print(f"⚠️ Summary cache unavailable: {e}")
+        return {}
+
+
+def store_cached_summaries(url: str, entry: Dict[str, Dict[str, str]]) -> None:
+    """[PERF-32] Replace this URL's cached summaries (current items only, so it stays small)."""
+    try:
+        ANALYSIS_CACHE[summary_cache_key(url)] = entry
+    except Exception as e:
+        print(f"⚠️ Could not cache summaries: {e}")
+
+
+def summary_lookup(summary_dict: Dict[str, str]) -> Dict[str, str]:
+    """
+    [INS-03] Summaries keyed by normalized name, so "Pasta Carbonara " and
+    "pasta carbonara" match.
     
-    # [INS-02] Use centralized threshold in prompt
-    prompt = f"""You are analyzing customer reviews for {restaurant_name}. Extract BOTH menu items AND aspects in ONE PASS.
+    [PERF-53] Built once per category; each item is then one dict lookup
+    instead of a scan of every summary key.
+    """
+    lookup: Dict[str, str] = {}
+    for key, text in summary_dict.items():
+        lookup.setdefault(normalize_item_name(key), text)  # [PERF-34]
+    return lookup
 
-REVIEWS:
-{reviews_text}
 
-YOUR TASK - Extract THREE things simultaneously:
-1. **MENU ITEMS** (food & drinks mentioned)
-2. **ASPECTS** (what customers care about: service, ambience, etc.)
-3. **SENTIMENT** for each
+def find_summary(name: str, lookup: Dict[str, str]) -> str:
+    """[INS-03] Summary for an item name from a summary_lookup() table ('' if none)."""
+    return lookup.get(normalize_item_name(name), "")
 
-SENTIMENT SCALE (IMPORTANT):
-- **Positive ({SENTIMENT_THRESHOLD_POSITIVE} to 1.0):** Customer clearly enjoyed/praised this item or aspect
-- **Neutral ({SENTIMENT_THRESHOLD_NEGATIVE} to {SENTIMENT_THRESHOLD_POSITIVE - 0.01}):** Mixed feelings, okay but not exceptional
-- **Negative (-1.0 to {SENTIMENT_THRESHOLD_NEGATIVE - 0.01}):** Customer complained, criticized, or expressed disappointment
 
-RULES:
-- Specific items only: "salmon sushi", "miso soup", "sake"
-- Separate food from drinks
-- Lowercase names
-- For EACH item/aspect, list which review NUMBERS mention it
+# ============================================================================
+# BATCH EXTRACTION - shared body of both batch processors ([PERF-37])
+# ============================================================================
 
-OUTPUT (JSON):
-{{
-  "food_items": [
-    {{"name": "item name", "mention_count": 2, "sentiment": 0.85, "category": "type", "related_reviews": [0, 5]}}
-  ],
-  "drinks": [
-    {{"name": "drink name", "mention_count": 1, "sentiment": 0.7, "category": "alcohol", "related_reviews": [3]}}
-  ],
-  "aspects": [
-    {{"name": "service speed", "mention_count": 3, "sentiment": 0.65, "description": "brief desc", "related_reviews": [1, 2, 7]}}
-  ]
-}}
+def extract_batch(batch_data: Dict[str, Any], key_label: str) -> Dict[str, Any]:
+    """
+    Extract menu items, drinks and aspects from one batch of reviews.
+    
+    Runs inside process_batch_odd / process_batch_even, which differ only in
+    the Modal secret (API key) they mount; key_label tags the log lines.
+    """
+    import os
+    
+    # [API-01] Check for API key
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("❌ ANTHROPIC_API_KEY not found in environment!")
+        return {"success": False, "batch_index": batch_data.get("batch_index", 0), 
+                "error": "API key not configured", "data": {"food_items": [], "drinks": [], "aspects": []}}
+    
+    reviews = batch_data["reviews"]
+    restaurant_name = batch_data["restaurant_name"]
+    batch_index = batch_data["batch_index"]
+    start_index = batch_data["start_index"]
+    # [PERF-45] Global index of each sent review (reviews may skip some indices)
+    review_indices = batch_data.get("review_indices") or range(start_index, start_index + len(reviews))
+    
+    print(f"🔄 [{key_label}] Processing batch {batch_index} ({len(reviews)} reviews)...")
+    
+    client = anthropic_client(api_key)  # [PERF-39]
+    
+    # Build extraction prompt
+    reviews_text = format_reviews_for_prompt(reviews)  # [PERF-36]
+    
+    # [PERF-26] Static rubric lives in EXTRACTION_SYSTEM_PROMPT (prompt-cached)
+    user_content = f"""Restaurant: {restaurant_name}
 
-CRITICAL: Output ONLY valid JSON, no other text.
-Use sentiment scale: >= {SENTIMENT_THRESHOLD_POSITIVE} positive, {SENTIMENT_THRESHOLD_NEGATIVE}-{SENTIMENT_THRESHOLD_POSITIVE - 0.01} neutral, < {SENTIMENT_THRESHOLD_NEGATIVE} negative
+REVIEWS:
+{reviews_text}
 
 Extract everything:"""
 
     try:
         response = client.messages.create(
             model="claude-sonnet-4-20250514",
-            max_tokens=4000,
+            max_tokens=EXTRACTION_MAX_TOKENS,  # [PERF-35]
             temperature=0.3,
-            messages=[{"role": "user", "content": prompt}]
+            system=cached_system(EXTRACTION_SYSTEM_PROMPT),
+            tools=[EXTRACTION_TOOL],  # [PERF-44]
+            tool_choice={"type": "tool", "name": EXTRACTION_TOOL["name"]},
+            messages=[{"role": "user", "content": user_content}]
         )
+        log_usage(f"Batch {batch_index}", response)
         
-        result_text = response.content[0].text
-        result_text = result_text.replace('```json', '').replace('```', '').strip()
-        
-        data = json.loads(result_text)
-        
-        # Map review indices back to full text
-        for item in data.get('food_items', []):
-            indices = item.get('related_reviews', [])
-            item['related_reviews'] = []
-            for idx in indices:
-                if isinstance(idx, int) and 0 <= idx < len(reviews):
-                    item['related_reviews'].append({
-                        'review_index': start_index + idx,
-                        'review_text': reviews[idx]
-                    })
-            if 'name' in item:
-                item['name'] = item['name'].lower().strip()  # [INS-03] Added strip()
-        
-        for item in data.get('drinks', []):
-            indices = item.get('related_reviews', [])
-            item['related_reviews'] = []
-            for idx in indices:
-                if isinstance(idx, int) and 0 <= idx < len(reviews):
-                    item['related_reviews'].append({
-                        'review_index': start_index + idx,
-                        'review_text': reviews[idx]
-                    })
-            if 'name' in item:
-                item['name'] = item['name'].lower().strip()  # [INS-03] Added strip()
+        data = tool_input_or_json(response)  # [PERF-44]
         
-        for aspect in data.get('aspects', []):
-            indices = aspect.get('related_reviews', [])
-            aspect['related_reviews'] = []
-            for idx in indices:
-                if isinstance(idx, int) and 0 <= idx < len(reviews):
-                    aspect['related_reviews'].append({
-                        'review_index': start_index + idx,
-                        'review_text': reviews[idx]
-                    })
-            if 'name' in aspect:
-                aspect['name'] = aspect['name'].lower().strip()  # [INS-03] Added strip()
+        # Map batch-local indices to global review indices ([PERF-42] text is
+        # attached by merge_batch_items from the Analyzer's own copy)
+        # Malformed items (non-dict, null or non-list related_reviews) are
+        # dropped or emptied one by one instead of failing the whole batch
+        n_reviews = len(reviews)
+        for field in ("food_items", "drinks", "aspects"):
+            items = data.get(field) or []
+            if not isinstance(items, list):
+                items = []
+            kept = []
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                related = item.get('related_reviews') or []
+                if not isinstance(related, list):
+                    related = []
+                item['related_reviews'] = [
+                    {'review_index': review_indices[idx]}
+                    for idx in related
+                    if type(idx) is int and 0 <= idx < n_reviews  # [PERF-46] exact type check, rejects bools
+                ]
+                if isinstance(item.get('name'), str):
+                    item['name'] = normalize_item_name(item['name'])  # [INS-03] [PERF-34]
+                kept.append(item)
+            data[field] = kept
         
         print(f"✅ Batch {batch_index} complete: {len(data.get('food_items', []))} food, {len(data.get('drinks', []))} drinks, {len(data.get('aspects', []))} aspects")
         return {"success": True, "batch_index": batch_index, "data": data}
@@ -399,35 +744,62 @@ Extract everything:"""
 
 
 # ============================================================================
-# CHEF INSIGHTS (uses anthropic-chef key)
+# BATCH PROCESSOR - ODD BATCHES (uses anthropic-batch1 key)
 # ============================================================================
 
 @app.function(
-    image=image,
-    secrets=[modal.Secret.from_name("anthropic-chef")],
+    image=api_image,
+    secrets=[modal.Secret.from_name("anthropic-batch1")],
     timeout=210,
     retries=3,
     memory=512,  # [INIT-04] Added memory config
+    max_containers=1,  # [PERF-27] One warm worker per key; concurrency below is the rate limit
+    min_containers=BATCH_WORKER_MIN_CONTAINERS,  # [PERF-47]
+    scaledown_window=WORKER_SCALEDOWN_WINDOW,  # [PERF-47]
 )
-def generate_chef_insights(analysis_data: Dict[str, Any], restaurant_name: str) -> Dict[str, Any]:
-    """Generate CHEF insights - uses anthropic-chef key."""
-    from anthropic import Anthropic
-    import os
-    import time as time_module
-    
-    role = "chef"
-    print(f"🧠 [CHEF-KEY] Generating {role} insights...")
-    
-    # [API-01] Check for API key
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        print(f"❌ ANTHROPIC_API_KEY not found for {role} insights!")
-        return {"role": role, "insights": _fallback_insights(role)}
-    
-    client = Anthropic(api_key=api_key)
-    
+@modal.concurrent(max_inputs=BATCH_MAX_CONCURRENT_REQUESTS)
+def process_batch_odd(batch_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Process ODD-numbered batches (1, 3, 5, ...) - uses anthropic-batch1 key.
+    Runs in PARALLEL across containers!
+    """
+    return extract_batch(batch_data, "BATCH1-KEY")
+
+
+# ============================================================================
+# BATCH PROCESSOR - EVEN BATCHES (uses anthropic-batch2 key)
+# ============================================================================
+
+@app.function(
+    image=api_image,
+    secrets=[modal.Secret.from_name("anthropic-batch2")],
+    timeout=210,
+    retries=3,
+    memory=512,  # [INIT-04] Added memory config
+    max_containers=1,  # [PERF-27] One warm worker per key; concurrency below is the rate limit
+    min_containers=BATCH_WORKER_MIN_CONTAINERS,  # [PERF-47]
+    scaledown_window=WORKER_SCALEDOWN_WINDOW,  # [PERF-47]
+)
+@modal.concurrent(max_inputs=BATCH_MAX_CONCURRENT_REQUESTS)
+def process_batch_even(batch_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Process EVEN-numbered batches (2, 4, 6, ...) - uses anthropic-batch2 key.
+    Runs in PARALLEL across containers!
+    """
+    return extract_batch(batch_data, "BATCH2-KEY")
+
+
+# ============================================================================
+# INSIGHTS - shared context + body for the chef and manager workers ([PERF-38])
+# ============================================================================
+
+def build_insights_context(analysis_data: Dict[str, Any], restaurant_name: str) -> str:
+    """
+    [PERF-38] Compact insights input (top items + aspects), built once in the
+    Analyzer and sent to both role workers instead of the full analysis_data
+    (every item's related_reviews texts) being pickled to each of them.
+    """
     menu_items = analysis_data.get('menu_analysis', {}).get('food_items', [])[:20]
-    drinks = analysis_data.get('menu_analysis', {}).get('drinks', [])[:10]
     aspects = analysis_data.get('aspect_analysis', {}).get('aspects', [])[:20]
     
     # [INS-02] Use centralized threshold for formatting
@@ -445,41 +817,35 @@ def generate_chef_insights(analysis_data: Dict[str, Any], restaurant_name: str)
         aspect_lines.append(f"  {indicator} {a.get('name', '?')}: sentiment {s:+.2f}, {a.get('mention_count', 0)} mentions")
     aspect_summary = "\n".join(aspect_lines)
     
-    focus = "Focus on: Food quality, menu items, ingredients, presentation, portions, consistency"
-    topic_filter = "ONLY on food/kitchen topics"
-    
-    # [INS-02] Use centralized threshold in prompt
-    prompt = f"""You are an expert restaurant consultant analyzing feedback for {restaurant_name}.
+    return f"""Restaurant: {restaurant_name}
 
 {menu_summary}
 
-{aspect_summary}
-
-SENTIMENT SCALE:
-- POSITIVE (>= {SENTIMENT_THRESHOLD_POSITIVE}): Highlight as STRENGTH
-- NEUTRAL ({SENTIMENT_THRESHOLD_NEGATIVE} to {SENTIMENT_THRESHOLD_POSITIVE - 0.01}): Room for improvement
-- NEGATIVE (< {SENTIMENT_THRESHOLD_NEGATIVE}): Flag as CONCERN
-
-YOUR TASK: Generate insights for the HEAD CHEF.
-{focus}
+{aspect_summary}"""
 
-RULES:
-1. Focus {topic_filter}
-2. STRENGTHS from items with sentiment >= {SENTIMENT_THRESHOLD_POSITIVE}
-3. CONCERNS from items with sentiment < {SENTIMENT_THRESHOLD_NEGATIVE}
-4. Output ONLY valid JSON
 
-OUTPUT:
-{{
-  "summary": "2-3 sentence executive summary",
-  "strengths": ["strength 1", "strength 2", "strength 3", "strength 4", "strength 5"],
-  "concerns": ["concern 1", "concern 2", "concern 3"],
-  "recommendations": [
-    {{"priority": "high", "action": "action", "reason": "why", "evidence": "data"}},
-    {{"priority": "medium", "action": "action", "reason": "why", "evidence": "data"}},
-    {{"priority": "low", "action": "action", "reason": "why", "evidence": "data"}}
-  ]
-}}
+def generate_insights(role: str, insights_context: str, key_label: str) -> Dict[str, Any]:
+    """
+    Generate insights for one role ('chef' / 'manager').
+    
+    Runs inside generate_chef_insights / generate_manager_insights, which
+    differ only in the Modal secret (API key) they mount.
+    """
+    import os
+    import time as time_module
+    
+    print(f"🧠 [{key_label}] Generating {role} insights...")
+    
+    # [API-01] Check for API key
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        print(f"❌ ANTHROPIC_API_KEY not found for {role} insights!")
+        return {"role": role, "insights": _fallback_insights(role)}
+    
+    client = anthropic_client(api_key)  # [PERF-39]
+    
+    # [PERF-26] Static rubric lives in INSIGHTS_SYSTEM_PROMPTS[role] (prompt-cached)
+    user_content = f"""{insights_context}
 
 Generate {role} insights:"""
 
@@ -489,39 +855,34 @@ Generate {role} insights:"""
             print(f"🔄 Calling API for {role} insights (attempt {attempt + 1}/{max_retries})...")
             response = client.messages.create(
                 model="claude-sonnet-4-20250514",
-                max_tokens=2000,
+                max_tokens=INSIGHTS_MAX_TOKENS,  # [PERF-35]
                 temperature=0.4,
-                messages=[{"role": "user", "content": prompt}]
+                system=cached_system(INSIGHTS_SYSTEM_PROMPTS[role]),
+                messages=[{"role": "user", "content": user_content}]
             )
+            log_usage(f"{role} insights", response)
             
-            result_text = response.content[0].text.strip()
+            result_text = response.content[0].text
             print(f"📝 {role} raw response length: {len(result_text)} chars")
             
-            result_text = result_text.replace('```json', '').replace('```', '').strip()
+            try:
+                insights = parse_json_object(result_text)  # [PERF-28]
+            except json.JSONDecodeError as je:
+                print(f"⚠️ {role} JSON parse error: {je}")
+                return {"role": role, "insights": _fallback_insights(role)}
             
-            match = re.search(r'\{[\s\S]*\}', result_text)
-            if match:
-                try:
-                    insights = json.loads(match.group())
-                    if 'summary' in insights and 'strengths' in insights:
-                        print(f"✅ {role.title()} insights generated successfully")
-                        return {"role": role, "insights": insights}
-                    else:
-                        print(f"⚠️ {role} insights missing required fields")
-                        return {"role": role, "insights": _fallback_insights(role)}
-                except json.JSONDecodeError as je:
-                    print(f"⚠️ {role} JSON parse error: {je}")
-                    return {"role": role, "insights": _fallback_insights(role)}
+            if 'summary' in insights and 'strengths' in insights:
+                print(f"✅ {role.title()} insights generated successfully")
+                return {"role": role, "insights": insights}
             else:
-                print(f"⚠️ No JSON found in {role} response")
+                print(f"⚠️ {role} insights missing required fields")
                 return {"role": role, "insights": _fallback_insights(role)}
                 
         except Exception as e:
-            error_str = str(e)
-            if '529' in error_str or 'overloaded' in error_str.lower() or '429' in error_str or 'rate' in error_str.lower():
+            wait_time = retry_delay(e, attempt)  # [PERF-40]
+            if wait_time is not None:
                 if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 5
-                    print(f"⚠️ API overloaded for {role}, waiting {wait_time}s before retry...")
+                    print(f"⚠️ API overloaded for {role}, waiting {wait_time:.1f}s before retry...")
                     time_module.sleep(wait_time)
                     continue
                 else:
@@ -535,139 +896,39 @@ Generate {role} insights:"""
 
 
 # ============================================================================
-# MANAGER INSIGHTS (uses anthropic-manager key)
+# CHEF INSIGHTS (uses anthropic-chef key)
 # ============================================================================
 
 @app.function(
-    image=image,
-    secrets=[modal.Secret.from_name("anthropic-manager")],
+    image=api_image,
+    secrets=[modal.Secret.from_name("anthropic-chef")],
     timeout=210,
     retries=3,
     memory=512,  # [INIT-04] Added memory config
+    min_containers=WORKER_MIN_CONTAINERS,  # [PERF-47]
+    scaledown_window=WORKER_SCALEDOWN_WINDOW,  # [PERF-47]
 )
-def generate_manager_insights(analysis_data: Dict[str, Any], restaurant_name: str) -> Dict[str, Any]:
-    """Generate MANAGER insights - uses anthropic-manager key."""
-    from anthropic import Anthropic
-    import os
-    import time as time_module
-    
-    role = "manager"
-    print(f"🧠 [MANAGER-KEY] Generating {role} insights...")
-    
-    # [API-01] Check for API key
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        print(f"❌ ANTHROPIC_API_KEY not found for {role} insights!")
-        return {"role": role, "insights": _fallback_insights(role)}
-    
-    client = Anthropic(api_key=api_key)
-    
-    menu_items = analysis_data.get('menu_analysis', {}).get('food_items', [])[:20]
-    drinks = analysis_data.get('menu_analysis', {}).get('drinks', [])[:10]
-    aspects = analysis_data.get('aspect_analysis', {}).get('aspects', [])[:20]
-    
-    # [INS-02] Use centralized threshold for formatting
-    menu_lines = ["TOP MENU ITEMS:"]
-    for item in menu_items:
-        s = item.get('sentiment', 0)
-        indicator = "[+]" if s >= SENTIMENT_THRESHOLD_POSITIVE else "[~]" if s >= SENTIMENT_THRESHOLD_NEGATIVE else "[-]"
-        menu_lines.append(f"  {indicator} {item.get('name', '?')}: sentiment {s:+.2f}, {item.get('mention_count', 0)} mentions")
-    menu_summary = "\n".join(menu_lines)
-    
-    aspect_lines = ["TOP ASPECTS:"]
-    for a in aspects:
-        s = a.get('sentiment', 0)
-        indicator = "[+]" if s >= SENTIMENT_THRESHOLD_POSITIVE else "[~]" if s >= SENTIMENT_THRESHOLD_NEGATIVE else "[-]"
-        aspect_lines.append(f"  {indicator} {a.get('name', '?')}: sentiment {s:+.2f}, {a.get('mention_count', 0)} mentions")
-    aspect_summary = "\n".join(aspect_lines)
-    
-    focus = "Focus on: Service, staff, wait times, ambience, value, cleanliness"
-    topic_filter = "ONLY on operations/service topics"
-    
-    # [INS-02] Use centralized threshold in prompt
-    prompt = f"""You are an expert restaurant consultant analyzing feedback for {restaurant_name}.
-
-{menu_summary}
-
-{aspect_summary}
-
-SENTIMENT SCALE:
-- POSITIVE (>= {SENTIMENT_THRESHOLD_POSITIVE}): Highlight as STRENGTH
-- NEUTRAL ({SENTIMENT_THRESHOLD_NEGATIVE} to {SENTIMENT_THRESHOLD_POSITIVE - 0.01}): Room for improvement
-- NEGATIVE (< {SENTIMENT_THRESHOLD_NEGATIVE}): Flag as CONCERN
-
-YOUR TASK: Generate insights for the RESTAURANT MANAGER.
-{focus}
-
-RULES:
-1. Focus {topic_filter}
-2. STRENGTHS from items with sentiment >= {SENTIMENT_THRESHOLD_POSITIVE}
-3. CONCERNS from items with sentiment < {SENTIMENT_THRESHOLD_NEGATIVE}
-4. Output ONLY valid JSON
+def generate_chef_insights(insights_context: str) -> Dict[str, Any]:
+    """Generate CHEF insights - uses anthropic-chef key."""
+    return generate_insights("chef", insights_context, "CHEF-KEY")
 
-OUTPUT:
-{{
-  "summary": "2-3 sentence executive summary",
-  "strengths": ["strength 1", "strength 2", "strength 3", "strength 4", "strength 5"],
-  "concerns": ["concern 1", "concern 2", "concern 3"],
-  "recommendations": [
-    {{"priority": "high", "action": "action", "reason": "why", "evidence": "data"}},
-    {{"priority": "medium", "action": "action", "reason": "why", "evidence": "data"}},
-    {{"priority": "low", "action": "action", "reason": "why", "evidence": "data"}}
-  ]
-}}
 
-Generate {role} insights:"""
+# ============================================================================
+# MANAGER INSIGHTS (uses anthropic-manager key)
+# ============================================================================
 
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            print(f"🔄 Calling API for {role} insights (attempt {attempt + 1}/{max_retries})...")
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=2000,
-                temperature=0.4,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            result_text = response.content[0].text.strip()
-            print(f"📝 {role} raw response length: {len(result_text)} chars")
-            
-            result_text = result_text.replace('```json', '').replace('```', '').strip()
-            
-            match = re.search(r'\{[\s\S]*\}', result_text)
-            if match:
-                try:
-                    insights = json.loads(match.group())
-                    if 'summary' in insights and 'strengths' in insights:
-                        print(f"✅ {role.title()} insights generated successfully")
-                        return {"role": role, "insights": insights}
-                    else:
-                        print(f"⚠️ {role} insights missing required fields")
-                        return {"role": role, "insights": _fallback_insights(role)}
-                except json.JSONDecodeError as je:
-                    print(f"⚠️ {role} JSON parse error: {je}")
-                    return {"role": role, "insights": _fallback_insights(role)}
-            else:
-                print(f"⚠️ No JSON found in {role} response")
-                return {"role": role, "insights": _fallback_insights(role)}
-                
-        except Exception as e:
-            error_str = str(e)
-            if '529' in error_str or 'overloaded' in error_str.lower() or '429' in error_str or 'rate' in error_str.lower():
-                if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 5
-                    print(f"⚠️ API overloaded for {role}, waiting {wait_time}s before retry...")
-                    time_module.sleep(wait_time)
-                    continue
-                else:
-                    print(f"❌ API still overloaded after {max_retries} retries for {role}")
-                    return {"role": role, "insights": _fallback_insights(role)}
-            else:
-                print(f"❌ Error generating {role} insights: {e}")
-                return {"role": role, "insights": _fallback_insights(role)}
-    
-    return {"role": role, "insights": _fallback_insights(role)}
+@app.function(
+    image=api_image,
+    secrets=[modal.Secret.from_name("anthropic-manager")],
+    timeout=210,
+    retries=3,
+    memory=512,  # [INIT-04] Added memory config
+    min_containers=WORKER_MIN_CONTAINERS,  # [PERF-47]
+    scaledown_window=WORKER_SCALEDOWN_WINDOW,  # [PERF-47]
+)
+def generate_manager_insights(insights_context: str) -> Dict[str, Any]:
+    """Generate MANAGER insights - uses anthropic-manager key."""
+    return generate_insights("manager", insights_context, "MANAGER-KEY")
 
 
 def _fallback_insights(role: str) -> Dict[str, Any]:
@@ -685,10 +946,12 @@ def _fallback_insights(role: str) -> Dict[str, Any]:
 # ============================================================================
 
 @app.function(
-    image=image,
+    image=api_image,
     secrets=[modal.Secret.from_name("anthropic-summaries")],
     timeout=210,
     memory=512,  # [INIT-04] Added memory config
+    min_containers=WORKER_MIN_CONTAINERS,  # [PERF-47]
+    scaledown_window=WORKER_SCALEDOWN_WINDOW,  # [PERF-47]
 )
 def generate_all_summaries(
     food_items: List[Dict[str, Any]],
@@ -697,7 +960,6 @@ def generate_all_summaries(
     restaurant_name: str
 ) -> Dict[str, Dict[str, str]]:
     """Generate ALL summaries in a SINGLE API call - uses anthropic-summaries key."""
-    from anthropic import Anthropic
     import os
     
     print(f"📝 [SUMMARIES-KEY] Generating all summaries...")
@@ -708,118 +970,518 @@ def generate_all_summaries(
         print("❌ ANTHROPIC_API_KEY not found for summary generation!")
         return {"food": {}, "drinks": {}, "aspects": {}}
     
-    client = Anthropic(api_key=api_key)
+    client = anthropic_client(api_key)  # [PERF-39]
+    
+    # Build prompt
+    food_list_str = "\n".join([f"- {f.get('name', '?')} (sentiment: {f.get('sentiment', 0):.2f}, mentions: {f.get('mention_count', 0)})" for f in food_items])
+    drinks_list_str = "\n".join([f"- {d.get('name', '?')} (sentiment: {d.get('sentiment', 0):.2f}, mentions: {d.get('mention_count', 0)})" for d in drinks])
+    aspects_list_str = "\n".join([f"- {a.get('name', '?')} (sentiment: {a.get('sentiment', 0):.2f}, mentions: {a.get('mention_count', 0)})" for a in aspects])
+    
+    # [PERF-26] Static instructions live in SUMMARIES_SYSTEM_PROMPT (prompt-cached)
+    user_content = f"""Restaurant: {restaurant_name}
+
+FOOD ITEMS:
+{food_list_str}
+
+DRINKS:
+{drinks_list_str}
+
+ASPECTS:
+{aspects_list_str}"""
+
+    try:
+        response = client.messages.create(
+            model="claude-sonnet-4-20250514",
+            max_tokens=SUMMARIES_MAX_TOKENS,  # [PERF-35]
+            temperature=0.4,
+            system=cached_system(SUMMARIES_SYSTEM_PROMPT),
+            messages=[{"role": "user", "content": user_content}]
+        )
+        log_usage("Summaries", response)
+        
+        summaries = parse_json_object(response.content[0].text)  # [PERF-28]
+        print(f"✅ Generated summaries: {len(summaries.get('food', {}))} food, {len(summaries.get('drinks', {}))} drinks, {len(summaries.get('aspects', {}))} aspects")
+        return summaries
+            
+    except Exception as e:
+        print(f"⚠️ Summary generation error: {e}")
+        return {"food": {}, "drinks": {}, "aspects": {}}
+
+
+# ============================================================================
+# [PERF-03] SCRAPING - single URL + parallel multi-URL batch
+# ============================================================================
+
+class BrowserPool:
+    """
+    [PERF-06] Warm Chromium drivers, one per platform, reused across calls.
+    
+    Each platform's driver is launched with that scraper's own options
+    (launch_browser), so OpenTable keeps eager loads and Google Maps its
+    anti-detection setup.
+    """
+    
+    PLATFORMS = ("opentable", "google_maps")
+    
+    def __init__(self):
+        self.drivers: Dict[str, Any] = {}
+    
+    def warm(self):
+        for platform in self.PLATFORMS:
+            self.get(platform)
+    
+    def get(self, platform: str):
+        """Return a live driver for the platform, relaunching it if it died (None on failure)."""
+        driver = self.drivers.get(platform)
+        if driver is not None:
+            try:
+                _ = driver.current_url  # Cheap liveness check
+                return driver
+            except Exception:
+                print(f"⚠️ Warm {platform} browser died - relaunching")
+                self.discard(platform)
+        
+        try:
+            self.drivers[platform] = load_scraper(platform).launch_browser(headless=True)
+            print(f"🌐 Launched {platform} browser")
+        except Exception as e:
+            # The scraper will try its own launch and report a clean error
+            print(f"⚠️ Could not launch {platform} browser: {e}")
+            self.drivers[platform] = None
+        return self.drivers[platform]
+    
+    def discard(self, platform: str):
+        driver = self.drivers.pop(platform, None)
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
     
-    # Build prompt
-    food_list_str = "\n".join([f"- {f.get('name', '?')} (sentiment: {f.get('sentiment', 0):.2f}, mentions: {f.get('mention_count', 0)})" for f in food_items])
-    drinks_list_str = "\n".join([f"- {d.get('name', '?')} (sentiment: {d.get('sentiment', 0):.2f}, mentions: {d.get('mention_count', 0)})" for d in drinks])
-    aspects_list_str = "\n".join([f"- {a.get('name', '?')} (sentiment: {a.get('sentiment', 0):.2f}, mentions: {a.get('mention_count', 0)})" for a in aspects])
+    def close_all(self):
+        for platform in list(self.drivers):
+            self.discard(platform)
+
+
+def scrape_with_pool(browsers: Optional["BrowserPool"], platform: str, url: str, max_reviews: int, **kwargs) -> Dict[str, Any]:
+    """
+    Scrape on a warm browser from `browsers` (or a fresh one if None).
     
-    # [INS-02] Use centralized threshold in prompt
-    prompt = f"""Generate brief 2-3 sentence summaries for each item at {restaurant_name}.
+    A browser whose scrape raised is discarded so the next call relaunches it.
+    """
+    driver = browsers.get(platform) if browsers is not None else None
+    try:
+        return scrape_platform(platform, url, max_reviews, driver=driver, **kwargs)
+    except Exception:
+        if browsers is not None:
+            browsers.discard(platform)  # Don't hand a broken browser to the next request
+        raise
 
-FOOD ITEMS:
-{food_list_str}
 
-DRINKS:
-{drinks_list_str}
+@app.cls(
+    image=image,
+    timeout=900,
+    memory=2048,  # [INIT-04] Two warm Chromium instances (OpenTable + Google Maps)
+    max_containers=SCRAPE_MAX_CONCURRENCY,
+    scaledown_window=300,  # [PERF-06] Keep browsers warm between bursts
+)
+class Scraper:
+    """
+    [PERF-06] Scraper with warm browsers reused across calls on the same container.
+    
+    Only the first request on a container pays Chromium startup.
+    """
+    
+    @modal.enter()
+    def open_browsers(self):
+        self.browsers = BrowserPool()
+        self.browsers.warm()
+    
+    @modal.exit()
+    def close_browsers(self):
+        self.browsers.close_all()
+    
+    @modal.method()
+    def scrape(self, url: str, max_reviews: int = 100) -> Dict[str, Any]:
+        """Scrape one OpenTable / Google Maps URL (no Claude calls)."""
+        import time
+        start_time = time.time()
+        
+        platform = detect_platform(url)
+        if platform == "unknown":
+            return {"success": False, "url": url, "error": "Unsupported platform. Use OpenTable or Google Maps."}
+        
+        print(f"📥 Scraping {platform}: {url}")
+        try:
+            result = scrape_with_pool(self.browsers, platform, url, max_reviews)
+        except Exception as e:
+            print(f"❌ Scrape failed for {url}: {e}")
+            return {"success": False, "url": url, "platform": platform, "error": str(e)}
+        
+        result["url"] = url
+        result["platform"] = platform
+        print(f"✅ Scraped {result.get('total_reviews', 0)} reviews in {time.time() - start_time:.1f}s")
+        return result
 
-ASPECTS:
-{aspects_list_str}
 
-For each summary:
-1. Synthesizes what customers say
-2. Reflects the sentiment score (positive if >= {SENTIMENT_THRESHOLD_POSITIVE}, negative if < {SENTIMENT_THRESHOLD_NEGATIVE}, neutral otherwise)
-3. Gives actionable insight for restaurant staff
+@app.function(image=api_image, timeout=900)
+def scrape_restaurant_batch(urls: List[str], max_reviews: int = 100) -> List[Dict[str, Any]]:
+    """
+    Scrape several URLs in parallel.
+    
+    Fans out over Scraper containers (at most SCRAPE_MAX_CONCURRENCY at once),
+    so N restaurants cost roughly one scrape of wall-clock time.
+    """
+    print(f"🚀 Batch scraping {len(urls)} URLs (max {SCRAPE_MAX_CONCURRENCY} concurrent)")
+    
+    results = []
+    for url, result in zip(urls, Scraper().scrape.map(urls, kwargs={"max_reviews": max_reviews}, return_exceptions=True)):
+        if isinstance(result, Exception):
+            result = {"success": False, "url": url, "error": str(result)}
+        results.append(result)
+    
+    print(f"✅ Batch scrape complete: {sum(1 for r in results if r.get('success'))}/{len(urls)} succeeded")
+    return results
 
-OUTPUT FORMAT (JSON):
-{{
-  "food": {{
-    "item name": "2-3 sentence summary based on reviews...",
-    "another item": "summary..."
-  }},
-  "drinks": {{
-    "drink name": "summary..."
-  }},
-  "aspects": {{
-    "aspect name": "summary..."
-  }}
-}}
 
-CRITICAL: Output ONLY valid JSON. Generate summaries for ALL items listed above."""
+# ============================================================================
+# [PERF-02] STREAMING BATCH DISPATCH - overlap scraping with extraction
+# ============================================================================
 
-    try:
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4000,
-            temperature=0.4,
-            messages=[{"role": "user", "content": prompt}]
-        )
+class StreamingBatchDispatcher:
+    """
+    Spawns extraction batches while the scraper is still running.
+    
+    The scraper hands over each page of review texts (reviews_callback);
+    every BATCH_SIZE raw reviews are cleaned and spawned on the odd/even
+    batch processors immediately, so Claude works while Selenium scrolls.
+    [PERF-43] A batch is also cut early once it reaches BATCH_MAX_CHARS of text.
+    
+    [PERF-01] With `hold_if_head` (the first-batch fingerprint of the last
+    cached analysis), a matching first batch switches the dispatcher to
+    holding: reviews are still cleaned as they stream, but no batch is spawned
+    until the content cache has been checked. A hit then costs no extraction
+    calls at all; a miss spawns the held batches from results().
+    """
+    
+    def __init__(self, restaurant_name: str, batch_size: int = BATCH_SIZE, max_chars: int = BATCH_MAX_CHARS,
+                 hold_if_head: Optional[str] = None):
+        self.restaurant_name = restaurant_name
+        self.batch_size = batch_size
+        self.max_chars = max_chars
+        self.reviews: List[str] = []   # Cleaned reviews, in review_index order
+        self.received = 0              # Raw texts received so far
+        self._pending: List[str] = []
+        self._dedup = None             # [PERF-30] DuplicateIndex shared by all chunks
+        self._calls = []
+        self._batch_num = 1
+        self.head: Optional[str] = None  # [PERF-01] Fingerprint of the first raw batch
+        self._hold_if_head = hold_if_head
+        self._held = []                  # [PERF-01] (processor, batch_data) not yet spawned
+        self._holding = False
+    
+    def add(self, texts: List[str]) -> None:
+        """Accept raw review texts; dispatch every full batch."""
+        self.received += len(texts)
+        self._pending.extend(texts)
+        while True:
+            size = self._full_batch_size()
+            if not size:
+                break
+            chunk = self._pending[:size]
+            self._pending = self._pending[size:]
+            self._dispatch(chunk)
+    
+    def _full_batch_size(self) -> int:
+        """[PERF-43] Size of the next batch if it is full (batch_size reviews or max_chars of text), else 0."""
+        chars = 0
+        for i, text in enumerate(self._pending[:self.batch_size]):
+            chars += len(text or "")
+            if chars >= self.max_chars:
+                return i + 1
+        return self.batch_size if len(self._pending) >= self.batch_size else 0
+    
+    def finish(self, all_texts: List[str]) -> List[str]:
+        """Dispatch anything not yet streamed (plus the tail) and return cleaned reviews."""
+        if len(all_texts) > self.received:
+            self.add(all_texts[self.received:])
+        if self._pending:
+            self._dispatch(self._pending)
+            self._pending = []
+        return self.reviews
+    
+    def _dispatch(self, raw_chunk: List[str]) -> None:
+        from src.data_processing import clean_reviews_for_ai, DuplicateIndex
+        
+        # [PERF-01] Same first batch as the cached run -> likely a content-cache hit
+        if self.head is None:
+            self.head = batch_fingerprint(raw_chunk)
+            if self._hold_if_head and self.head == self._hold_if_head:
+                self._holding = True
+                print("⏸️ First batch matches the last cached run - holding extraction until the cache check")
         
-        result_text = response.content[0].text.strip()
-        result_text = result_text.replace('```json', '').replace('```', '').strip()
+        # [PERF-30] One index across chunks: exact and near-duplicates of reviews
+        # already sent are dropped before they reach Claude
+        if self._dedup is None:
+            self._dedup = DuplicateIndex()
+        cleaned = clean_reviews_for_ai(raw_chunk, verbose=False, dedup_index=self._dedup)
+        if not cleaned:
+            return
+        
+        start_index = len(self.reviews)
+        self.reviews.extend(cleaned)
+        
+        # [PERF-45] Short reviews without sentiment words keep their review_index
+        # (stats, cache key) but are not sent to Claude
+        sent = [(start_index + i, review) for i, review in enumerate(cleaned) if is_informative(review)]
+        if not sent:
+            return
+        
+        batch_data = {
+            "reviews": [review for _, review in sent],
+            "restaurant_name": self.restaurant_name,
+            "batch_index": self._batch_num,
+            "start_index": start_index,
+            "review_indices": [index for index, _ in sent]
+        }
         
-        match = re.search(r'\{[\s\S]*\}', result_text)
-        if match:
-            summaries = json.loads(match.group())
-            print(f"✅ Generated summaries: {len(summaries.get('food', {}))} food, {len(summaries.get('drinks', {}))} drinks, {len(summaries.get('aspects', {}))} aspects")
-            return summaries
+        # Split odd/even for different API keys
+        processor = process_batch_odd if self._batch_num % 2 == 1 else process_batch_even
+        skipped = len(cleaned) - len(sent)
+        if self._holding:
+            self._held.append((processor, batch_data))
+            print(f"⏸️ Held batch {self._batch_num} ({len(sent)} reviews, {skipped} skipped as uninformative)")
         else:
-            print("⚠️ No JSON found in summary response")
-            return {"food": {}, "drinks": {}, "aspects": {}}
-            
-    except Exception as e:
-        print(f"⚠️ Summary generation error: {e}")
-        return {"food": {}, "drinks": {}, "aspects": {}}
+            self._calls.append(processor.spawn(batch_data))
+            print(f"📤 Dispatched batch {self._batch_num} ({len(sent)} reviews, {skipped} skipped as uninformative) while scraping")
+        self._batch_num += 1
+    
+    def release(self) -> None:
+        """[PERF-01] Spawn held batches (content cache missed) and stop holding."""
+        if self._held:
+            print(f"▶️ Content changed - spawning {len(self._held)} held batches")
+        for processor, batch_data in self._held:
+            self._calls.append(processor.spawn(batch_data))
+        self._held = []
+        self._holding = False
+    
+    def results(self) -> List[Dict[str, Any]]:
+        """Wait for every dispatched batch (held batches are spawned first)."""
+        self.release()
+        results = []
+        for call in self._calls:
+            try:
+                results.append(call.get())
+            except Exception as e:
+                print(f"❌ Batch call failed: {e}")
+                results.append({"success": False, "data": {"food_items": [], "drinks": [], "aspects": []}})
+        return results
+    
+    def cancel(self) -> None:
+        """Cancel in-flight batches (e.g. cache hit or scrape failure)."""
+        for call in self._calls:
+            try:
+                call.cancel()
+            except Exception:
+                pass
+        self._calls = []
+        self._held = []
 
 
 # ============================================================================
 # MAIN ANALYSIS FUNCTION - PARALLEL OPTIMIZED WITH MULTI-KEY
 # ============================================================================
 
-@app.function(
+@app.cls(
     image=image,
     secrets=[modal.Secret.from_name("anthropic-batch1")],  # Fallback for scraper
     timeout=2100,  # [API-06] Increased timeout
-    memory=1024,  # [INIT-04] Added memory config for main function
+    memory=2048,  # [INIT-04] Pipeline + two warm Chromium instances
+    scaledown_window=600,  # [PERF-14] Keep warm between analyses
 )
-def full_analysis_parallel(url: str, max_reviews: int = 100) -> Dict[str, Any]:
+class Analyzer:
+    """
+    [PERF-14] Long-lived analysis worker.
+    
+    Per-container setup (browsers, pipeline imports) happens once in
+    @modal.enter instead of on every analysis.
+    """
+    
+    @modal.enter()
+    def setup(self):
+        importlib.import_module("src.data_processing")  # Warm imports before the first request
+        self.browsers = BrowserPool()
+        self.browsers.warm()
+    
+    @modal.exit()
+    def teardown(self):
+        self.browsers.close_all()
+    
+    @modal.method()
+    def full_analysis(self, url: str, max_reviews: int = 100, force_refresh: bool = False) -> Dict[str, Any]:
+        return full_analysis_parallel(url, max_reviews, browsers=self.browsers, force_refresh=force_refresh)
+
+
+def build_trend_data(records: List[Dict[str, Any]]):
+    """
+    [PERF-09] One pass over the records builds trend_data AND the text list
+    for the dispatcher (same order as streamed, so the tail offset lines up).
+    
+    [PERF-24] trend_data is columnar - {"date": [...], "rating": [...], "sentiment": [...]} -
+    three lists of primitives instead of one dict per review (smaller in memory and on the wire).
+    
+    Returns:
+        (trend_data, review_texts, estimated_rating_count)
+    """
+    dates, ratings, sentiments = [], [], []
+    review_texts = []
+    estimated_rating_count = 0  # [PROC-05] Track estimated ratings
+    
+    for record in records:
+        text = record['review_text']
+        review_texts.append(text)
+        sentiment = calculate_sentiment(text)
+        rating = record['overall_rating']
+        
+        # [PROC-05] If no rating extracted, estimate from sentiment and LOG IT
+        if rating == 0 and sentiment != 0:
+            rating = round((sentiment + 1) * 2 + 1, 1)  # -1→1, 0→3, 1→5
+            estimated_rating_count += 1
+        
+        dates.append(record['date'])
+        ratings.append(rating)
+        sentiments.append(sentiment)
+    
+    trend_data = {"date": dates, "rating": ratings, "sentiment": sentiments}
+    return trend_data, review_texts, estimated_rating_count
+
+
+def merge_batch_items(
+    batch_results: List[Dict[str, Any]],
+    field: str,
+    reviews: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    [PERF-29] Merge one field ('food_items' / 'drinks' / 'aspects') across batches.
+    
+    Same name ([INS-03] [PERF-34] already normalized by the batch processors) -> mention counts summed,
+    [INS-05] related_reviews appended, sentiment = mention-weighted mean.
+    Keeps running sums and divides once per name instead of re-averaging
+    on every duplicate.
+    
+    [PERF-33] related_reviews are keyed by review_index while merging, so a
+    review listed twice for one item (repeated index, or two spellings of the
+    name in one batch) is kept once.
+    
+    [PERF-42] Workers return indices only; with `reviews` (the cleaned
+    reviews, in review_index order) each kept entry gets its review_text here.
+    
+    Returns:
+        Merged items, most mentioned first
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    weighted: Dict[str, float] = {}  # name -> sum(sentiment * mention_count), for names seen 2+ times
+    related: Dict[str, Dict[Any, Dict[str, Any]]] = {}  # name -> {review_index: review}
+    
+    for batch_result in batch_results:
+        if not batch_result.get("success"):
+            continue
+        for item in (batch_result.get("data") or {}).get(field) or []:
+            if not isinstance(item, dict):
+                continue
+            name = item.get('name', '')
+            if not name or not isinstance(name, str):
+                continue
+            by_index = related.get(name)
+            if by_index is None:
+                merged[name] = item
+                by_index = related[name] = {}
+            else:
+                entry = merged[name]
+                if name not in weighted:
+                    weighted[name] = entry.get('sentiment', 0) * entry.get('mention_count', 1)
+                    entry['mention_count'] = entry.get('mention_count', 1)
+                count = item.get('mention_count', 1)
+                entry['mention_count'] += count
+                weighted[name] += item.get('sentiment', 0) * count
+            for review in item.get('related_reviews') or []:
+                if isinstance(review, dict) and type(review.get('review_index')) is int:
+                    by_index.setdefault(review['review_index'], review)
+    
+    for name, total in weighted.items():
+        entry = merged[name]
+        if entry['mention_count'] > 0:
+            entry['sentiment'] = total / entry['mention_count']
+    
+    for name, entry in merged.items():
+        entry['related_reviews'] = list(related[name].values())
+        if reviews is not None:
+            for review in entry['related_reviews']:
+                if 'review_text' not in review:
+                    review['review_text'] = reviews[review['review_index']]
+    
+    return sorted(merged.values(), key=lambda x: x.get('mention_count', 0), reverse=True)
+
+
+def full_analysis_parallel(
+    url: str,
+    max_reviews: int = 100,
+    browsers: Optional[BrowserPool] = None,
+    force_refresh: bool = False
+) -> Dict[str, Any]:
     """
     PARALLEL OPTIMIZED analysis pipeline with MULTI-KEY support.
     
+    Runs inside Analyzer.full_analysis; `browsers` supplies warm drivers.
+    
     Uses different API keys for different tasks:
     - Odd batches: anthropic-batch1
     - Even batches: anthropic-batch2
     - Chef insights: anthropic-chef
     - Manager insights: anthropic-manager
     - Summaries: anthropic-summaries
+    
+    [PERF-55] force_refresh skips every cache read (recent analysis, unchanged
+    reviews, item summaries); the fresh result still refreshes the caches.
     """
     import time
-    import pandas as pd
     start_time = time.time()
     
     print(f"🚀 Starting MULTI-KEY PARALLEL analysis for {url}")
     print(f"📊 Max reviews: {max_reviews}")
     
     # Detect platform
-    url_lower = url.lower()
-    platform = "opentable" if 'opentable' in url_lower else "google_maps" if any(x in url_lower for x in ['google.com/maps', 'goo.gl/maps', 'maps.google', 'maps.app.goo.gl']) else "unknown"
+    platform = detect_platform(url)
     
     if platform == "unknown":
         return {"success": False, "error": "Unsupported platform. Use OpenTable or Google Maps."}
     
-    # Phase 1: Scrape reviews
-    print("📥 Phase 1: Scraping reviews...")
+    # [PERF-20] Same request analyzed recently -> skip the scrape entirely
+    recent = None if force_refresh else get_recent_analysis(url, max_reviews)
+    if recent is not None:
+        print(f"⚡ [CACHE] Analyzed within the last {ANALYSIS_CACHE_TTL}s - reusing result")
+        report_progress("complete", "Served from cache")
+        return recent
+    
+    # Extract restaurant name
+    restaurant_name = restaurant_name_from_url(url)
+    
+    # Phase 1: Scrape reviews ([PERF-02] Phase 2 batches start as pages arrive)
+    print("📥 Phase 1: Scraping reviews (streaming batches to extraction)...")
+    report_progress("scraping", f"Scraping {platform} reviews")
     scrape_start = time.time()
+    # [PERF-01] Hold extraction if the first batch matches the last cached run
+    hold_if_head = None if force_refresh else get_cached_head(url)
+    dispatcher = StreamingBatchDispatcher(restaurant_name, hold_if_head=hold_if_head)
     
-    if platform == "opentable":
-        from src.scrapers.opentable_scraper import scrape_opentable
-        result = scrape_opentable(url=url, max_reviews=max_reviews, headless=True)
-    else:
-        from src.scrapers.google_maps_scraper import scrape_google_maps
-        result = scrape_google_maps(url=url, max_reviews=max_reviews, headless=True)
+    try:
+        result = scrape_with_pool(browsers, platform, url, max_reviews, reviews_callback=dispatcher.add)  # [PERF-14]
+    except Exception:
+        dispatcher.cancel()
+        raise
     
     if not result.get("success"):
+        dispatcher.cancel()
         return {"success": False, "error": result.get("error", "Scraping failed")}
     
     print(f"✅ Scraping complete in {time.time() - scrape_start:.1f}s")
@@ -827,293 +1489,154 @@ def full_analysis_parallel(url: str, max_reviews: int = 100) -> Dict[str, Any]:
     
     # =========================================================================
     # [FMT-01][PROC-01] SIMPLIFIED: Both scrapers now return NESTED format
+    # [PERF-13] Plain records via process_reviews(to_dataframe=False) - no pandas
     # =========================================================================
-    from src.data_processing import clean_reviews_for_ai
-    
-    reviews_data = result.get('reviews', {})
-    print(f"📦 reviews_data type: {type(reviews_data)}")
-    
-    # Both OpenTable and Google Maps now return nested format:
-    # {'reviews': {'names': [...], 'dates': [...], 'review_texts': [...], ...}}
-    if isinstance(reviews_data, dict) and 'review_texts' in reviews_data:
-        print(f"📋 Detected NESTED format (source: {platform})")
-        review_texts = reviews_data.get('review_texts', [])
-        n = len(review_texts)
-        
-        if n == 0:
-            return {"success": False, "error": "No reviews found in response."}
-        
-        df = pd.DataFrame({
-            'name': (reviews_data.get('names', []) + [''] * n)[:n],
-            'date': (reviews_data.get('dates', []) + [''] * n)[:n],
-            'overall_rating': (reviews_data.get('overall_ratings', []) + [0.0] * n)[:n],
-            'food_rating': reviews_data.get('food_ratings', [0.0] * n)[:n],
-            'service_rating': reviews_data.get('service_ratings', [0.0] * n)[:n],
-            'ambience_rating': reviews_data.get('ambience_ratings', [0.0] * n)[:n],
-            'review_text': review_texts
-        })
-        print(f"✅ Built DataFrame: {len(df)} reviews")
-    
-    # Fallback for legacy flat format (shouldn't happen with updated scrapers)
-    elif 'names' in result and isinstance(result.get('names'), list):
-        print("📋 Detected LEGACY flat format - using fallback")
-        review_texts = result.get('reviews', result.get('review_texts', []))
-        n = len(review_texts) if isinstance(review_texts, list) else 0
-        
-        if n == 0:
-            return {"success": False, "error": "No reviews found in legacy format response."}
-        
-        df = pd.DataFrame({
-            'name': (result.get('names', []) + [''] * n)[:n],
-            'date': (result.get('dates', []) + [''] * n)[:n],
-            'overall_rating': (result.get('overall_ratings', []) + [0.0] * n)[:n],
-            'food_rating': (result.get('food_ratings', []) + [0.0] * n)[:n],
-            'service_rating': (result.get('service_ratings', []) + [0.0] * n)[:n],
-            'ambience_rating': (result.get('ambience_ratings', []) + [0.0] * n)[:n],
-            'review_text': review_texts
-        })
-        print(f"✅ Built DataFrame from legacy format: {len(df)} reviews")
+    from src.data_processing import process_reviews
     
-    else:
-        return {"success": False, "error": "Could not parse reviews - unexpected format."}
+    try:
+        records = process_reviews(result, to_dataframe=False)
+    except ValueError as e:
+        dispatcher.cancel()
+        return {"success": False, "error": f"Could not parse reviews: {e}"}
     
     # Validate we got something
-    if df is None or len(df) == 0:
+    if not records:
+        dispatcher.cancel()
         return {"success": False, "error": "No reviews found. The restaurant may have no reviews or the scraper couldn't access them."}
     
-    # =========================================================================
-    # Convert ratings to numeric
-    # =========================================================================
-    def parse_rating(val):
-        """Convert rating to numeric."""
-        if pd.isna(val) or val == '' or val is None:
-            return 0.0
-        
-        try:
-            num = float(val)
-            if 0 <= num <= 5:
-                return num
-        except (ValueError, TypeError):
-            pass
-        
-        text_map = {
-            'excellent': 5.0, 'very good': 4.5, 'good': 4.0,
-            'average': 3.0, 'below average': 2.0, 'poor': 1.0, 'terrible': 1.0,
-            '5': 5.0, '4': 4.0, '3': 3.0, '2': 2.0, '1': 1.0,
-        }
-        
-        val_str = str(val).lower().strip()
-        for key, num in text_map.items():
-            if key in val_str:
-                return num
-        
-        return 0.0
-    
-    for col in ['overall_rating', 'food_rating', 'service_rating', 'ambience_rating']:
-        if col in df.columns:
-            df[col] = df[col].apply(parse_rating)
-    
-    # Get clean review texts
-    reviews = clean_reviews_for_ai(df["review_text"].dropna().tolist(), verbose=False)
-    
-    print(f"📊 Total clean reviews: {len(reviews)}")
-    
     # Debug ratings
-    valid_ratings = df['overall_rating'][df['overall_rating'] > 0]
-    print(f"📊 Valid ratings: {len(valid_ratings)} out of {len(df)} reviews")
-    if len(valid_ratings) > 0:
-        print(f"📊 Rating range: {valid_ratings.min():.1f} to {valid_ratings.max():.1f}, avg: {valid_ratings.mean():.2f}")
+    valid_ratings = [r['overall_rating'] for r in records if r['overall_rating'] > 0]
+    print(f"📊 Valid ratings: {len(valid_ratings)} out of {len(records)} reviews")
+    if valid_ratings:
+        print(f"📊 Rating range: {min(valid_ratings):.1f} to {max(valid_ratings):.1f}, avg: {sum(valid_ratings) / len(valid_ratings):.2f}")
     
     # =========================================================================
     # Create trend_data with proper date handling
     # =========================================================================
-    trend_data = []
-    estimated_rating_count = 0  # [PROC-05] Track estimated ratings
+    trend_data, review_texts, estimated_rating_count = build_trend_data(records)
     
-    for _, row in df.iterrows():
-        text = str(row.get("review_text", ""))
-        rating = float(row.get("overall_rating", 0) or 0)
-        sentiment = calculate_sentiment(text)
-        
-        # [PROC-05] If no rating extracted, estimate from sentiment and LOG IT
-        if rating == 0 and sentiment != 0:
-            rating = round((sentiment + 1) * 2 + 1, 1)  # -1→1, 0→3, 1→5
-            estimated_rating_count += 1
-        
-        date_val = row.get("date", "")
-        if pd.isna(date_val):
-            date_val = ""
-        else:
-            date_val = str(date_val).strip()
-        
-        trend_data.append({
-            "date": date_val,
-            "rating": rating,
-            "sentiment": sentiment
-        })
+    # [PERF-02] Dispatch the tail batch; reviews = cleaned texts in review_index order
+    reviews = dispatcher.finish(review_texts)
+    
+    print(f"📊 Total clean reviews: {len(reviews)}")
     
     # [PROC-05] Log estimated ratings
     if estimated_rating_count > 0:
         print(f"📊 Estimated {estimated_rating_count} ratings from sentiment (no rating extracted from page)")
     
-    print(f"📊 Trend data points: {len(trend_data)}")
-    if trend_data:
-        sample_dates = [t['date'] for t in trend_data[:5]]
+    print(f"📊 Trend data points: {len(trend_data['date'])}")
+    if trend_data['date']:
+        sample_dates = trend_data['date'][:5]
         print(f"📊 Sample dates: {sample_dates}")
     
-    # Extract restaurant name
-    if platform == "opentable":
-        restaurant_name = url.split("/")[-1].split("?")[0].replace("-", " ").title()
-    else:
-        if '/place/' in url:
-            restaurant_name = url.split('/place/')[1].split('/')[0].replace('+', ' ').replace('%20', ' ')
-        else:
-            restaurant_name = "Restaurant"
+    # [PERF-01] Same URL + same reviews -> reuse the previous analysis
+    cache_key = content_cache_key(url, reviews)
+    try:
+        cached = None if force_refresh else ANALYSIS_CACHE.get(cache_key)
+    except Exception as e:
+        print(f"⚠️ Analysis cache unavailable: {e}")
+        cached = None
+    if cached:
+        dispatcher.cancel()
+        print(f"⚡ [CACHE] Reviews unchanged since last analysis - skipping Claude ({time.time() - start_time:.1f}s)")
+        store_recent_analysis(url, max_reviews, cached)
+        return cached
     
     # Phase 2: PARALLEL batch extraction with MULTI-KEY
+    # [PERF-02] Batches were spawned during scraping (odd -> batch1 key, even -> batch2 key)
     print("🔄 Phase 2: PARALLEL batch extraction (MULTI-KEY)...")
+    report_progress("extracting", f"Extracting menu items and aspects from {len(reviews)} reviews")
     extract_start = time.time()
     
-    BATCH_SIZE = 30
-    odd_batches = []
-    even_batches = []
-    
-    batch_num = 1
-    for i in range(0, len(reviews), BATCH_SIZE):
-        batch_reviews = reviews[i:i+BATCH_SIZE]
-        batch_data = {
-            "reviews": batch_reviews,
-            "restaurant_name": restaurant_name,
-            "batch_index": batch_num,
-            "start_index": i
-        }
-        
-        # Split odd/even for different API keys
-        if batch_num % 2 == 1:
-            odd_batches.append(batch_data)
-        else:
-            even_batches.append(batch_data)
-        batch_num += 1
-    
-    print(f"📦 Created {len(odd_batches)} odd batches (batch1 key) + {len(even_batches)} even batches (batch2 key)")
-    print(f"🚀 Processing ALL batches in PARALLEL across 2 API keys...")
+    batch_results = dispatcher.results()
     
-    # Process odd and even batches in parallel (each uses different key!)
-    odd_results = list(process_batch_odd.map(odd_batches)) if odd_batches else []
-    even_results = list(process_batch_even.map(even_batches)) if even_batches else []
+    print(f"✅ All {len(batch_results)} batches complete in {time.time() - extract_start:.1f}s (after scrape)")
     
-    # Combine results
-    batch_results = odd_results + even_results
+    # Merge results from all batches ([PERF-29] one helper, running weighted sums)
+    food_list = merge_batch_items(batch_results, 'food_items', reviews)
+    drinks_list = merge_batch_items(batch_results, 'drinks', reviews)
+    aspects_list = merge_batch_items(batch_results, 'aspects', reviews)
     
-    print(f"✅ All batches complete in {time.time() - extract_start:.1f}s")
-    
-    # Merge results from all batches
-    all_food_items = {}
-    all_drinks = {}
-    all_aspects = {}
+    print(f"📊 Discovered: {len(food_list)} food + {len(drinks_list)} drinks + {len(aspects_list)} aspects")
     
-    for batch_result in batch_results:
-        if not batch_result.get("success"):
-            continue
-        
-        data = batch_result.get("data", {})
-        
-        # Merge food items
-        for item in data.get('food_items', []):
-            name = item.get('name', '').lower().strip()  # [INS-03] Added strip()
-            if not name:
-                continue
-            if name in all_food_items:
-                all_food_items[name]['mention_count'] += item.get('mention_count', 1)
-                # [INS-05] APPEND related_reviews instead of overwrite
-                all_food_items[name]['related_reviews'].extend(item.get('related_reviews', []))
-                # Weighted average sentiment
-                old_count = all_food_items[name]['mention_count'] - item.get('mention_count', 1)
-                new_count = item.get('mention_count', 1)
-                if old_count + new_count > 0:
-                    old_sent = all_food_items[name]['sentiment']
-                    new_sent = item.get('sentiment', 0)
-                    all_food_items[name]['sentiment'] = (old_sent * old_count + new_sent * new_count) / (old_count + new_count)
-            else:
-                all_food_items[name] = item
-        
-        # Merge drinks
-        for item in data.get('drinks', []):
-            name = item.get('name', '').lower().strip()  # [INS-03] Added strip()
-            if not name:
-                continue
-            if name in all_drinks:
-                all_drinks[name]['mention_count'] += item.get('mention_count', 1)
-                # [INS-05] APPEND related_reviews instead of overwrite
-                all_drinks[name]['related_reviews'].extend(item.get('related_reviews', []))
-                old_count = all_drinks[name]['mention_count'] - item.get('mention_count', 1)
-                new_count = item.get('mention_count', 1)
-                if old_count + new_count > 0:
-                    old_sent = all_drinks[name]['sentiment']
-                    new_sent = item.get('sentiment', 0)
-                    all_drinks[name]['sentiment'] = (old_sent * old_count + new_sent * new_count) / (old_count + new_count)
-            else:
-                all_drinks[name] = item
-        
-        # Merge aspects
-        for aspect in data.get('aspects', []):
-            name = aspect.get('name', '').lower().strip()  # [INS-03] Added strip()
-            if not name:
-                continue
-            if name in all_aspects:
-                all_aspects[name]['mention_count'] += aspect.get('mention_count', 1)
-                # [INS-05] APPEND related_reviews instead of overwrite
-                all_aspects[name]['related_reviews'].extend(aspect.get('related_reviews', []))
-                old_count = all_aspects[name]['mention_count'] - aspect.get('mention_count', 1)
-                new_count = aspect.get('mention_count', 1)
-                if old_count + new_count > 0:
-                    old_sent = all_aspects[name]['sentiment']
-                    new_sent = aspect.get('sentiment', 0)
-                    all_aspects[name]['sentiment'] = (old_sent * old_count + new_sent * new_count) / (old_count + new_count)
-            else:
-                all_aspects[name] = aspect
+    # Build analysis data
+    analysis_data = {
+        "menu_analysis": {
+            "food_items": food_list,
+            "drinks": drinks_list
+        },
+        "aspect_analysis": {
+            "aspects": aspects_list
+        }
+    }
     
-    # Sort by mention count
-    food_list = sorted(all_food_items.values(), key=lambda x: x.get('mention_count', 0), reverse=True)
-    drinks_list = sorted(all_drinks.values(), key=lambda x: x.get('mention_count', 0), reverse=True)
-    aspects_list = sorted(all_aspects.values(), key=lambda x: x.get('mention_count', 0), reverse=True)
+    # Phase 3: PARALLEL insights generation (MULTI-KEY: chef + manager simultaneously!)
+    # [PERF-50] Spawned before Phase 2.5 - insights never read item summaries, so
+    # chef, manager and summaries all run at once on their own keys
+    print("🧠 Phase 3: PARALLEL insights (CHEF-KEY + MANAGER-KEY simultaneously)...")
+    insights_start = time.time()
     
-    print(f"📊 Discovered: {len(food_list)} food + {len(drinks_list)} drinks + {len(aspects_list)} aspects")
+    # Spawn both in parallel - each uses its own API key!
+    # [PERF-38] Both get the same compact context string, built once
+    insights_context = build_insights_context(analysis_data, restaurant_name)
+    chef_future = generate_chef_insights.spawn(insights_context)
+    manager_future = generate_manager_insights.spawn(insights_context)
     
     # Phase 2.5: Generate ALL summaries in ONE API call (uses anthropic-summaries key)
     print("📝 Phase 2.5: Generating summaries (SUMMARIES-KEY)...")
+    report_progress("summarizing", "Writing item and aspect summaries")
     summary_start = time.time()
     
     # [INS-04] Use increased summary counts
-    summaries = generate_all_summaries.remote(
-        food_items=food_list[:SUMMARY_FOOD_COUNT],
-        drinks=drinks_list[:SUMMARY_DRINKS_COUNT],
-        aspects=aspects_list[:SUMMARY_ASPECTS_COUNT],
-        restaurant_name=restaurant_name
-    )
+    summary_items = {
+        "food": food_list[:SUMMARY_FOOD_COUNT],
+        "drinks": drinks_list[:SUMMARY_DRINKS_COUNT],
+        "aspects": aspects_list[:SUMMARY_ASPECTS_COUNT],
+    }
+    
+    # [PERF-32] Reuse earlier summaries for items whose name + sentiment bucket is unchanged
+    cached_summaries = {} if force_refresh else get_cached_summaries(url)
+    summaries: Dict[str, Dict[str, str]] = {}
+    missing: Dict[str, List[Dict[str, Any]]] = {}
+    for category, items in summary_items.items():
+        known = cached_summaries.get(category, {})
+        summaries[category], missing[category] = {}, []
+        for item in items:
+            cached_text = known.get(summary_signature(item))
+            if cached_text:
+                summaries[category][item.get('name', '')] = cached_text
+            else:
+                missing[category].append(item)
+    
+    if any(missing.values()):
+        fresh = generate_all_summaries.remote(
+            food_items=missing["food"],
+            drinks=missing["drinks"],
+            aspects=missing["aspects"],
+            restaurant_name=restaurant_name
+        )
+        for category in summaries:
+            summaries[category].update(fresh.get(category, {}))
+    
+    # [PERF-53] One normalized-name lookup table per category
+    lookups = {category: summary_lookup(found) for category, found in summaries.items()}
+    
+    if any(missing.values()):
+        store_cached_summaries(url, {
+            category: {
+                summary_signature(item): text
+                for item in items
+                if (text := find_summary(item.get('name', ''), lookups[category]))
+            }
+            for category, items in summary_items.items()
+        })
+    else:
+        print("⚡ All summaries cached - skipping summary call")
     
     # [INS-03] Apply summaries with better name matching
-    food_summaries = summaries.get('food', {})
-    drink_summaries = summaries.get('drinks', {})
-    aspect_summaries = summaries.get('aspects', {})
-    
-    # [INS-03] Helper function for flexible name matching
-    def find_summary(name: str, summary_dict: Dict[str, str]) -> str:
-        """Find summary with flexible matching (lowercase, title, strip)."""
-        name_clean = name.lower().strip()
-        name_title = name_clean.title()
-        
-        # Try exact lowercase match
-        if name_clean in summary_dict:
-            return summary_dict[name_clean]
-        # Try title case match
-        if name_title in summary_dict:
-            return summary_dict[name_title]
-        # Try matching any key that starts with same word
-        for key, val in summary_dict.items():
-            if key.lower().strip() == name_clean:
-                return val
-        return ""
+    food_summaries = lookups['food']
+    drink_summaries = lookups['drinks']
+    aspect_summaries = lookups['aspects']
     
     for item in food_list:
         name = item.get('name', '')
@@ -1135,24 +1658,7 @@ def full_analysis_parallel(url: str, max_reviews: int = 100) -> Dict[str, Any]:
     
     print(f"✅ Summaries complete in {time.time() - summary_start:.1f}s")
     
-    # Build analysis data
-    analysis_data = {
-        "menu_analysis": {
-            "food_items": food_list,
-            "drinks": drinks_list
-        },
-        "aspect_analysis": {
-            "aspects": aspects_list
-        }
-    }
-    
-    # Phase 3: PARALLEL insights generation (MULTI-KEY: chef + manager simultaneously!)
-    print("🧠 Phase 3: PARALLEL insights (CHEF-KEY + MANAGER-KEY simultaneously)...")
-    insights_start = time.time()
-    
-    # Spawn both in parallel - each uses its own API key!
-    chef_future = generate_chef_insights.spawn(analysis_data, restaurant_name)
-    manager_future = generate_manager_insights.spawn(analysis_data, restaurant_name)
+    report_progress("insights", "Generating chef and manager insights")
     
     # Wait for both to complete
     chef_result = chef_future.get()
@@ -1190,9 +1696,21 @@ def full_analysis_parallel(url: str, max_reviews: int = 100) -> Dict[str, Any]:
         }
     }
     
-    response_size = len(json.dumps(analysis))
-    print(f"[MODAL] Response size: {response_size / 1024:.1f} KB")
+    # [PERF-19] Serializing the whole payload just to log its size is debug-only
+    if DEBUG:
+        response_size = len(orjson.dumps(analysis)) if orjson is not None else len(json.dumps(analysis))  # [PERF-54]
+        print(f"[MODAL] Response size: {response_size / 1024:.1f} KB")
+    
+    # [PERF-01] Store for identical re-runs
+    try:
+        ANALYSIS_CACHE[cache_key] = analysis
+        if dispatcher.head is not None:
+            ANALYSIS_CACHE[head_cache_key(url)] = dispatcher.head
+    except Exception as e:
+        print(f"⚠️ Could not cache analysis: {e}")
+    store_recent_analysis(url, max_reviews, analysis)
     
+    report_progress("complete", f"Analysis complete in {total_time:.1f}s")
     return analysis
 
 
@@ -1201,7 +1719,7 @@ def full_analysis_parallel(url: str, max_reviews: int = 100) -> Dict[str, Any]:
 # ============================================================================
 
 @app.function(
-    image=image, 
+    image=api_image, 
     secrets=[modal.Secret.from_name("anthropic-batch1")],  # Fallback key
     timeout=2100,  # [API-06] Increased timeout
     memory=1024,   # [INIT-04] Added memory config
@@ -1209,14 +1727,31 @@ def full_analysis_parallel(url: str, max_reviews: int = 100) -> Dict[str, Any]:
 @modal.asgi_app()
 def fastapi_app():
     """Main API - uses parallel processing with multi-key for speed."""
+    import asyncio
     from fastapi import FastAPI, HTTPException
+    import orjson
+    from fastapi.responses import ORJSONResponse, StreamingResponse
     from pydantic import BaseModel
     
-    web_app = FastAPI(title="Restaurant Intelligence API - MULTI-KEY PARALLEL")
+    # [PERF-23] orjson encodes the large analysis payloads (trend_data etc.) much faster
+    web_app = FastAPI(title="Restaurant Intelligence API - MULTI-KEY PARALLEL", default_response_class=ORJSONResponse)
     
     class AnalyzeRequest(BaseModel):
         url: str
         max_reviews: int = 100
+        force_refresh: bool = False  # [PERF-55] Bypass cached analyses
+    
+    class ScrapeBatchRequest(BaseModel):
+        urls: List[str]
+        max_reviews: int = 100
+    
+    class AnalyzeBatchRequest(BaseModel):
+        urls: List[str]
+        max_reviews: int = 100
+    
+    # [PERF-12] (url, max_reviews) -> running FunctionCall, so duplicates join it
+    in_flight: Dict[str, Any] = {}
+    in_flight_lock = asyncio.Lock()
     
     @web_app.get("/")
     async def root():
@@ -1235,9 +1770,120 @@ def fastapi_app():
     
     @web_app.post("/analyze")
     async def analyze(request: AnalyzeRequest):
+        key = f"{request.url.strip()}|{request.max_reviews}|{request.force_refresh}"
+        try:
+            # [PERF-12] Identical concurrent requests share one pipeline run
+            async with in_flight_lock:
+                call = in_flight.get(key)
+                if call is None:
+                    call = await Analyzer().full_analysis.spawn.aio(
+                        url=request.url, max_reviews=request.max_reviews, force_refresh=request.force_refresh
+                    )
+                    in_flight[key] = call
+                else:
+                    print(f"🔁 Joining in-flight analysis for {request.url}")
+            try:
+                return await call.get.aio()
+            finally:
+                async with in_flight_lock:
+                    if in_flight.get(key) is call:
+                        del in_flight[key]
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    # [PERF-11] Non-blocking variant: spawn the pipeline, poll /status or stream /events
+    @web_app.post("/analyze/async")
+    async def analyze_async(request: AnalyzeRequest):
+        try:
+            call = await Analyzer().full_analysis.spawn.aio(
+                url=request.url, max_reviews=request.max_reviews, force_refresh=request.force_refresh
+            )
+            return {"job_id": call.object_id, "status": "running"}
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _job_state(job_id: str) -> Dict[str, Any]:
+        """Return {"status": "done", "result": ...} or {"status": "running", "progress": ...}."""
+        try:
+            call = modal.FunctionCall.from_id(job_id)
+        except Exception:
+            raise HTTPException(status_code=404, detail=f"Unknown job_id: {job_id}")
+        try:
+            result = await call.get.aio(timeout=0)
+            return {"status": "done", "result": result}
+        except (TimeoutError, modal.exception.TimeoutError):
+            progress = await ANALYSIS_PROGRESS.get.aio(job_id)
+            return {"status": "running", "progress": progress}
+        except modal.exception.OutputExpiredError:
+            return {"status": "expired"}
+        except modal.exception.NotFoundError:
+            # from_id() doesn't validate - a mistyped id only fails here
+            raise HTTPException(status_code=404, detail=f"Unknown job_id: {job_id}")
+        except Exception as e:
+            return {"status": "failed", "error": str(e)}
+    
+    @web_app.get("/status/{job_id}")
+    async def status(job_id: str):
+        return await _job_state(job_id)
+    
+    @web_app.get("/events/{job_id}")
+    async def events(job_id: str):
+        """Server-sent events: one 'progress' event per stage change, then 'done'."""
+        first = await _job_state(job_id)  # 404 before the stream starts
+        
+        async def stream():
+            state, last_stage = first, None
+            while True:
+                if state["status"] != "running":
+                    # [PERF-31] Final state carries the full analysis - encode with orjson
+                    yield f"event: {state['status']}\ndata: {orjson.dumps(state).decode()}\n\n"
+                    return
+                progress = state.get("progress") or {}
+                if progress.get("stage") != last_stage:
+                    last_stage = progress.get("stage")
+                    yield f"event: progress\ndata: {orjson.dumps(progress).decode()}\n\n"
+                await asyncio.sleep(2)
+                state = await _job_state(job_id)
+        
+        return StreamingResponse(stream(), media_type="text/event-stream")
+    
+    @web_app.post("/analyze_batch")
+    async def analyze_batch(request: AnalyzeBatchRequest):
+        """[PERF-21] Analyze several restaurants at once - one Analyzer container per URL."""
+        if not request.urls:
+            raise HTTPException(status_code=400, detail="urls must not be empty")
+        if len(request.urls) > ANALYZE_BATCH_MAX_URLS:
+            raise HTTPException(status_code=400, detail=f"At most {ANALYZE_BATCH_MAX_URLS} urls per batch")
+        try:
+            # Outputs arrive in input order, so results[i] belongs to urls[i]
+            results = []
+            async for result in Analyzer().full_analysis.map.aio(
+                request.urls, kwargs={"max_reviews": request.max_reviews}, return_exceptions=True
+            ):
+                url = request.urls[len(results)]
+                if isinstance(result, Exception):
+                    result = {"success": False, "error": str(result)}
+                results.append({"url": url, **result})
+            print(f"✅ Batch analysis complete: {sum(1 for r in results if r.get('success'))}/{len(results)} succeeded")
+            return {"success": True, "results": results}
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    @web_app.post("/scrape_batch")
+    async def scrape_batch(request: ScrapeBatchRequest):
+        """[PERF-03] Scrape multiple restaurants in parallel (reviews only, no analysis)."""
+        if not request.urls:
+            raise HTTPException(status_code=400, detail="urls must not be empty")
         try:
-            result = full_analysis_parallel.remote(url=request.url, max_reviews=request.max_reviews)
-            return result
+            # [PERF-17] Native awaitable - don't block the event loop for the whole batch
+            results = await scrape_restaurant_batch.remote.aio(urls=request.urls, max_reviews=request.max_reviews)
+            return {"success": True, "results": results}
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -1,10 +1,36 @@
 """
 API utility functions with retry logic
 """
+import json
+import random
+import re
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 from anthropic import Anthropic
 
+# ```json / ``` fence lines around a Claude JSON answer (compiled once)
+_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```\s*$', re.MULTILINE)
+
+
+def parse_json_response(text: str) -> Any:
+    """
+    Parse a JSON object/array from a Claude response, handling markdown fences.
+    
+    Bare JSON (the common case) is parsed directly; fences are only stripped
+    when that fails.
+    
+    Raises:
+        json.JSONDecodeError: if the response is not valid JSON
+    """
+    text = text.strip()
+    if text[:1] in ('{', '['):
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+    return json.loads(_FENCE_RE.sub('', text).strip())
+
+
 def call_claude_with_retry(
     client: Anthropic,
     model: str,
@@ -12,11 +38,15 @@ def call_claude_with_retry(
     temperature: float,
     messages: list,
     max_retries: int = 3,
-    initial_delay: float = 2.0
+    initial_delay: float = 2.0,
+    max_delay: float = 30.0
 ) -> Any:
     """
     Call Claude API with exponential backoff retry logic.
     
+    Waits for the server's Retry-After when it sends one; otherwise the
+    exponential delay plus jitter (so parallel callers don't retry in lockstep).
+    
     Args:
         client: Anthropic client
         model: Model name
@@ -25,6 +55,7 @@ def call_claude_with_retry(
         messages: Messages list
         max_retries: Max retry attempts
         initial_delay: Initial delay in seconds
+        max_delay: Cap for any single wait (including Retry-After)
     
     Returns:
         API response
@@ -47,8 +78,12 @@ def call_claude_with_retry(
             # Check if it's a retryable error
             if 'overloaded' in error_str or '529' in error_str or 'rate' in error_str:
                 if attempt < max_retries - 1:
-                    print(f"⚠️  API overloaded, retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(delay)
+                    wait = _retry_after(e)
+                    if wait is None:
+                        wait = min(delay, max_delay) + random.uniform(0, 1)
+                    wait = min(wait, max_delay)
+                    print(f"⚠️  API overloaded, retrying in {wait:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                    time.sleep(wait)
                     delay *= 2  # Exponential backoff
                     continue
                 else:
@@ -59,3 +94,13 @@ def call_claude_with_retry(
                 raise
     
     raise Exception("Max retries exceeded")
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from the error response's Retry-After header, or None."""
+    response = getattr(error, 'response', None)
+    value = response.headers.get('retry-after') if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
@@ -5,9 +5,12 @@ Processes reviews in batches to avoid token limits
 
 from typing import List, Dict, Any, Optional
 from anthropic import Anthropic
+import heapq
 import json
 import os
 
+from src.agent.api_utils import parse_json_response
+
 class AspectDiscovery:
     """
     Discovers customer-care aspects from reviews using AI.
@@ -102,9 +105,8 @@ class AspectDiscovery:
             )
             
             result_text = response.content[0].text
-            result_text = result_text.replace('```json', '').replace('```', '').strip()
             
-            aspects_data = json.loads(result_text)
+            aspects_data = parse_json_response(result_text)
             aspects_data = self._normalize_aspects(aspects_data)
             
             return aspects_data
@@ -188,7 +190,7 @@ class AspectDiscovery:
             import matplotlib.patches as mpatches
             
             aspects = aspects_data.get('aspects', [])
-            aspects_sorted = sorted(aspects, key=lambda x: x.get('mention_count', 0), reverse=True)[:top_n]
+            aspects_sorted = heapq.nlargest(top_n, aspects, key=lambda x: x.get('mention_count', 0))
             
             if not aspects_sorted:
                 return None
@@ -7,6 +7,7 @@ OPTIMIZATIONS:
 2. Batch summary generation (one API call for all items)
 3. Parallel chef/manager insights with asyncio
 4. Removed unnecessary file exports during analysis
+5. Compact JSON in the summary prompt (indent/whitespace cost input tokens)
 """
 
 import os
@@ -85,10 +86,10 @@ def batch_generate_summaries(
 RESTAURANT: {restaurant_name}
 
 MENU ITEMS:
-{json.dumps(food_data, indent=2)}
+{json.dumps(food_data, separators=(',', ':'), ensure_ascii=False)}
 
 SERVICE ASPECTS:
-{json.dumps(aspect_data_list, indent=2)}
+{json.dumps(aspect_data_list, separators=(',', ':'), ensure_ascii=False)}
 
 For each item, write a 2-3 sentence summary that:
 1. Describes what customers specifically said (use details from sample reviews)
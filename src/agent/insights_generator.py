@@ -9,9 +9,12 @@ UPDATED v3:
 """
 
 import json
-import re
 from typing import Any, Dict, Optional
 
+from src.agent.api_utils import parse_json_response
+
+_JSON_DECODER = json.JSONDecoder()
+
 
 class InsightsGenerator:
     """
@@ -80,20 +83,16 @@ class InsightsGenerator:
     
     def _parse_json_response(self, text: str) -> Optional[Dict]:
         """Parse JSON from response, handling markdown fences."""
-        # Remove markdown code fences
-        text = re.sub(r'```json\s*', '', text)
-        text = re.sub(r'```\s*', '', text)
-        text = text.strip()
-        
         try:
-            return json.loads(text)
+            return parse_json_response(text)
         except json.JSONDecodeError:
-            # Try to find JSON object in text
-            match = re.search(r'\{[\s\S]*\}', text)
-            if match:
+            # Try to find JSON object in text: decode from the first '{' and
+            # ignore whatever follows it (no regex scan, no second slice)
+            start = text.find('{')
+            if start >= 0:
                 try:
-                    return json.loads(match.group())
-                except:
+                    return _JSON_DECODER.raw_decode(text, start)[0]
+                except json.JSONDecodeError:
                     pass
             return None
     
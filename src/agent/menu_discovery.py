@@ -14,7 +14,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from src.agent.api_utils import call_claude_with_retry
+from src.agent.api_utils import call_claude_with_retry, parse_json_response
 
 
 class MenuDiscovery:
@@ -118,9 +118,8 @@ class MenuDiscovery:
             )
             
             result_text = response.content[0].text
-            result_text = result_text.replace('```json', '').replace('```', '').strip()
             
-            extracted_data = json.loads(result_text)
+            extracted_data = parse_json_response(result_text)
             extracted_data = self._normalize_items(extracted_data)
             
             return extracted_data
@@ -15,6 +15,8 @@ import json
 from typing import List, Dict, Any, Optional
 from anthropic import Anthropic
 
+from src.agent.api_utils import parse_json_response
+
 
 class AgentPlanner:
     """
@@ -102,11 +104,8 @@ class AgentPlanner:
             # Extract and parse the plan
             plan_text = response.content[0].text
             
-            # Remove markdown code blocks if present
-            plan_text = plan_text.replace('```json', '').replace('```', '').strip()
-            
-            # Parse JSON
-            plan = json.loads(plan_text)
+            # Parse JSON (markdown code blocks removed if present)
+            plan = parse_json_response(plan_text)
             
             return plan
             
@@ -9,6 +9,8 @@ from typing import Dict, List, Any
 from anthropic import Anthropic
 import json
 
+from src.agent.api_utils import parse_json_response
+
 
 class SummaryGenerator:
     """
@@ -138,9 +140,8 @@ class SummaryGenerator:
             )
             
             result_text = response.content[0].text
-            result_text = result_text.replace('```json', '').replace('```', '').strip()
             
-            summaries = json.loads(result_text)
+            summaries = parse_json_response(result_text)
             return summaries.get('summaries', {})
             
         except json.JSONDecodeError as e:
@@ -176,7 +177,8 @@ class SummaryGenerator:
                 'contexts': contexts
             })
         
-        items_json = json.dumps(items_data, indent=2)
+        # Compact: indentation only adds input tokens, Claude reads it either way
+        items_json = json.dumps(items_data, separators=(',', ':'), ensure_ascii=False)
         
         prompt = f"""You are summarizing customer feedback for {restaurant_name}.
 
@@ -18,7 +18,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from src.agent.api_utils import call_claude_with_retry
+from src.agent.api_utils import call_claude_with_retry, parse_json_response
 
 
 class UnifiedReviewAnalyzer:
@@ -162,11 +162,10 @@ class UnifiedReviewAnalyzer:
             )
             
             result_text = response.content[0].text
-            result_text = result_text.replace('```json', '').replace('```', '').strip()
             
             # Parse JSON
             try:
-                data = json.loads(result_text)
+                data = parse_json_response(result_text)
             except json.JSONDecodeError as e:
                 print(f"   ⚠️ JSON parse error: {e}")
                 return {"food_items": [], "drinks": [], "aspects": []}
@@ -3,6 +3,6 @@ Data Processing Module
 """
 
 from .review_processor import process_reviews, save_to_csv
-from .review_cleaner import clean_reviews_for_ai, ReviewCleaner
+from .review_cleaner import clean_reviews_for_ai, ReviewCleaner, DuplicateIndex
 
-__all__ = ['process_reviews', 'save_to_csv', 'clean_reviews_for_ai', 'ReviewCleaner']
\ No newline at end of file
+__all__ = ['process_reviews', 'save_to_csv', 'clean_reviews_for_ai', 'ReviewCleaner', 'DuplicateIndex']
\ No newline at end of file
@@ -8,6 +8,8 @@
 #          | - Added 'removed_duplicates' to stats tracking   |
 #          | - Uses simple word overlap similarity (no deps)  |
 #          | - Threshold: 85% similarity = duplicate          |
+# PERF-30  | DuplicateIndex: exact set + cached word sets,    | DuplicateIndex, clean_reviews()
+#          | size-ratio prune; shareable across batches       | clean_reviews_for_ai(dedup_index=)
 # ============================================================
 # IMPORTANT: All other code is UNCHANGED from original working version
 # ============================================================
@@ -29,7 +31,69 @@ Updated: Nov 2024
 
 import re
 import unicodedata
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Optional
+
+# [PROC-02] Simple stop words (common words that don't help identify duplicates)
+_DUPLICATE_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'was', 'are', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
+    'i', 'we', 'you', 'they', 'it', 'my', 'our', 'your', 'their', 'its',
+    'very', 'really', 'so', 'just', 'also', 'as', 'if', 'when', 'where'
+})
+
+_DUPLICATE_WORD_RE = re.compile(r'\b[a-z]+\b')
+
+
+def duplicate_word_set(text: str) -> frozenset:
+    """Meaningful words of a review (lowercase, no stop words, len > 2)."""
+    return frozenset(
+        w for w in _DUPLICATE_WORD_RE.findall(text.lower())
+        if len(w) > 2 and w not in _DUPLICATE_STOP_WORDS
+    )
+
+
+class DuplicateIndex:
+    """
+    [PERF-30] Kept reviews for duplicate checks: exact-text set + word sets
+    computed once per kept review (not once per comparison).
+    
+    Share one index across several clean_reviews() calls (e.g. streamed
+    batches) to catch near-duplicates across batch boundaries.
+    """
+    
+    def __init__(self, threshold: float = 0.85):
+        self.threshold = threshold
+        self._texts: Set[str] = set()
+        self._word_sets: List[frozenset] = []
+    
+    def match(self, text: str, words: Optional[frozenset] = None) -> Optional[float]:
+        """Similarity of the duplicate `text` matches (1.0 = exact), or None if it is new."""
+        if text in self._texts:
+            return 1.0
+        if words is None:
+            words = duplicate_word_set(text)
+        n = len(words)
+        for existing in self._word_sets:
+            m = len(existing)
+            if not n and not m:
+                return 1.0  # Both empty = same
+            if not n or not m:
+                continue  # One empty = different
+            # Jaccard <= min/max size, so most pairs are skipped without a set op
+            if min(n, m) / max(n, m) < self.threshold:
+                continue
+            intersection = len(words & existing)
+            similarity = intersection / (n + m - intersection)
+            if similarity >= self.threshold:
+                return similarity
+        return None
+    
+    def add(self, text: str, words: Optional[frozenset] = None) -> None:
+        """Remember a kept review."""
+        self._texts.add(text)
+        self._word_sets.append(words if words is not None else duplicate_word_set(text))
 
 
 class ReviewCleaner:
@@ -126,23 +190,7 @@ class ReviewCleaner:
         Extract set of meaningful words from text for comparison.
         Ignores common stop words and very short words.
         """
-        # Simple stop words (common words that don't help identify duplicates)
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'was', 'are', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
-            'i', 'we', 'you', 'they', 'it', 'my', 'our', 'your', 'their', 'its',
-            'very', 'really', 'so', 'just', 'also', 'as', 'if', 'when', 'where'
-        }
-        
-        # Extract words (alphanumeric only, lowercase)
-        words = re.findall(r'\b[a-z]+\b', text.lower())
-        
-        # Filter out stop words and very short words
-        meaningful = {w for w in words if len(w) > 2 and w not in stop_words}
-        
-        return meaningful
+        return set(duplicate_word_set(text))
     
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """
@@ -173,30 +221,25 @@ class ReviewCleaner:
         
         Returns True if text is a duplicate, False otherwise.
         """
-        # Quick exact match check first (fast)
-        if text in existing_reviews:
-            return True
-        
-        # Fuzzy match for near-duplicates
+        index = DuplicateIndex(self.DUPLICATE_SIMILARITY_THRESHOLD)
         for existing in existing_reviews:
-            similarity = self._calculate_similarity(text, existing)
-            if similarity >= self.DUPLICATE_SIMILARITY_THRESHOLD:
-                if self.verbose:
-                    print(f"   🔄 Found duplicate ({similarity:.0%} similar)")
-                return True
-        
-        return False
+            index.add(existing)
+        return index.match(text) is not None
     # =========================================================================
     # END [PROC-02] DUPLICATE DETECTION
     # =========================================================================
     
-    def clean_reviews(self, reviews: List[str]) -> List[str]:
+    def clean_reviews(self, reviews: List[str], dedup_index: Optional[DuplicateIndex] = None) -> List[str]:
         """
         Clean a list of reviews.
         
         FIXED: Only removes truly empty reviews, not short ones.
         [PROC-02] Now also removes duplicate reviews.
+        [PERF-30] Pass a shared dedup_index to also drop duplicates of reviews
+        kept by earlier calls.
         """
+        if dedup_index is None:
+            dedup_index = DuplicateIndex(self.DUPLICATE_SIMILARITY_THRESHOLD)
         self.stats = {
             'total': len(reviews),
             'kept': 0,
@@ -225,13 +268,16 @@ class ReviewCleaner:
                     print(f"   ⚠️  Review {i} too short ({len(cleaned_text)} chars): '{cleaned_text[:50]}'")
                 continue
             
-            # [PROC-02] Check for duplicates
-            if self._is_duplicate(cleaned_text, cleaned):
+            # [PROC-02] Check for duplicates ([PERF-30] word set computed once)
+            words = duplicate_word_set(cleaned_text)
+            similarity = dedup_index.match(cleaned_text, words)
+            if similarity is not None:
                 self.stats['removed_duplicates'] += 1
                 if self.verbose:
-                    print(f"   🔄 Review {i} is a duplicate, skipping")
+                    print(f"   🔄 Review {i} is a duplicate ({similarity:.0%} similar), skipping")
                 continue
             
+            dedup_index.add(cleaned_text, words)
             cleaned.append(cleaned_text)
             self.stats['kept'] += 1
         
@@ -251,15 +297,20 @@ class ReviewCleaner:
         }
 
 
-def clean_reviews_for_ai(reviews: List[str], verbose: bool = True) -> List[str]:
+def clean_reviews_for_ai(
+    reviews: List[str],
+    verbose: bool = True,
+    dedup_index: Optional[DuplicateIndex] = None
+) -> List[str]:
     """
     Convenience function to clean reviews.
     
     FIXED: Better stats reporting, less aggressive cleaning.
     [PROC-02] Now includes duplicate detection.
+    [PERF-30] dedup_index carries kept reviews across calls (streamed batches).
     """
     cleaner = ReviewCleaner(verbose=False)  # Don't spam individual messages
-    cleaned = cleaner.clean_reviews(reviews)
+    cleaned = cleaner.clean_reviews(reviews, dedup_index=dedup_index)
     
     if verbose:
         stats = cleaner.get_cleaning_stats()
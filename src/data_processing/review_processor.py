@@ -12,26 +12,84 @@
 # NEW      | Graceful handling of missing rating fields      | Lines ~50-70
 #          | - Google Maps lacks food/service/ambience       |
 #          | - Fills with 0.0 if missing                     |
+# PERF-13  | Dict/records path (to_dataframe=False), lazy pandas | process_reviews(), parse_rating()
+#          | - DataFrame path keeps pd.to_numeric coercion    |
+#          | - Numbers in labels parsed whole ("10" != "1")   |
+#          | - Modal hot path never imports pandas           |
+# PERF-49  | Exact text-label lookup before substring scan    | parse_rating()
+# PERF-51  | Columns padded lazily (no list + [pad] * n copies) | _safe_get_column(), process_reviews()
 # ============================================================
 # IMPORTANT: All other code is UNCHANGED from original working version
 # ============================================================
 
 """
-Review data processor - Converts scraped JSON to clean pandas DataFrame
+Review data processor - Converts scraped JSON to clean review records / pandas DataFrame
 
 UPDATED: Now supports both OpenTable and Google Maps scrapers
 - Handles NESTED format (new standard)
 - Handles legacy FLAT format (backwards compatible)
 - Graceful handling of missing fields (Google Maps doesn't have sub-ratings)
+- [PERF-13] to_dataframe=False returns plain dicts; pandas is only imported for DataFrames
 """
-import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Union, TYPE_CHECKING
+from itertools import chain, islice, repeat
 from pathlib import Path
+import re
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def process_reviews(scraper_result: Dict[str, Any]) -> pd.DataFrame:
+RATING_COLUMNS = ['overall_rating', 'food_rating', 'service_rating', 'ambience_rating']
+
+# Text ratings some pages show instead of numbers
+_TEXT_RATINGS = {
+    'excellent': 5.0, 'very good': 4.5, 'good': 4.0,
+    'average': 3.0, 'below average': 2.0, 'poor': 1.0, 'terrible': 1.0,
+    '5': 5.0, '4': 4.0, '3': 3.0, '2': 2.0, '1': 1.0,
+}
+
+# First standalone number in a label ("4.5 stars", "Rated 4/5"). Digit labels
+# used to be substring matches, so "10" or "150 reviews" hit '1'.
+_RATING_NUMBER_RE = re.compile(r"(?<![\d.])\d+(?:\.\d+)?(?![\d.])")
+
+
+def parse_rating(val: Any) -> float:
+    """Convert a scraped rating (number, numeric string or text label) to 0-5."""
+    if val is None or val == '' or val != val:  # val != val -> NaN
+        return 0.0
+    
+    try:
+        num = float(val)
+        if 0 <= num <= 5:
+            return num
+    except (ValueError, TypeError):
+        pass
+    
+    val_str = str(val).lower().strip()
+    # [PERF-49] Exact label ("very good") is one dict lookup; also keeps
+    # "below average" from matching "average" first in the scan below
+    num = _TEXT_RATINGS.get(val_str)
+    if num is not None:
+        return num
+    for key, num in _TEXT_RATINGS.items():
+        if not key.isdigit() and key in val_str:
+            return num
+    
+    m = _RATING_NUMBER_RE.search(val_str)
+    if m:
+        num = float(m.group())
+        if 0 <= num <= 5:
+            return num
+    
+    return 0.0
+
+
+def process_reviews(
+    scraper_result: Dict[str, Any],
+    to_dataframe: bool = True
+) -> Union["pd.DataFrame", List[Dict[str, Any]]]:
     """
-    Convert scraper output to clean pandas DataFrame.
+    Convert scraper output to clean review records (or a pandas DataFrame).
     
     Supports multiple input formats:
     1. NESTED format: {'reviews': {'names': [...], 'review_texts': [...], ...}}
@@ -39,10 +97,13 @@ def process_reviews(scraper_result: Dict[str, Any]) -> pd.DataFrame:
     
     Args:
         scraper_result: Output from scrape_opentable() or scrape_google_maps()
+        to_dataframe: Return a DataFrame (default). False returns a list of
+                      dicts and never imports pandas (Modal hot path).
     
     Returns:
-        DataFrame with columns: name, date, overall_rating, food_rating, 
-                               service_rating, ambience_rating, review_text, source
+        DataFrame or records with keys: name, date, overall_rating, food_rating, 
+        service_rating, ambience_rating, review_text, source
+        (DataFrame also gets scrape_timestamp)
     """
     if not scraper_result.get('success', False):
         raise ValueError(f"Scraper failed: {scraper_result.get('error', 'Unknown error')}")
@@ -61,15 +122,15 @@ def process_reviews(scraper_result: Dict[str, Any]) -> pd.DataFrame:
         if n == 0:
             raise ValueError("No reviews found in NESTED format response")
         
-        df = pd.DataFrame({
-            'name': _safe_get_list(reviews_data, 'names', n),
-            'date': _safe_get_list(reviews_data, 'dates', n),
-            'overall_rating': _safe_get_list(reviews_data, 'overall_ratings', n, default=0.0),
-            'food_rating': _safe_get_list(reviews_data, 'food_ratings', n, default=0.0),
-            'service_rating': _safe_get_list(reviews_data, 'service_ratings', n, default=0.0),
-            'ambience_rating': _safe_get_list(reviews_data, 'ambience_ratings', n, default=0.0),
+        columns = {
+            'name': _safe_get_column(reviews_data, 'names', n),
+            'date': _safe_get_column(reviews_data, 'dates', n),
+            'overall_rating': _safe_get_column(reviews_data, 'overall_ratings', n, default=0.0),
+            'food_rating': _safe_get_column(reviews_data, 'food_ratings', n, default=0.0),
+            'service_rating': _safe_get_column(reviews_data, 'service_ratings', n, default=0.0),
+            'ambience_rating': _safe_get_column(reviews_data, 'ambience_ratings', n, default=0.0),
             'review_text': reviews_data.get('review_texts', [])
-        })
+        }
     
     # FORMAT 2: FLAT format (legacy - for backwards compatibility)
     # {'names': [...], 'dates': [...], 'reviews': [...], ...}
@@ -82,84 +143,112 @@ def process_reviews(scraper_result: Dict[str, Any]) -> pd.DataFrame:
         if n == 0:
             raise ValueError("No reviews found in FLAT format response")
         
-        df = pd.DataFrame({
-            'name': _safe_get_list(scraper_result, 'names', n),
-            'date': _safe_get_list(scraper_result, 'dates', n),
-            'overall_rating': _safe_get_list(scraper_result, 'overall_ratings', n, default=0.0),
-            'food_rating': _safe_get_list(scraper_result, 'food_ratings', n, default=0.0),
-            'service_rating': _safe_get_list(scraper_result, 'service_ratings', n, default=0.0),
-            'ambience_rating': _safe_get_list(scraper_result, 'ambience_ratings', n, default=0.0),
+        columns = {
+            'name': _safe_get_column(scraper_result, 'names', n),
+            'date': _safe_get_column(scraper_result, 'dates', n),
+            'overall_rating': _safe_get_column(scraper_result, 'overall_ratings', n, default=0.0),
+            'food_rating': _safe_get_column(scraper_result, 'food_ratings', n, default=0.0),
+            'service_rating': _safe_get_column(scraper_result, 'service_ratings', n, default=0.0),
+            'ambience_rating': _safe_get_column(scraper_result, 'ambience_ratings', n, default=0.0),
             'review_text': review_texts
-        })
+        }
     
     # FORMAT 3: Simple list of reviews (minimal format)
     elif isinstance(reviews_data, list) and len(reviews_data) > 0:
         print("📋 Detected simple list format")
         n = len(reviews_data)
         
-        df = pd.DataFrame({
-            'name': [''] * n,
-            'date': _safe_get_list(scraper_result, 'dates', n),
-            'overall_rating': _safe_get_list(scraper_result, 'overall_ratings', n, default=0.0),
-            'food_rating': [0.0] * n,
-            'service_rating': [0.0] * n,
-            'ambience_rating': [0.0] * n,
+        columns = {
+            'name': repeat('', n),  # [PERF-51]
+            'date': _safe_get_column(scraper_result, 'dates', n),
+            'overall_rating': _safe_get_column(scraper_result, 'overall_ratings', n, default=0.0),
+            'food_rating': repeat(0.0, n),
+            'service_rating': repeat(0.0, n),
+            'ambience_rating': repeat(0.0, n),
             'review_text': reviews_data
-        })
+        }
     
     else:
         raise ValueError(f"Unknown scraper result format. Keys: {list(scraper_result.keys())}")
     
-    print(f"✅ Created DataFrame with {len(df)} reviews")
-    
-    # =========================================================================
-    # Convert ratings to numeric
-    # =========================================================================
-    for col in ['overall_rating', 'food_rating', 'service_rating', 'ambience_rating']:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
-    
-    # =========================================================================
-    # Clean text fields
-    # =========================================================================
-    df['review_text'] = df['review_text'].astype(str).str.strip()
-    df['name'] = df['name'].astype(str).str.strip()
-    
     # =========================================================================
     # Add metadata - DYNAMIC source detection
     # =========================================================================
     metadata = scraper_result.get('metadata', {})
     source = metadata.get('source', scraper_result.get('source', 'unknown'))
     
-    df['source'] = source
-    df['scrape_timestamp'] = pd.Timestamp.now()
+    # =========================================================================
+    # [PERF-13] One pass: numeric ratings + cleaned text fields per record
+    # DataFrame callers keep the original pd.to_numeric coercion (applied below),
+    # so ratings pass through unchanged here
+    # =========================================================================
+    rate = _passthrough if to_dataframe else parse_rating
+    records = [
+        {
+            'name': _clean_str(name),
+            'date': _clean_str(date),
+            'overall_rating': rate(overall),
+            'food_rating': rate(food),
+            'service_rating': rate(service),
+            'ambience_rating': rate(ambience),
+            'review_text': _clean_str(text),
+            'source': source
+        }
+        for name, date, overall, food, service, ambience, text in zip(
+            columns['name'], columns['date'], columns['overall_rating'], columns['food_rating'],
+            columns['service_rating'], columns['ambience_rating'], columns['review_text']
+        )
+    ]
     
+    print(f"✅ Processed {len(records)} reviews")
     print(f"📊 Source: {source}")
     
+    if not to_dataframe:
+        return records
+    
+    import pandas as pd
+    
+    df = pd.DataFrame.from_records(records)
+    
+    # Convert ratings to numeric (unparseable -> 0.0, as before PERF-13)
+    for col in RATING_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
+    
+    df['scrape_timestamp'] = pd.Timestamp.now()
     return df
 
 
-def _safe_get_list(data: Dict, key: str, expected_len: int, default: Any = '') -> List:
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _clean_str(value: Any) -> str:
+    """str() + strip, with None/NaN as empty string."""
+    if value is None or value != value:  # value != value -> NaN
+        return ''
+    return str(value).strip()
+
+
+def _safe_get_column(data: Dict, key: str, expected_len: int, default: Any = '') -> Iterator:
     """
-    Safely get a list from dict, padding with default if too short.
+    Safely get a column from dict as exactly expected_len values, padding with
+    default if too short and truncating if too long.
     
     This handles cases where Google Maps doesn't have certain fields
     that OpenTable has (like food_rating, service_rating, ambience_rating).
+    
+    [PERF-51] Lazy iterator for the zip() in process_reviews - no padded or
+    sliced copy of the list is built.
     """
     values = data.get(key, [])
     
     if not isinstance(values, list):
         values = []
     
-    # Pad with default value if list is too short
-    if len(values) < expected_len:
-        values = values + [default] * (expected_len - len(values))
-    
-    # Truncate if too long
-    return values[:expected_len]
+    return islice(chain(values, repeat(default)), expected_len)
 
 
-def save_to_csv(df: pd.DataFrame, output_path: str = 'data/raw/reviews.csv'):
+def save_to_csv(df: "pd.DataFrame", output_path: str = 'data/raw/reviews.csv'):
     """
     Save DataFrame to CSV.
     
@@ -176,7 +265,7 @@ def save_to_csv(df: pd.DataFrame, output_path: str = 'data/raw/reviews.csv'):
     return output_path
 
 
-def get_review_stats(df: pd.DataFrame) -> Dict[str, Any]:
+def get_review_stats(df: "pd.DataFrame") -> Dict[str, Any]:
     """
     Get statistics about the processed reviews.
     
@@ -6,26 +6,194 @@ Provides both:
 - Direct Python functions (for agent import)
 
 Now with smart keyword-based review filtering for better Q&A!
+TF-IDF ranking is used when scikit-learn is installed (built once per index).
+Semantic (embedding) ranking is used when sentence-transformers is installed.
+Without scikit-learn, keyword overlap is JIT-compiled with Numba when installed
+(optional, not in requirements.txt), otherwise scored through an inverted index.
+Inside Modal (or with REVIEW_INDEX_SHARED=1) indexed reviews are shared via modal.Dict;
+each query checks the shared content hash so replicas never serve a stale copy.
 """
 
 from fastmcp import FastMCP
-from typing import List, Dict, Any
+from collections import Counter, OrderedDict
+import heapq
+from typing import List, Dict, Any, Optional, Tuple
+import hashlib
 import os
+import re
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+try:
+    import numpy as np
+except ImportError:  # Optional - falls back to keyword matching
+    np = None
+
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+except ImportError:  # Optional - falls back to keyword matching
+    TfidfVectorizer = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional - falls back to pure-Python keyword matching
+    njit = None
+    prange = range
+
+try:
+    import modal
+except ImportError:  # Optional - index stays process-local
+    modal = None
+
 load_dotenv()
 
 # Initialize FastMCP server
 mcp = FastMCP("Restaurant Review Query")
 
-# Store reviews in memory (shared across all calls)
-REVIEW_INDEX: Dict[str, List[str]] = {}
+# Store reviews in memory (shared across all calls). With the shared index
+# enabled this is a hot LRU over it, capped at LOCAL_INDEX_MAX_RESTAURANTS.
+REVIEW_INDEX: "OrderedDict[str, List[str]]" = OrderedDict()
+LOCAL_INDEX_MAX_RESTAURANTS = 128
+
+# Cross-replica copy of REVIEW_INDEX (modal.Dict). Used inside Modal containers,
+# or anywhere with REVIEW_INDEX_SHARED=1; derived indexes below stay per process.
+SHARED_INDEX_NAME = "review-index"
+_shared_index = None
+
+# Content hash of each restaurant's shared reviews (small reads, checked per query).
+# A replica whose local copy has another version drops it and its cached answers.
+SHARED_VERSIONS_NAME = "review-index-versions"
+_shared_versions = None
+
+# Version of the reviews each local entry was built from
+REVIEW_VERSION: Dict[str, str] = {}
+
+# Restaurants whose shared write failed: the local copy is the only (and newest)
+# one, so it is never synced away or evicted
+LOCAL_ONLY_KEYS: set = set()
+
+# TF-IDF (vectorizer, sparse matrix) per restaurant, built at index time
+REVIEW_VECTORS: Dict[str, Tuple[Any, Any]] = {}
+
+# L2-normalized float32 review embeddings (N, 384) per restaurant
+REVIEW_EMB: Dict[str, Any] = {}
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Minimum cosine similarity for a review to count as a semantic hit.
+# Question-to-review similarity runs much lower than question-to-question,
+# so this sits well below a semantic-cache threshold (~0.87).
+SEMANTIC_MIN_SIMILARITY = 0.25
+
+# Loaded on first use: importing sentence-transformers pulls in torch, which
+# keyword-only callers (UI, MCP tool import) should not pay for.
+# False = import/load failed, don't retry.
+_embedder = None
+
+# Token ids per restaurant for the Numba keyword scorer:
+# (vocab {token: id}, flat int32 ids, int64 offsets) - review i owns
+# flat[offsets[i]:offsets[i+1]], sorted and unique
+REVIEW_TOKENS: Dict[str, Tuple[Dict[str, int], Any, Any]] = {}
+
+# Inverted index {token: [review ids]} per restaurant (pure-Python fallback when Numba is missing)
+REVIEW_POSTINGS: Dict[str, Dict[str, List[int]]] = {}
+
+# Lowercased review text, computed once at index time (phrase-bonus / substring checks)
+REVIEW_LOWER: Dict[str, List[str]] = {}
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+STOP_WORDS = frozenset({
+    'what', 'how', 'why', 'when', 'where', 'who', 'which',
+    'do', 'does', 'did', 'is', 'are', 'was', 'were', 'been',
+    'about', 'the', 'a', 'an', 'to', 'for', 'of', 'in', 'on', 'at',
+    'say', 'tell', 'me', 'customers', 'customer', 'people', 'guests'
+})
+
+# Answer cache for repeated / paraphrased questions (LRU, exact then semantic)
+ANSWER_CACHE: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+ANSWER_CACHE_MAX_ENTRIES = 1024
+ANSWER_CACHE_SIMILARITY = 0.87
 
 
 # ============ HELPER FUNCTIONS ============
 
-def find_relevant_reviews(reviews: List[str], question: str, max_reviews: int = 20) -> List[str]:
+def get_embedder():
+    """Load the sentence embedding model once per process (None if unavailable)."""
+    global _embedder
+    if _embedder is None:
+        if np is None:
+            _embedder = False
+            return None
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:  # Optional - falls back to TF-IDF / keyword matching
+            _embedder = False
+            return None
+        try:
+            _embedder = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        except Exception as e:
+            print(f"⚠️  Could not load embedding model '{EMBEDDING_MODEL_NAME}': {e}")
+            _embedder = False
+    return _embedder or None
+
+
+def encode_question(question: str) -> Optional[Any]:
+    """L2-normalized float32 embedding of the question (None if no embedder)."""
+    model = get_embedder()
+    if model is None:
+        return None
+    q = model.encode([question], normalize_embeddings=True, convert_to_numpy=True)[0]
+    return q.astype(np.float32)
+
+
+def get_shared_index():
+    """Return the shared modal.Dict review index, or None if not enabled/available."""
+    global _shared_index, _shared_versions
+    if _shared_index is None and modal is not None:
+        enabled = os.getenv("REVIEW_INDEX_SHARED", "").lower() in ("1", "true") or not modal.is_local()
+        if enabled:
+            try:
+                _shared_versions = modal.Dict.from_name(SHARED_VERSIONS_NAME, create_if_missing=True)
+                _shared_index = modal.Dict.from_name(SHARED_INDEX_NAME, create_if_missing=True)
+            except Exception as e:
+                print(f"⚠️  Shared review index unavailable, using local only: {e}")
+                return None
+    return _shared_index
+
+
+def review_version(reviews: List[str]) -> str:
+    """Content hash of a review list (same reviews, same order -> same version)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for review in reviews:
+        digest.update(review.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _sync_with_shared(restaurant_key: str) -> None:
+    """
+    Drop this replica's copy of a restaurant (reviews, ranking structures and
+    cached answers) if the shared index holds another version or none at all.
+    """
+    if restaurant_key not in REVIEW_INDEX or restaurant_key in LOCAL_ONLY_KEYS or get_shared_index() is None:
+        return
+    try:
+        shared_version = _shared_versions.get(restaurant_key)
+    except Exception as e:
+        print(f"⚠️  Could not read shared review version, using local copy: {e}")
+        return
+    if shared_version != REVIEW_VERSION.get(restaurant_key):
+        print(f"Local reviews for '{restaurant_key}' are stale - reloading from shared index")
+        _drop_local(restaurant_key)
+
+
+def find_relevant_reviews(
+    reviews: List[str],
+    question: str,
+    max_reviews: int = 20,
+    reviews_lower: Optional[List[str]] = None
+) -> List[str]:
     """
     Find reviews most likely to contain answer to question.
     Uses simple keyword matching to score reviews.
@@ -34,26 +202,23 @@ def find_relevant_reviews(reviews: List[str], question: str, max_reviews: int =
         reviews: All available reviews
         question: User's question
         max_reviews: Maximum number of reviews to return
+        reviews_lower: Optional precomputed lowercased reviews (same order)
     
     Returns:
         List of most relevant reviews
     """
     # Extract keywords from question (remove common stop words)
     keywords = question.lower().split()
-    stop_words = {
-        'what', 'how', 'why', 'when', 'where', 'who', 'which',
-        'do', 'does', 'did', 'is', 'are', 'was', 'were', 'been',
-        'about', 'the', 'a', 'an', 'to', 'for', 'of', 'in', 'on', 'at',
-        'say', 'tell', 'me', 'customers', 'customer', 'people', 'guests'
-    }
-    keywords = [k.strip('?,!.;:') for k in keywords if k not in stop_words]
+    keywords = [k.strip('?,!.;:') for k in keywords if k not in STOP_WORDS]
     
     print(f"DEBUG find_relevant_reviews: Extracted keywords: {keywords}")
     
     # Score each review based on keyword matches
+    if reviews_lower is None:
+        reviews_lower = [review.lower() for review in reviews]
+    
     scored_reviews = []
-    for review in reviews:
-        review_lower = review.lower()
+    for review, review_lower in zip(reviews, reviews_lower):
         # Count how many keywords appear in this review
         score = sum(1 for keyword in keywords if keyword in review_lower)
         
@@ -66,19 +231,343 @@ def find_relevant_reviews(reviews: List[str], question: str, max_reviews: int =
         if score > 0:
             scored_reviews.append((score, review))
     
-    # Sort by score (highest first)
-    scored_reviews.sort(reverse=True, key=lambda x: x[0])
-    
     print(f"DEBUG find_relevant_reviews: Found {len(scored_reviews)} relevant reviews")
     
     # Return top matches (or all reviews if no matches)
     if scored_reviews:
-        return [review for score, review in scored_reviews[:max_reviews]]
+        # Partial top-k (O(N log k)); ties keep original order like a stable sort
+        top = heapq.nlargest(max_reviews, scored_reviews, key=lambda x: x[0])
+        return [review for score, review in top]
     else:
         print(f"DEBUG find_relevant_reviews: No keyword matches, using first {max_reviews} reviews")
         return reviews[:max_reviews]
 
 
+def _count_token_overlap(flat, offsets, q_ids):
+    """Per review, count query ids present in its sorted token ids."""
+    n = len(offsets) - 1
+    out = np.zeros(n, np.int32)
+    for i in prange(n):
+        row = flat[offsets[i]:offsets[i + 1]]
+        count = 0
+        for q in q_ids:
+            j = np.searchsorted(row, q)
+            if j < len(row) and row[j] == q:
+                count += 1
+        out[i] = count
+    return out
+
+
+if njit is not None:
+    _count_token_overlap = njit(parallel=True, cache=True)(_count_token_overlap)
+
+
+def build_review_tokens(reviews_lower: List[str]) -> Optional[Tuple[Dict[str, int], Any, Any]]:
+    """
+    Map every (lowercased) review to sorted unique token ids once at index time.
+    
+    Stored flat + offsets (CSR style) so Numba gets plain int arrays
+    instead of a list of arrays.
+    
+    Returns:
+        (vocab, flat ids, offsets) or None if Numba/NumPy are unavailable
+    """
+    if njit is None or np is None or not reviews_lower:
+        return None
+    
+    vocab: Dict[str, int] = {}
+    rows = []
+    for review in reviews_lower:
+        ids = {vocab.setdefault(tok, len(vocab)) for tok in _TOKEN_RE.findall(review)}
+        rows.append(sorted(ids))
+    
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(r) for r in rows])
+    flat = np.fromiter((i for r in rows for i in r), dtype=np.int32, count=int(offsets[-1]))
+    
+    return vocab, flat, offsets
+
+
+def rank_reviews_tokens(
+    reviews: List[str],
+    tokens: Tuple[Dict[str, int], Any, Any],
+    question: str,
+    max_reviews: int = 20,
+    reviews_lower: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Rank reviews by how many question keywords they contain (Numba kernel).
+    
+    Args:
+        reviews: Indexed reviews (same order used to build tokens)
+        tokens: (vocab, flat, offsets) from build_review_tokens()
+        question: User's question
+        max_reviews: Maximum number of reviews to return
+        reviews_lower: Optional precomputed lowercased reviews (same order)
+    
+    Returns:
+        List of most relevant reviews, best first
+    """
+    vocab, flat, offsets = tokens
+    keywords = [k for k in _TOKEN_RE.findall(question.lower()) if k not in STOP_WORDS]
+    q_ids = np.array(sorted({vocab[k] for k in keywords if k in vocab}), dtype=np.int32)
+    
+    if len(q_ids) == 0:
+        print(f"DEBUG rank_reviews_tokens: No keyword matches, using first {max_reviews} reviews")
+        return reviews[:max_reviews]
+    
+    scores = _count_token_overlap(flat, offsets, q_ids)
+    
+    # Bonus points for exact phrase match (only reviews containing every keyword can have it)
+    if len(keywords) > 1:
+        phrase = ' '.join(keywords)
+        for i in np.flatnonzero(scores == len(q_ids)):
+            text = reviews_lower[i] if reviews_lower is not None else reviews[i].lower()
+            if phrase in text:
+                scores[i] += 3
+    
+    k = min(max_reviews, len(scores))
+    if k == 0:
+        return []
+    
+    top_idx = np.argpartition(-scores, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
+    
+    print(f"DEBUG rank_reviews_tokens: {int((scores > 0).sum())} reviews share keywords with question")
+    
+    return [reviews[i] for i in top_idx if scores[i] > 0]
+
+
+def build_review_postings(reviews_lower: List[str]) -> Dict[str, List[int]]:
+    """
+    Build an inverted index {token: [review ids]} once at index time.
+    
+    Queries then only touch reviews sharing a keyword instead of scanning all of them.
+    """
+    postings: Dict[str, List[int]] = {}
+    for i, review in enumerate(reviews_lower):
+        for tok in set(_TOKEN_RE.findall(review)):
+            postings.setdefault(tok, []).append(i)
+    return postings
+
+
+def rank_reviews_postings(
+    reviews: List[str],
+    postings: Dict[str, List[int]],
+    question: str,
+    max_reviews: int = 20,
+    reviews_lower: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Rank reviews by keyword overlap using the inverted index.
+    
+    Same scoring as rank_reviews_tokens(), without Numba.
+    
+    Args:
+        reviews: Indexed reviews (same order used to build postings)
+        postings: Output of build_review_postings()
+        question: User's question
+        max_reviews: Maximum number of reviews to return
+        reviews_lower: Optional precomputed lowercased reviews (same order)
+    
+    Returns:
+        List of most relevant reviews, best first
+    """
+    keywords = [k for k in _TOKEN_RE.findall(question.lower()) if k not in STOP_WORDS]
+    q = frozenset(keywords)
+    phrase = ' '.join(keywords) if len(keywords) > 1 else None
+    
+    scores = Counter()
+    for word in q:
+        for i in postings.get(word, ()):
+            scores[i] += 1
+    
+    # Bonus points for exact phrase match (only possible if every keyword is present)
+    if phrase:
+        for i, score in scores.items():
+            if score == len(q) and phrase in (reviews_lower[i] if reviews_lower is not None else reviews[i].lower()):
+                scores[i] += 3
+    
+    print(f"DEBUG rank_reviews_postings: {len(scores)} reviews share keywords with question")
+    
+    if not scores:
+        print(f"DEBUG rank_reviews_postings: No keyword matches, using first {max_reviews} reviews")
+        return reviews[:max_reviews]
+    
+    # Ties keep review order, like a stable sort
+    top = heapq.nlargest(max_reviews, scores.items(), key=lambda x: (x[1], -x[0]))
+    return [reviews[i] for i, _ in top]
+
+
+def build_review_vectors(reviews: List[str]) -> Optional[Tuple[Any, Any]]:
+    """
+    Fit a TF-IDF model over the reviews once so queries only need a sparse dot.
+    
+    Returns:
+        (vectorizer, matrix) or None if scikit-learn is unavailable
+    """
+    if TfidfVectorizer is None or not reviews:
+        return None
+    
+    vectorizer = TfidfVectorizer(lowercase=True, ngram_range=(1, 2), sublinear_tf=True)
+    try:
+        matrix = vectorizer.fit_transform(reviews)
+    except ValueError:
+        # Empty vocabulary (e.g. reviews are all punctuation)
+        return None
+    
+    return vectorizer, matrix
+
+
+def build_review_embeddings(reviews: List[str]) -> Optional[Any]:
+    """
+    Embed every review once at index time.
+    
+    Returns:
+        (N, dim) float32 array of L2-normalized embeddings, or None if unavailable
+    """
+    model = get_embedder()
+    if model is None or not reviews:
+        return None
+    
+    emb = model.encode(reviews, batch_size=64, normalize_embeddings=True, convert_to_numpy=True)
+    return np.ascontiguousarray(emb, dtype=np.float32)
+
+
+def rank_reviews_semantic(
+    reviews: List[str],
+    embeddings: Any,
+    question: str,
+    max_reviews: int = 20,
+    question_embedding: Optional[Any] = None
+) -> List[str]:
+    """
+    Rank reviews by cosine similarity between question and review embeddings.
+    
+    Args:
+        reviews: Indexed reviews (same order used to build embeddings)
+        embeddings: Normalized matrix from build_review_embeddings()
+        question: User's question
+        max_reviews: Maximum number of reviews to return
+        question_embedding: Optional precomputed encode_question(question)
+    
+    Returns:
+        Reviews above SEMANTIC_MIN_SIMILARITY, best first (may be empty)
+    """
+    q = question_embedding if question_embedding is not None else encode_question(question)
+    if q is None:
+        return []
+    
+    scores = embeddings @ q.astype(np.float32)
+    
+    k = min(max_reviews, len(scores))
+    if k == 0:
+        return []
+    
+    top_idx = np.argpartition(-scores, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-scores[top_idx])]
+    
+    hits = [reviews[i] for i in top_idx if scores[i] >= SEMANTIC_MIN_SIMILARITY]
+    print(f"DEBUG rank_reviews_semantic: {len(hits)} reviews above similarity {SEMANTIC_MIN_SIMILARITY}")
+    
+    return hits
+
+
+def rank_reviews_tfidf(
+    reviews: List[str],
+    vectors: Tuple[Any, Any],
+    question: str,
+    max_reviews: int = 20
+) -> List[str]:
+    """
+    Rank reviews by TF-IDF similarity to the question.
+    
+    Args:
+        reviews: Indexed reviews (same order used to build vectors)
+        vectors: (vectorizer, matrix) from build_review_vectors()
+        question: User's question
+        max_reviews: Maximum number of reviews to return
+    
+    Returns:
+        List of most relevant reviews, best first
+    """
+    vectorizer, matrix = vectors
+    q = vectorizer.transform([question])
+    scores = (matrix @ q.T).toarray().ravel()
+    
+    k = min(max_reviews, len(scores))
+    if k == 0 or not scores.any():
+        print(f"DEBUG rank_reviews_tfidf: No TF-IDF matches, using first {max_reviews} reviews")
+        return reviews[:max_reviews]
+    
+    # Partial selection of top-k, then order just those k
+    top_idx = np.argpartition(-scores, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-scores[top_idx])]
+    
+    print(f"DEBUG rank_reviews_tfidf: {int((scores > 0).sum())} reviews share terms with question")
+    
+    return [reviews[i] for i in top_idx if scores[i] > 0]
+
+
+def _normalize_question(question: str) -> str:
+    """Lowercase and collapse whitespace/punctuation at the ends."""
+    return ' '.join(question.lower().split()).strip('?!. ')
+
+
+def get_cached_answer(restaurant_key: str, question: str) -> Tuple[Optional[str], Optional[Any]]:
+    """
+    Look up a previous answer for this restaurant.
+    
+    Exact (normalized) question match first, then the most similar cached
+    question if its cosine similarity is >= ANSWER_CACHE_SIMILARITY.
+    
+    Returns:
+        (answer or None, float32 question embedding or None) - the embedding is
+        returned so a miss can be ranked and stored without re-encoding
+    """
+    key = (restaurant_key, _normalize_question(question))
+    entry = ANSWER_CACHE.get(key)
+    if entry is not None:
+        ANSWER_CACHE.move_to_end(key)
+        return entry['answer'], entry['embedding']
+    
+    q = encode_question(question)
+    if q is None:
+        return None, None
+    
+    candidates = [(k, e) for k, e in ANSWER_CACHE.items() if k[0] == restaurant_key and e['embedding'] is not None]
+    if not candidates:
+        return None, q
+    
+    matrix = np.stack([e['embedding'] for _, e in candidates]).astype(np.float32)
+    sims = matrix @ q
+    best = int(np.argmax(sims))
+    if sims[best] >= ANSWER_CACHE_SIMILARITY:
+        best_key = candidates[best][0]
+        ANSWER_CACHE.move_to_end(best_key)
+        print(f"DEBUG answer cache: semantic hit ({sims[best]:.2f}) on '{best_key[1]}'")
+        return candidates[best][1]['answer'], q
+    
+    return None, q
+
+
+def store_answer(restaurant_key: str, question: str, answer: str, embedding: Optional[Any] = None) -> None:
+    """Cache an answer, evicting the least recently used entry when full."""
+    key = (restaurant_key, _normalize_question(question))
+    if embedding is not None:
+        embedding = embedding.astype(np.float16)  # Half size; plenty for the similarity threshold
+    ANSWER_CACHE[key] = {'answer': answer, 'embedding': embedding}
+    ANSWER_CACHE.move_to_end(key)
+    while len(ANSWER_CACHE) > ANSWER_CACHE_MAX_ENTRIES:
+        ANSWER_CACHE.popitem(last=False)
+
+
+def _invalidate_answers(restaurant_key: str) -> None:
+    """Drop cached answers for a restaurant whose reviews changed."""
+    for key in [k for k in ANSWER_CACHE if k[0] == restaurant_key]:
+        del ANSWER_CACHE[key]
+
+
 # ============ DIRECT PYTHON FUNCTIONS (for agent import) ============
 
 def index_reviews_direct(restaurant_name: str, reviews: List[str]) -> str:
@@ -95,7 +584,19 @@ def index_reviews_direct(restaurant_name: str, reviews: List[str]) -> str:
     # Normalize restaurant name (lowercase, strip whitespace)
     restaurant_key = restaurant_name.strip().lower()
     
-    REVIEW_INDEX[restaurant_key] = reviews
+    _index_locally(restaurant_key, reviews)
+    
+    shared = get_shared_index()
+    if shared is not None:
+        try:
+            # Reviews first, then the version other replicas compare against
+            shared[restaurant_key] = reviews
+            _shared_versions[restaurant_key] = REVIEW_VERSION[restaurant_key]
+            LOCAL_ONLY_KEYS.discard(restaurant_key)
+        except Exception as e:
+            # Keep serving the fresh local copy instead of syncing back to the old shared one
+            LOCAL_ONLY_KEYS.add(restaurant_key)
+            print(f"⚠️  Could not write shared review index, keeping '{restaurant_key}' local-only: {e}")
     
     print(f"✅ Indexed {len(reviews)} reviews for '{restaurant_key}'")
     print(f"   Total restaurants in index: {len(REVIEW_INDEX)}")
@@ -103,6 +604,60 @@ def index_reviews_direct(restaurant_name: str, reviews: List[str]) -> str:
     return f"Indexed {len(reviews)} reviews for {restaurant_name}"
 
 
+def _drop_local(restaurant_key: str) -> None:
+    """Forget a restaurant's local reviews, ranking structures and cached answers."""
+    for store in (REVIEW_INDEX, REVIEW_VERSION, REVIEW_VECTORS, REVIEW_EMB, REVIEW_TOKENS, REVIEW_POSTINGS, REVIEW_LOWER):
+        store.pop(restaurant_key, None)
+    _invalidate_answers(restaurant_key)
+
+
+def _index_locally(restaurant_key: str, reviews: List[str]) -> None:
+    """Store reviews and build this process's ranking structures for them."""
+    # Answers built from whatever reviews this key held before are no longer valid
+    _invalidate_answers(restaurant_key)
+    REVIEW_INDEX[restaurant_key] = reviews
+    REVIEW_INDEX.move_to_end(restaurant_key)
+    REVIEW_VERSION[restaurant_key] = review_version(reviews)
+    
+    # Evict least recently used restaurants only when they can be reloaded from the shared index
+    if get_shared_index() is not None:
+        while len(REVIEW_INDEX) > LOCAL_INDEX_MAX_RESTAURANTS:
+            victim = next(
+                (k for k in REVIEW_INDEX if k not in LOCAL_ONLY_KEYS and k != restaurant_key), None
+            )
+            if victim is None:
+                break
+            _drop_local(victim)
+    vectors = build_review_vectors(reviews)
+    if vectors is not None:
+        REVIEW_VECTORS[restaurant_key] = vectors
+    else:
+        REVIEW_VECTORS.pop(restaurant_key, None)
+    
+    embeddings = build_review_embeddings(reviews)
+    if embeddings is not None:
+        REVIEW_EMB[restaurant_key] = embeddings
+    else:
+        REVIEW_EMB.pop(restaurant_key, None)
+    
+    # Keyword structures are only read when there is no TF-IDF model to rank with
+    if vectors is not None:
+        for store in (REVIEW_TOKENS, REVIEW_POSTINGS, REVIEW_LOWER):
+            store.pop(restaurant_key, None)
+        return
+    
+    reviews_lower = [review.lower() for review in reviews]
+    REVIEW_LOWER[restaurant_key] = reviews_lower
+    
+    tokens = build_review_tokens(reviews_lower)
+    if tokens is not None:
+        REVIEW_TOKENS[restaurant_key] = tokens
+        REVIEW_POSTINGS.pop(restaurant_key, None)
+    else:
+        REVIEW_TOKENS.pop(restaurant_key, None)
+        REVIEW_POSTINGS[restaurant_key] = build_review_postings(reviews_lower)
+
+
 def query_reviews_direct(
     restaurant_name: str,
     question: str,
@@ -128,8 +683,13 @@ def query_reviews_direct(
     print(f"Restaurant: '{restaurant_name}' (key: '{restaurant_key}')")
     print(f"Question: '{question}'")
     
+    # Another replica may have reindexed (or cleared) this restaurant
+    _sync_with_shared(restaurant_key)
+    
     # Try to get reviews
     reviews = REVIEW_INDEX.get(restaurant_key, [])
+    if reviews:
+        REVIEW_INDEX.move_to_end(restaurant_key)
     
     print(f"Reviews in index: {len(reviews)}")
     
@@ -138,16 +698,53 @@ def query_reviews_direct(
         for key in REVIEW_INDEX.keys():
             if key.lower() == restaurant_key:
                 reviews = REVIEW_INDEX[key]
+                restaurant_key = key
                 print(f"Found match with case-insensitive search: '{key}'")
                 break
     
     if not reviews:
-        available = list(REVIEW_INDEX.keys())
+        # Indexed on another replica? Pull from the shared index and build locally
+        shared = get_shared_index()
+        if shared is not None:
+            try:
+                reviews = shared.get(restaurant_key) or []
+            except Exception as e:
+                print(f"⚠️  Could not read shared review index: {e}")
+            if reviews:
+                print(f"Loaded {len(reviews)} reviews from shared index")
+                _index_locally(restaurant_key, reviews)
+    
+    if not reviews:
+        available = get_indexed_restaurants_direct()
         return f"❌ No reviews indexed for '{restaurant_name}'.\n\nAvailable restaurants: {available if available else 'None'}\n\nPlease analyze a restaurant first."
     
-    # Use keyword filtering to find most relevant reviews
+    cached_answer, question_embedding = get_cached_answer(restaurant_key, question)
+    if cached_answer is not None:
+        print("✅ Answer served from cache")
+        print(f"{'='*60}\n")
+        return cached_answer
+    
+    # Semantic ranking first, then TF-IDF, then keyword filtering (Numba if available)
     print(f"Finding relevant reviews from {len(reviews)} total reviews...")
-    review_sample = find_relevant_reviews(reviews, question, max_reviews)
+    review_sample = []
+    embeddings = REVIEW_EMB.get(restaurant_key)
+    if embeddings is not None:
+        # Same question vector the answer-cache lookup encoded
+        review_sample = rank_reviews_semantic(reviews, embeddings, question, max_reviews, question_embedding)
+    
+    if not review_sample:
+        vectors = REVIEW_VECTORS.get(restaurant_key)
+        tokens = REVIEW_TOKENS.get(restaurant_key)
+        postings = REVIEW_POSTINGS.get(restaurant_key)
+        reviews_lower = REVIEW_LOWER.get(restaurant_key)
+        if vectors is not None:
+            review_sample = rank_reviews_tfidf(reviews, vectors, question, max_reviews)
+        elif tokens is not None:
+            review_sample = rank_reviews_tokens(reviews, tokens, question, max_reviews, reviews_lower)
+        elif postings is not None:
+            review_sample = rank_reviews_postings(reviews, postings, question, max_reviews, reviews_lower)
+        else:
+            review_sample = find_relevant_reviews(reviews, question, max_reviews, reviews_lower)
     
     print(f"Selected {len(review_sample)} relevant reviews for analysis")
     
@@ -184,6 +781,7 @@ Answer:"""
         )
         
         answer = response.content[0].text
+        store_answer(restaurant_key, question, answer, question_embedding)
         
         print(f"✅ Answer generated ({len(answer)} characters)")
         print(f"{'='*60}\n")
@@ -203,7 +801,14 @@ def get_indexed_restaurants_direct() -> List[str]:
     Returns:
         List of restaurant names
     """
-    return list(REVIEW_INDEX.keys())
+    names = list(REVIEW_INDEX.keys())
+    shared = get_shared_index()
+    if shared is not None:
+        try:
+            names += [k for k in shared.keys() if k not in REVIEW_INDEX]
+        except Exception as e:
+            print(f"⚠️  Could not list shared review index: {e}")
+    return names
 
 
 def clear_index_direct() -> str:
@@ -215,6 +820,22 @@ def clear_index_direct() -> str:
     """
     count = len(REVIEW_INDEX)
     REVIEW_INDEX.clear()
+    REVIEW_VERSION.clear()
+    LOCAL_ONLY_KEYS.clear()
+    REVIEW_VECTORS.clear()
+    REVIEW_EMB.clear()
+    REVIEW_TOKENS.clear()
+    REVIEW_POSTINGS.clear()
+    REVIEW_LOWER.clear()
+    ANSWER_CACHE.clear()
+    shared = get_shared_index()
+    if shared is not None:
+        try:
+            count = max(count, shared.len())
+            shared.clear()
+            _shared_versions.clear()
+        except Exception as e:
+            print(f"⚠️  Could not clear shared review index: {e}")
     print(f"🗑️  Cleared review index ({count} restaurants removed)")
     return f"Cleared index ({count} restaurants removed)"
 
@@ -0,0 +1,49 @@
+"""
+Shared Modal container image.
+
+Every Modal entry point (modal_backend.py, modal_app.py) imports its images
+from here so they all resolve to the same layer hashes - one image build
+and one warm-container cache instead of one per file.
+
+- image:     Chromium + Selenium + full pipeline deps (Scraper, Analyzer)
+- api_image: no browser - Claude workers, FastAPI and other light functions
+"""
+
+import modal
+
+image = (
+    modal.Image.debian_slim(python_version="3.12")
+    # Keep original - don't pin versions (causes availability issues)
+    .apt_install("chromium", "chromium-driver")
+    .run_commands("ln -sf /usr/bin/chromedriver /usr/local/bin/chromedriver")
+    .run_commands("ln -sf /usr/bin/chromium /usr/local/bin/chromium")
+    .uv_pip_install(
+        "anthropic",
+        "selenium",
+        "beautifulsoup4",
+        "pandas",
+        "python-dotenv",
+        "matplotlib",
+        "fastapi[standard]",
+        "httpx",
+        "fastmcp",
+        "orjson",
+    )
+    # [PERF-07] Build matplotlib's font cache at image build, not on first import per cold start
+    .env({"MPLCONFIGDIR": "/opt/matplotlib"})
+    .run_commands("python -c 'import matplotlib.font_manager'")
+    .add_local_python_source("src")
+)
+
+# Functions that never start a browser: skips the Chromium apt layer and the
+# scraping/plotting wheels (~300 MB less to pull on every cold start)
+api_image = (
+    modal.Image.debian_slim(python_version="3.12")
+    .uv_pip_install(
+        "anthropic",
+        "fastapi[standard]",
+        "httpx",
+        "orjson",
+    )
+    .add_local_python_source("src")
+)
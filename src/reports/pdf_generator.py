@@ -12,6 +12,7 @@ Generates professional PDF reports with:
 
 import os
 import io
+import heapq
 import tempfile
 from datetime import datetime
 from typing import Dict, Any, Optional, List
@@ -167,7 +168,7 @@ def create_sentiment_table(items: List[Dict], title: str, styles, max_items: int
         return elements
     
     # Sort by mentions and take top items
-    sorted_items = sorted(items, key=lambda x: x.get('mention_count', 0), reverse=True)[:max_items]
+    sorted_items = heapq.nlargest(max_items, items, key=lambda x: x.get('mention_count', 0))
     
     # Table header
     data = [['Item', 'Sentiment', 'Mentions', 'Status']]
@@ -387,7 +388,7 @@ def generate_pdf_report(
     
     # Key highlights
     if all_items:
-        top_items = sorted(all_items, key=lambda x: x.get('sentiment', 0), reverse=True)[:3]
+        top_items = heapq.nlargest(3, all_items, key=lambda x: x.get('sentiment', 0))
         if top_items:
             elements.append(Paragraph("🌟 Top Performing Items", styles['SubsectionHeader']))
             for item in top_items:
@@ -0,0 +1,42 @@
+"""
+Review URL and sentiment rules shared by the Modal backend and the Gradio UI.
+
+Kept dependency-free (stdlib only) so the UI can import it without Modal or
+the scraping/pipeline packages installed.
+"""
+
+import re
+
+# Whole-word sentiment keyword sets: one tokenization + set intersection per review.
+# Inflections are listed explicitly; words that merely contain a keyword
+# ("bestow", "scold") don't count.
+SENTIMENT_POSITIVE_WORDS = frozenset({
+    'amazing', 'excellent', 'fantastic', 'great', 'awesome', 'delicious',
+    'perfect', 'outstanding', 'loved', 'beautiful', 'fresh', 'friendly',
+    'best', 'wonderful', 'incredible', 'superb', 'exceptional', 'good',
+    'nice', 'tasty', 'recommend', 'enjoy', 'impressed', 'favorite',
+    'greatest', 'perfectly', 'beautifully', 'freshly', 'nicely',
+    'recommended', 'recommends', 'recommendation', 'recommendations',
+    'enjoyed', 'enjoying', 'enjoyable', 'enjoys', 'favorites'
+})
+SENTIMENT_NEGATIVE_WORDS = frozenset({
+    'terrible', 'horrible', 'awful', 'bad', 'worst', 'disappointing',
+    'poor', 'overpriced', 'slow', 'rude', 'cold', 'bland', 'mediocre',
+    'disgusting', 'inedible', 'undercooked', 'overcooked',
+    'terribly', 'horribly', 'badly', 'poorly', 'slowly', 'rudely'
+})
+
+# Tokenizer for the keyword sets (apply to lowercased text)
+WORD_RE = re.compile(r"[a-z]+")
+
+# One precompiled search instead of lower() + five substring scans
+PLATFORM_RE = re.compile(
+    r"(?P<opentable>opentable)|(?P<google_maps>google\.com/maps|goo\.gl/maps|maps\.google|maps\.app\.goo\.gl)",
+    re.IGNORECASE
+)
+
+
+def detect_platform(url: str) -> str:
+    """Return 'opentable', 'google_maps' or 'unknown' for a review URL."""
+    m = PLATFORM_RE.search(url or "")
+    return m.lastgroup if m else "unknown"
@@ -7,6 +7,10 @@
 # INIT-03  | Enhanced error messages for browser init    | scrape_reviews() (lines ~310-330)
 # NAV-01   | Added _wait_for_page_load() method          | New method (lines ~260-280)
 # NAV-01   | Replaced time.sleep(5) with WebDriverWait   | scrape_reviews() (lines ~340-355)
+# PERF-02  | Added reviews_callback for streaming scrolls | scrape_reviews(), scrape_google_maps()
+# PERF-06  | Optional injected (warm) driver + launch_browser() | __init__, _init_driver(), _cleanup(), launch_browser(), scrape_google_maps()
+# PERF-10  | Precompiled URL regex in _validate_url()    | _GMAPS_URL_RE, _validate_url()
+# PERF-52  | Precompiled star-rating regex               | _STAR_RATING_RE, _extract_rating()
 # ============================================================
 # IMPORTANT: All other code is UNCHANGED from original working version
 # FMT-02 is already NESTED - NO CHANGE NEEDED
@@ -48,6 +52,11 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 import random
 
+# [PERF-10] Compiled once; matches the Google Maps URL forms we accept
+_GMAPS_URL_RE = re.compile(r"google\.com/maps|goo\.gl/maps|maps\.google|maps\.app\.goo\.gl", re.IGNORECASE)
+# [PERF-52] Compiled once; read from each review's aria-label
+_STAR_RATING_RE = re.compile(r'(\d+)\s*star')
+
 
 class GoogleMapsScraper:
     """
@@ -143,10 +152,12 @@ class GoogleMapsScraper:
         ],
     }
     
-    def __init__(self, headless: bool = True, chromedriver_path: Optional[str] = None):
+    def __init__(self, headless: bool = True, chromedriver_path: Optional[str] = None, driver: Optional[Any] = None):
         """Initialize the scraper."""
+        # [PERF-06] A caller-provided driver is reused and never quit by this scraper
+        self._owns_driver = driver is None
         self.headless = headless
-        self.driver = None
+        self.driver = driver
         self.wait = None
         self.chromedriver_path = chromedriver_path or self._find_chromedriver()
     
@@ -175,6 +186,11 @@ class GoogleMapsScraper:
     
     def _init_driver(self):
         """Initialize Chrome WebDriver with anti-detection settings."""
+        if self.driver is not None and not self._owns_driver:
+            # [PERF-06] Warm browser from the caller - skip Chromium startup
+            self.wait = WebDriverWait(self.driver, 20)
+            return
+        
         chrome_options = Options()
         
         if self.headless:
@@ -215,8 +231,8 @@ class GoogleMapsScraper:
         })
     
     def _cleanup(self):
-        """Close browser."""
-        if self.driver:
+        """Close browser (only if this scraper launched it)."""
+        if self.driver and getattr(self, '_owns_driver', True):
             try:
                 self.driver.quit()
             except:
@@ -245,7 +261,7 @@ class GoogleMapsScraper:
                 elem = review_element.find_element(By.XPATH, selector)
                 aria_label = elem.get_attribute('aria-label')
                 if aria_label:
-                    match = re.search(r'(\d+)\s*star', aria_label.lower())
+                    match = _STAR_RATING_RE.search(aria_label.lower())
                     if match:
                         return float(match.group(1))
             except (NoSuchElementException, StaleElementReferenceException):
@@ -494,9 +510,15 @@ class GoogleMapsScraper:
         self,
         url: str,
         max_reviews: Optional[int] = None,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        reviews_callback: Optional[Callable[[List[str]], None]] = None
     ) -> Dict[str, Any]:
-        """Scrape reviews from Google Maps restaurant page."""
+        """
+        Scrape reviews from Google Maps restaurant page.
+        
+        [PERF-02] reviews_callback (optional) receives each scroll's new review
+        texts as soon as they are extracted, so callers can start work early.
+        """
         
         if not self._validate_url(url):
             return {
@@ -599,6 +621,7 @@ class GoogleMapsScraper:
                 )
                 
                 new_reviews_this_scroll = 0
+                scroll_start = len(review_texts)
                 
                 for idx, review_elem in enumerate(review_elements):
                     if max_reviews and len(review_texts) >= max_reviews:
@@ -629,6 +652,9 @@ class GoogleMapsScraper:
                     if idx % 5 == 0:
                         self._random_delay(0.1, 0.3)
                 
+                # [PERF-02] Stream this scroll's reviews to the caller
+                self._emit_reviews(review_texts[scroll_start:], reviews_callback)
+                
                 if new_reviews_this_scroll == 0:
                     no_new_reviews_count += 1
                 else:
@@ -692,15 +718,15 @@ class GoogleMapsScraper:
     
     def _validate_url(self, url: str) -> bool:
         """Validate Google Maps URL."""
-        if not url:
-            return False
-        url_lower = url.lower()
-        return any(x in url_lower for x in [
-            'google.com/maps', 
-            'goo.gl/maps', 
-            'maps.google',
-            'maps.app.goo.gl'
-        ])
+        return bool(url) and _GMAPS_URL_RE.search(url) is not None
+    
+    def _emit_reviews(self, review_texts: List[str], callback: Optional[Callable[[List[str]], None]]):
+        """[PERF-02] Hand newly scraped review texts to the caller (never breaks scraping)."""
+        if callback and review_texts:
+            try:
+                callback(review_texts)
+            except Exception as e:
+                print(f"⚠️ reviews_callback failed: {str(e)}")
     
     def _log_progress(self, message: str, callback: Optional[Callable]):
         """Log progress."""
@@ -712,11 +738,26 @@ class GoogleMapsScraper:
         self._cleanup()
 
 
+def launch_browser(headless: bool = True, chromedriver_path: Optional[str] = None) -> Any:
+    """
+    [PERF-06] Start a Chrome driver with this scraper's settings.
+    
+    Pass it to scrape_google_maps(driver=...) to reuse one browser across calls;
+    the caller is responsible for driver.quit().
+    """
+    scraper = GoogleMapsScraper(headless=headless, chromedriver_path=chromedriver_path)
+    scraper._init_driver()
+    driver, scraper.driver = scraper.driver, None
+    return driver
+
+
 def scrape_google_maps(
     url: str, 
     max_reviews: Optional[int] = None, 
     headless: bool = True,
-    chromedriver_path: Optional[str] = None
+    chromedriver_path: Optional[str] = None,
+    reviews_callback: Optional[Callable[[List[str]], None]] = None,
+    driver: Optional[Any] = None
 ) -> Dict[str, Any]:
     """
     Scrape reviews from Google Maps.
@@ -726,12 +767,14 @@ def scrape_google_maps(
         max_reviews: Maximum number of reviews to scrape (None = all available)
         headless: Run browser in headless mode
         chromedriver_path: Optional path to chromedriver
+        reviews_callback: Optional callable receiving each scroll's new review texts
+        driver: Optional warm WebDriver from launch_browser() (left open afterwards)
     
     Returns:
         Dict with 'success', 'total_reviews', and 'reviews' data in NESTED format
     """
-    scraper = GoogleMapsScraper(headless=headless, chromedriver_path=chromedriver_path)
-    return scraper.scrape_reviews(url, max_reviews=max_reviews)
+    scraper = GoogleMapsScraper(headless=headless, chromedriver_path=chromedriver_path, driver=driver)
+    return scraper.scrape_reviews(url, max_reviews=max_reviews, reviews_callback=reviews_callback)
 
 
 if __name__ == "__main__":
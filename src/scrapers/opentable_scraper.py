@@ -7,6 +7,8 @@
 # INIT-03  | Enhanced error message on browser init fail | scrape_reviews() (line ~165)
 # NAV-01   | WebDriverWait instead of fixed 5s sleep     | scrape_reviews() (lines ~175-185)
 # FMT-01   | Changed return format from FLAT to NESTED   | scrape_reviews() return (lines ~280-300)
+# PERF-02  | Added reviews_callback for streaming pages  | scrape_reviews(), scrape_opentable()
+# PERF-06  | Optional injected (warm) driver + launch_browser() | __init__, _init_driver(), _cleanup(), launch_browser(), scrape_opentable()
 # ============================================================
 # IMPORTANT: All other code is UNCHANGED from original working version
 # ============================================================
@@ -103,10 +105,13 @@ class OpenTableScraper:
     }
     
     # [INIT-01] Added chromedriver_path parameter
-    def __init__(self, headless: bool = True, page_load_strategy: str = 'eager', chromedriver_path: Optional[str] = None):
+    def __init__(self, headless: bool = True, page_load_strategy: str = 'eager', chromedriver_path: Optional[str] = None,
+                 driver: Optional[Any] = None):
+        # [PERF-06] A caller-provided driver is reused and never quit by this scraper
+        self._owns_driver = driver is None
         self.headless = headless
         self.page_load_strategy = page_load_strategy  # KEEP 'eager' - it works!
-        self.driver = None
+        self.driver = driver
         self.wait = None
         # [INIT-01] Use provided path or auto-detect
         self.chromedriver_path = chromedriver_path or self._find_chromedriver()
@@ -139,6 +144,11 @@ class OpenTableScraper:
     
     def _init_driver(self):
         """Initialize Chrome WebDriver with production settings."""
+        if self.driver is not None and not self._owns_driver:
+            # [PERF-06] Warm browser from the caller - skip Chromium startup
+            self.wait = WebDriverWait(self.driver, 10)
+            return
+        
         chrome_options = Options()
         chrome_options.page_load_strategy = self.page_load_strategy  # 'eager' is fast!
         
@@ -163,8 +173,8 @@ class OpenTableScraper:
         self.wait = WebDriverWait(self.driver, 10)
     
     def _cleanup(self):
-        """Close browser."""
-        if self.driver:
+        """Close browser (only if this scraper launched it)."""
+        if self.driver and getattr(self, '_owns_driver', True):
             try:
                 self.driver.quit()
             except:
@@ -175,6 +185,14 @@ class OpenTableScraper:
         """Validate OpenTable URL."""
         return 'opentable.c' in url.lower()
     
+    def _emit_reviews(self, review_texts: List[str], callback: Optional[Callable[[List[str]], None]]):
+        """[PERF-02] Hand newly scraped review texts to the caller (never breaks scraping)."""
+        if callback and review_texts:
+            try:
+                callback(review_texts)
+            except Exception as e:
+                print(f"⚠️  reviews_callback failed: {str(e)}")
+    
     def _log_progress(self, message: str, callback: Optional[Callable]):
         """Log progress."""
         print(message)
@@ -290,9 +308,15 @@ class OpenTableScraper:
         self,
         url: str,
         max_reviews: Optional[int] = None,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        reviews_callback: Optional[Callable[[List[str]], None]] = None
     ) -> Dict[str, Any]:
-        """Scrape reviews from OpenTable restaurant page."""
+        """
+        Scrape reviews from OpenTable restaurant page.
+        
+        [PERF-02] reviews_callback (optional) receives each page's new review
+        texts as soon as they are extracted, so callers can start work early.
+        """
         if not self._validate_url(url):
             return {'success': False, 'error': 'Invalid OpenTable URL', 'reviews': {}}
         
@@ -363,6 +387,7 @@ class OpenTableScraper:
                     break
                 
                 self._log_progress(f"✅ Found {len(review_elements)} review cards", progress_callback)
+                page_start = len(review_texts)
                 
                 # Extract data from each review
                 for idx, review in enumerate(review_elements):
@@ -402,6 +427,9 @@ class OpenTableScraper:
                         self._log_progress(f"⚠️  Error on review {idx + 1}: {str(e)}", progress_callback)
                         continue
                 
+                # [PERF-02] Stream this page's reviews to the caller
+                self._emit_reviews(review_texts[page_start:], reviews_callback)
+                
                 if max_reviews and review_count >= max_reviews:
                     break
                 
@@ -446,12 +474,27 @@ class OpenTableScraper:
         self._cleanup()
 
 
+def launch_browser(headless: bool = True, chromedriver_path: Optional[str] = None) -> Any:
+    """
+    [PERF-06] Start a Chrome driver with this scraper's settings.
+    
+    Pass it to scrape_opentable(driver=...) to reuse one browser across calls;
+    the caller is responsible for driver.quit().
+    """
+    scraper = OpenTableScraper(headless=headless, chromedriver_path=chromedriver_path)
+    scraper._init_driver()
+    driver, scraper.driver = scraper.driver, None
+    return driver
+
+
 # [INIT-01] Updated function signature to accept chromedriver_path
 def scrape_opentable(
     url: str, 
     max_reviews: Optional[int] = None, 
     headless: bool = True,
-    chromedriver_path: Optional[str] = None
+    chromedriver_path: Optional[str] = None,
+    reviews_callback: Optional[Callable[[List[str]], None]] = None,
+    driver: Optional[Any] = None
 ) -> Dict[str, Any]:
     """
     Scrape reviews from OpenTable.
@@ -461,12 +504,14 @@ def scrape_opentable(
         max_reviews: Maximum number of reviews to scrape (None = all available)
         headless: Run browser in headless mode
         chromedriver_path: Optional path to chromedriver (auto-detects if not provided)
+        reviews_callback: Optional callable receiving each page's new review texts
+        driver: Optional warm WebDriver from launch_browser() (left open afterwards)
     
     Returns:
         Dict with 'success', 'total_reviews', and 'reviews' data in NESTED format
     """
-    scraper = OpenTableScraper(headless=headless, chromedriver_path=chromedriver_path)
-    return scraper.scrape_reviews(url, max_reviews=max_reviews)
+    scraper = OpenTableScraper(headless=headless, chromedriver_path=chromedriver_path, driver=driver)
+    return scraper.scrape_reviews(url, max_reviews=max_reviews, reviews_callback=reviews_callback)
 
 
 if __name__ == "__main__":
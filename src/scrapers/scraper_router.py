@@ -9,6 +9,8 @@ Supports:
 from typing import Dict, Any, Optional
 from enum import Enum
 
+from src.review_signals import detect_platform
+
 
 class ScraperType(Enum):
     OPENTABLE = "opentable"
@@ -26,20 +28,8 @@ def detect_scraper_type(url: str) -> ScraperType:
     Returns:
         ScraperType enum value
     """
-    if not url:
-        return ScraperType.UNKNOWN
-    
-    url_lower = url.lower()
-    
-    # OpenTable detection
-    if 'opentable' in url_lower:
-        return ScraperType.OPENTABLE
-    
-    # Google Maps detection
-    if any(x in url_lower for x in ['google.com/maps', 'goo.gl/maps', 'maps.google', 'maps.app.goo.gl']):
-        return ScraperType.GOOGLE_MAPS
-    
-    return ScraperType.UNKNOWN
+    # OpenTable / Google Maps detection in one regex search (shared with backend + UI)
+    return ScraperType(detect_platform(url))
 
 
 def scrape_reviews(url: str, max_reviews: Optional[int] = None, headless: bool = True) -> Dict[str, Any]:
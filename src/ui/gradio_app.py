@@ -21,6 +21,7 @@ VERSION 4.1 UPDATES:
 import gradio as gr
 import os
 import ast
+import heapq
 import re
 import requests
 import smtplib
@@ -31,6 +32,19 @@ from email import encoders
 from typing import Optional, Tuple, List, Dict, Any
 import tempfile
 from datetime import datetime, timedelta
+import sys
+
+# Add project root to path (this file is also run directly as the Space app)
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.review_signals import (
+    SENTIMENT_POSITIVE_WORDS,
+    SENTIMENT_NEGATIVE_WORDS,
+    WORD_RE,
+    detect_platform,
+)
 
 # ============================================================================
 # CONFIGURATION
@@ -49,23 +63,52 @@ SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
 EMAIL_FROM = os.getenv("EMAIL_FROM", "Restaurant Intelligence Agent <noreply@example.com>")
 
 
+# ============================================================================
+# SHARED HTTP CLIENTS
+# ============================================================================
+
+# One pooled client per process - per-request clients redo TCP/TLS handshakes
+# and leak connection pools under load.
+_api_session = None
+_anthropic_http = None
+
+
+def get_api_session():
+    """Shared requests.Session (keep-alive + retries) for the Modal API."""
+    global _api_session
+    if _api_session is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        retries = Retry(
+            total=2,
+            backoff_factor=1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["POST"]
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(max_retries=retries, pool_connections=10, pool_maxsize=100))
+        _api_session = session
+    return _api_session
+
+
+def get_anthropic_http():
+    """Shared httpx.Client for the direct Anthropic HTTP fallback."""
+    global _anthropic_http
+    if _anthropic_http is None:
+        import httpx
+        _anthropic_http = httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0
+        )
+    return _anthropic_http
+
+
 # ============================================================================
 # URL DETECTION
 # ============================================================================
 
-def detect_platform(url: str) -> str:
-    """Detect which platform the URL is from."""
-    if not url:
-        return "unknown"
-    
-    url_lower = url.lower()
-    
-    if 'opentable' in url_lower:
-        return "opentable"
-    elif any(x in url_lower for x in ['google.com/maps', 'goo.gl/maps', 'maps.google', 'maps.app.goo.gl']):
-        return "google_maps"
-    else:
-        return "unknown"
+# detect_platform() is imported from src.review_signals (same rules as the backend)
 
 
 def get_platform_emoji(platform: str) -> str:
@@ -77,6 +120,14 @@ def get_platform_emoji(platform: str) -> str:
 # TREND CHART - Rating vs Sentiment Over Time
 # ============================================================================
 
+# [PERF-56] Relative-date patterns, compiled once (parse_opentable_date runs per trend point)
+_DAYS_AGO_RE = re.compile(r'(\d+)\s*days?\s*ago')
+_WEEKS_AGO_RE = re.compile(r'(\d+)\s*weeks?\s*ago')
+_MONTHS_AGO_RE = re.compile(r'(\d+)\s*months?\s*ago')
+_LEADING_DAYS_RE = re.compile(r'^(\d+)\s*day')
+_LEADING_WEEKS_RE = re.compile(r'^(\d+)\s*week')
+
+
 def parse_opentable_date(date_str: str) -> Optional[datetime]:
     """Parse date formats like 'Dined 1 day ago', '2 weeks ago', etc."""
     if not date_str:
@@ -85,15 +136,15 @@ def parse_opentable_date(date_str: str) -> Optional[datetime]:
     date_str = str(date_str).lower().strip()
     today = datetime.now()
     
-    day_match = re.search(r'(\d+)\s*days?\s*ago', date_str)
+    day_match = _DAYS_AGO_RE.search(date_str)
     if day_match:
         return today - timedelta(days=int(day_match.group(1)))
     
-    week_match = re.search(r'(\d+)\s*weeks?\s*ago', date_str)
+    week_match = _WEEKS_AGO_RE.search(date_str)
     if week_match:
         return today - timedelta(weeks=int(week_match.group(1)))
     
-    month_match = re.search(r'(\d+)\s*months?\s*ago', date_str)
+    month_match = _MONTHS_AGO_RE.search(date_str)
     if month_match:
         return today - timedelta(days=int(month_match.group(1)) * 30)
     
@@ -102,17 +153,21 @@ def parse_opentable_date(date_str: str) -> Optional[datetime]:
     if 'today' in date_str:
         return today
     
-    simple_day = re.search(r'^(\d+)\s*day', date_str)
+    simple_day = _LEADING_DAYS_RE.search(date_str)
     if simple_day:
         return today - timedelta(days=int(simple_day.group(1)))
     
-    simple_week = re.search(r'^(\d+)\s*week', date_str)
+    simple_week = _LEADING_WEEKS_RE.search(date_str)
     if simple_week:
         return today - timedelta(weeks=int(simple_week.group(1)))
     
     return None
 
 
+# SENTIMENT_POSITIVE_WORDS / SENTIMENT_NEGATIVE_WORDS / WORD_RE come from src.review_signals,
+# the same definitions the backend's calculate_sentiment() uses
+
+
 def calculate_review_sentiment(text: str) -> float:
     """
     Simple sentiment calculation from review text.
@@ -124,24 +179,31 @@ def calculate_review_sentiment(text: str) -> float:
     """
     if not text:
         return 0.0
-    text = str(text).lower()
-    
-    positive = ['amazing', 'excellent', 'fantastic', 'great', 'awesome', 'delicious', 
-                'perfect', 'outstanding', 'loved', 'beautiful', 'fresh', 'friendly', 
-                'best', 'wonderful', 'incredible', 'superb', 'exceptional', 'good',
-                'nice', 'tasty', 'recommend', 'enjoy', 'impressed', 'favorite']
-    negative = ['terrible', 'horrible', 'awful', 'bad', 'worst', 'disappointing', 
-                'poor', 'overpriced', 'slow', 'rude', 'cold', 'bland', 'mediocre',
-                'disgusting', 'inedible', 'undercooked', 'overcooked']
+    words = set(WORD_RE.findall(str(text).lower()))
     
-    pos = sum(1 for w in positive if w in text)
-    neg = sum(1 for w in negative if w in text)
+    pos = len(words & SENTIMENT_POSITIVE_WORDS)
+    neg = len(words & SENTIMENT_NEGATIVE_WORDS)
     
     if pos + neg == 0:
         return 0.0
     return (pos - neg) / max(pos + neg, 1)
 
 
+def trend_rows(trend_data) -> List[Dict]:
+    """
+    Normalize backend trend_data to a list of {date, rating, sentiment} dicts.
+    
+    The backend sends it columnar ({"date": [...], "rating": [...], "sentiment": [...]});
+    older/cached responses are already a list of dicts.
+    """
+    if isinstance(trend_data, dict):
+        return [
+            {"date": d, "rating": r, "sentiment": s}
+            for d, r, s in zip(trend_data.get('date', []), trend_data.get('rating', []), trend_data.get('sentiment', []))
+        ]
+    return trend_data or []
+
+
 def generate_trend_chart(trend_data: List[Dict], restaurant_name: str) -> Optional[str]:
     """
     Generate Rating vs Sentiment trend chart.
@@ -484,7 +546,7 @@ def generate_chart(items: list, title: str) -> Optional[str]:
         
         # Sort by mention_count descending, then REVERSE for display
         # (so highest mentions appear at TOP of horizontal bar chart)
-        sorted_items = sorted(items, key=lambda x: x.get('mention_count', 0), reverse=True)[:10]
+        sorted_items = heapq.nlargest(10, items, key=lambda x: x.get('mention_count', 0))
         sorted_items = sorted_items[::-1]  # Reverse so highest is at top
         
         names = [f"{item.get('name', '?')[:18]} ({item.get('mention_count', 0)})" for item in sorted_items]
@@ -545,10 +607,11 @@ def generate_chart(items: list, title: str) -> Optional[str]:
 def extract_restaurant_name(url: str) -> str:
     """Extract restaurant name from URL."""
     try:
-        if 'opentable' in url.lower():
+        platform = detect_platform(url)
+        if platform == "opentable":
             path = url.split('?')[0].rstrip('/')
             return path.split('/')[-1].replace('-', ' ').title()
-        elif 'google' in url.lower():
+        elif platform == "google_maps":
             if '/place/' in url:
                 place = url.split('/place/')[1].split('/')[0]
                 return place.replace('+', ' ').replace('%20', ' ').replace('%26', '&')
@@ -855,7 +918,7 @@ def generate_pdf_report(state: dict) -> Optional[str]:
         
         # Key highlights
         elements.append(Paragraph("Key Highlights", styles['RIASubHeader']))
-        top_items = sorted(all_menu, key=lambda x: x.get('sentiment', 0), reverse=True)[:3]
+        top_items = heapq.nlargest(3, all_menu, key=lambda x: x.get('sentiment', 0))
         if top_items:
             elements.append(Paragraph("✅ <b>Top Performing Items:</b>", styles['RIABody']))
             for item in top_items:
@@ -866,7 +929,7 @@ def generate_pdf_report(state: dict) -> Optional[str]:
         if concern_items:
             elements.append(Spacer(1, 10))
             elements.append(Paragraph("⚠️ <b>Items Needing Attention:</b>", styles['RIABody']))
-            for item in sorted(concern_items, key=lambda x: x.get('sentiment', 0))[:3]:
+            for item in heapq.nsmallest(3, concern_items, key=lambda x: x.get('sentiment', 0)):
                 elements.append(Paragraph(f"    • {item.get('name', '?').title()} (sentiment: {item.get('sentiment', 0):+.2f})", styles['RIABullet']))
         
         elements.append(Spacer(1, 15))
@@ -910,7 +973,7 @@ def generate_pdf_report(state: dict) -> Optional[str]:
             ))
             elements.append(Spacer(1, 10))
             
-            sorted_menu = sorted(all_menu, key=lambda x: x.get('mention_count', 0), reverse=True)[:20]
+            sorted_menu = heapq.nlargest(20, all_menu, key=lambda x: x.get('mention_count', 0))
             menu_data = [['#', 'Item', 'Sentiment', 'Mentions', 'Status']]
             for i, item in enumerate(sorted_menu, 1):
                 sentiment = item.get('sentiment', 0)
@@ -939,7 +1002,7 @@ def generate_pdf_report(state: dict) -> Optional[str]:
         elements.append(HRFlowable(width="100%", thickness=1, color=BORDER, spaceBefore=5, spaceAfter=15))
         
         if aspect_list:
-            sorted_aspects = sorted(aspect_list, key=lambda x: x.get('mention_count', 0), reverse=True)[:20]
+            sorted_aspects = heapq.nlargest(20, aspect_list, key=lambda x: x.get('mention_count', 0))
             aspect_data = [['#', 'Aspect', 'Sentiment', 'Mentions', 'Status']]
             for i, aspect in enumerate(sorted_aspects, 1):
                 sentiment = aspect.get('sentiment', 0)
@@ -1210,6 +1273,35 @@ SERVICE_WORDS = {'service', 'staff', 'waiter', 'server', 'waitress', 'attentive'
 AMBIANCE_WORDS = {'ambiance', 'atmosphere', 'vibe', 'decor', 'noise', 'loud', 'quiet', 'romantic', 'cozy'}
 
 
+def _review_text(r) -> str:
+    """related_reviews entries are dicts ({'review_text': ...}) or plain strings."""
+    return r.get('review_text', str(r)) if isinstance(r, dict) else str(r)
+
+
+def build_qa_index(menu: dict, aspects: dict) -> dict:
+    """
+    Pre-digest menu items and aspects once per analysis for Q&A lookups.
+    
+    Each entry: (lowercased name, first 2 related review texts, sentiment, mention_count).
+    Stored in the analysis state so questions don't re-lowercase/re-extract everything.
+    """
+    def entries(items):
+        return [
+            (
+                item.get('name', '').lower(),
+                [_review_text(r) for r in item.get('related_reviews', [])[:2]],
+                item.get('sentiment', 0),
+                item.get('mention_count', 0)
+            )
+            for item in items
+        ]
+    
+    return {
+        'items': entries(menu.get('food_items', []) + menu.get('drinks', [])),
+        'aspects': entries(aspects.get('aspects', []))
+    }
+
+
 def find_relevant_reviews(question: str, state: dict, top_k: int = 8) -> List[str]:
     """Find relevant reviews for the question using menu/aspect related_reviews."""
     if not state:
@@ -1218,66 +1310,42 @@ def find_relevant_reviews(question: str, state: dict, top_k: int = 8) -> List[st
     q = question.lower()
     q_words = set(q.split())
     
-    menu = state.get('menu_analysis', {})
-    aspects = state.get('aspect_analysis', {})
-    
-    all_items = menu.get('food_items', []) + menu.get('drinks', [])
-    all_aspects = aspects.get('aspects', [])
+    index = state.get('qa_index') or build_qa_index(state.get('menu_analysis', {}), state.get('aspect_analysis', {}))
+    all_items = index['items']
+    all_aspects = index['aspects']
     
     relevant_reviews = []
+    seen = set()
     
-    # Search in menu items
-    for item in all_items:
-        name = item.get('name', '').lower()
-        if name in q or any(w in name for w in q_words):
-            for r in item.get('related_reviews', [])[:2]:
-                text = r.get('review_text', str(r)) if isinstance(r, dict) else str(r)
-                if text not in relevant_reviews and len(text) > 20:
-                    relevant_reviews.append(text)
+    def add(texts, min_len=-1):
+        for text in texts:
+            if text not in seen and len(text) > min_len:
+                seen.add(text)
+                relevant_reviews.append(text)
     
-    # Search in aspects
-    for aspect in all_aspects:
-        name = aspect.get('name', '').lower()
+    # Search in menu items, then aspects
+    for name, texts, _, _ in all_items + all_aspects:
         if name in q or any(w in name for w in q_words):
-            for r in aspect.get('related_reviews', [])[:2]:
-                text = r.get('review_text', str(r)) if isinstance(r, dict) else str(r)
-                if text not in relevant_reviews and len(text) > 20:
-                    relevant_reviews.append(text)
+            add(texts, min_len=20)
     
     # Category-based search
     if q_words & SERVICE_WORDS:
-        for aspect in all_aspects:
-            if any(w in aspect.get('name', '').lower() for w in ['service', 'staff', 'wait']):
-                for r in aspect.get('related_reviews', [])[:2]:
-                    text = r.get('review_text', str(r)) if isinstance(r, dict) else str(r)
-                    if text not in relevant_reviews:
-                        relevant_reviews.append(text)
+        for name, texts, _, _ in all_aspects:
+            if any(w in name for w in ['service', 'staff', 'wait']):
+                add(texts)
     
     if q_words & FOOD_WORDS:
-        sorted_items = sorted(all_items, key=lambda x: x.get('sentiment', 0), reverse=True)
-        for item in sorted_items[:3]:
-            for r in item.get('related_reviews', [])[:2]:
-                text = r.get('review_text', str(r)) if isinstance(r, dict) else str(r)
-                if text not in relevant_reviews:
-                    relevant_reviews.append(text)
+        # Top-k only: heapq.nlargest is O(N log k) and keeps sorted()'s tie order
+        for _, texts, _, _ in heapq.nlargest(3, all_items, key=lambda x: x[2]):
+            add(texts)
     
     # Fallback: if still no reviews, gather from all items/aspects
     if not relevant_reviews:
-        # Collect from top items by mentions
-        sorted_items = sorted(all_items, key=lambda x: x.get('mention_count', 0), reverse=True)
-        for item in sorted_items[:5]:
-            for r in item.get('related_reviews', [])[:2]:
-                text = r.get('review_text', str(r)) if isinstance(r, dict) else str(r)
-                if text and len(text) > 20 and text not in relevant_reviews:
-                    relevant_reviews.append(text)
-        
-        # Also from top aspects
-        sorted_aspects = sorted(all_aspects, key=lambda x: x.get('mention_count', 0), reverse=True)
-        for aspect in sorted_aspects[:5]:
-            for r in aspect.get('related_reviews', [])[:2]:
-                text = r.get('review_text', str(r)) if isinstance(r, dict) else str(r)
-                if text and len(text) > 20 and text not in relevant_reviews:
-                    relevant_reviews.append(text)
+        # Collect from top items by mentions, then top aspects
+        top_items = heapq.nlargest(5, all_items, key=lambda x: x[3])
+        top_aspects = heapq.nlargest(5, all_aspects, key=lambda x: x[3])
+        for _, texts, _, _ in top_items + top_aspects:
+            add([t for t in texts if t], min_len=20)
     
     return relevant_reviews[:top_k]
 
@@ -1330,9 +1398,7 @@ Answer:"""
             print("[RAG] Anthropic SDK proxies error, using HTTP fallback...")
             # Fallback to direct HTTP request
             try:
-                import httpx
-                
-                response = httpx.post(
+                response = get_anthropic_http().post(
                     "https://api.anthropic.com/v1/messages",
                     headers={
                         "Content-Type": "application/json",
@@ -1343,8 +1409,7 @@ Answer:"""
                         "model": "claude-sonnet-4-20250514",
                         "max_tokens": 400,
                         "messages": [{"role": "user", "content": prompt}]
-                    },
-                    timeout=30.0
+                    }
                 )
                 
                 if response.status_code == 200:
@@ -1443,19 +1508,8 @@ def analyze_restaurant(url: str, review_count: int):
         print(f"[ANALYZE] {platform_emoji} Analyzing {restaurant_name} from {platform}...")
         print(f"[ANALYZE] Calling Modal API: {MODAL_API_URL}/analyze")
         
-        # Use a session with retry logic
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-        
-        session = requests.Session()
-        retries = Retry(
-            total=2,
-            backoff_factor=1,
-            status_forcelist=[502, 503, 504],
-            allowed_methods=["POST"]
-        )
-        session.mount("https://", HTTPAdapter(max_retries=retries))
+        # Shared session with retry logic (pooled keep-alive connections)
+        session = get_api_session()
         
         # Make request with streaming disabled for stability
         response = session.post(
@@ -1507,7 +1561,7 @@ def analyze_restaurant(url: str, review_count: int):
         
         # Use slim trend_data (pre-calculated sentiment, no text)
         # Falls back to raw_reviews for backward compatibility
-        trend_data = data.get('trend_data', data.get('raw_reviews', []))
+        trend_data = trend_rows(data.get('trend_data', data.get('raw_reviews', [])))
         
         food_items = menu.get('food_items', [])
         drinks = menu.get('drinks', [])
@@ -1522,7 +1576,8 @@ def analyze_restaurant(url: str, review_count: int):
             "insights": insights,
             "restaurant_name": restaurant_name,
             "trend_data": trend_data,  # Store for PDF if needed
-            "source": platform
+            "source": platform,
+            "qa_index": build_qa_index(menu, aspects)  # Built once, reused by every question
         }
         
         trend_chart = generate_trend_chart(trend_data, restaurant_name)
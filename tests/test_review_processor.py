@@ -0,0 +1,48 @@
+"""Rating parsing in src/data_processing/review_processor.py."""
+
+import pytest
+
+from src.data_processing.review_processor import parse_rating, process_reviews
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (4.5, 4.5),
+    ("3", 3.0),
+    ("Very Good", 4.5),
+    (" below average ", 2.0),
+    ("Rated: excellent!", 5.0),
+    ("4 stars", 4.0),
+    ("4.5 stars", 4.5),
+    ("Rated 4/5", 4.0),
+    ("10", 0.0),            # out of range, and no '1' substring match
+    ("150 reviews", 0.0),
+    (7, 0.0),
+    ("n/a", 0.0),
+    ("", 0.0),
+    (None, 0.0),
+    (float("nan"), 0.0),
+])
+def test_parse_rating(raw, expected):
+    assert parse_rating(raw) == expected
+
+
+def _scraper_result(ratings):
+    return {
+        "success": True,
+        "reviews": {
+            "names": ["a"] * len(ratings),
+            "review_texts": ["text"] * len(ratings),
+            "overall_ratings": ratings,
+        },
+    }
+
+
+def test_records_path_parses_labels():
+    records = process_reviews(_scraper_result(["10", "Very Good", 4]), to_dataframe=False)
+    assert [r["overall_rating"] for r in records] == [0.0, 4.5, 4.0]
+
+
+def test_dataframe_path_keeps_numeric_coercion():
+    pytest.importorskip("pandas")
+    df = process_reviews(_scraper_result(["10", "Very Good", 4]))
+    assert df["overall_rating"].tolist() == [10.0, 0.0, 4.0]